@@ -18,17 +18,36 @@ bl_info = {
 ########################################################################################
 
 
+import atexit  # nopep8
+
 import bpy  # nopep8
 
 
 # Import all modules to jump-start classes' 'bpy_register' decorators
 from . import (  # nopep8
+    allowlist,
+    api,
+    areas,
     catalogue,
+    cli,
+    config,
     draw,
+    events,
+    fanout,
+    hashing,
+    index,
+    mirror,
     ops,
     panels,
+    pool,
+    preload,
     shelf,
     preferences,
+    sandbox,
+    scan,
+    tasks,
+    toolkit,
+    usage,
 )
 
 
@@ -41,24 +60,64 @@ def register():
     """
     Main registration.
     """
-    # Classes registration
+    # Classes registration, shelf panels are registered on demand
     catalogue.Catalogue.bpy_register()
 
+    # Known content hashes, before shelves are hashed; written on exit
+    hashing.load()
+    atexit.register(hashing.save)
+
     # Initialize shelves
     prefs = preferences.Preferences.this()
+    prefs.migrate_shelves()
     prefs.initialize_shelves()
 
     # Remove nonexistent shelves & scripts
     prefs.clean()
 
+    # Register shelf panels for enabled editors only
+    prefs.register_panels()
+
     # Add shelf menu to text editor
     bpy.types.TEXT_HT_header.append(draw.text_editor_shelf_menu)
 
+    # Warm up the most used scripts; runs are written periodically & on exit
+    usage.load()
+    usage.start()
+    atexit.register(usage.flush)
+    preload.start()
+
+    # Keep local mirrors in sync
+    mirror.start()
+
+    # Serve main thread calls of shelf scripts' worker threads
+    toolkit.start()
+
+    # Start background Blender workers for isolated runs, not within background Blender
+    if not bpy.app.background:
+        pool.start()
+
 
 def unregister():
     """
     De-registration.
     """
+    # Stop pool workers, cancel async scripts, stop warming up scripts & syncing mirrors
+    pool.stop()
+    tasks.stop()
+    toolkit.shutdown()
+    sandbox.release()
+    preload.stop()
+    mirror.stop()
+    scan.shutdown()
+    hashing.shutdown()
+
+    # Keep content hashes & pending runs for the next session
+    atexit.unregister(hashing.save)
+    hashing.save()
+    atexit.unregister(usage.flush)
+    usage.stop()
+
     # Remove text editor draw function
     bpy.types.TEXT_HT_header.remove(draw.text_editor_shelf_menu)
 
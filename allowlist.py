@@ -0,0 +1,195 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Any, Dict, List, Set, Tuple
+
+import argparse
+import hashlib
+import hmac
+import json
+import os
+from pathlib import Path
+
+
+# This module must not import bpy or any sibling module, so allowlists can be signed
+# outside of Blender:
+#   python allowlist.py --key /secure/shelves.key --output allowlist.json shelves/*/
+
+
+########################################################################################
+# Statics
+########################################################################################
+
+
+# Version of the allowlist file layout
+ALLOWLIST_VERSION = 1
+
+# Loaded allowlist: file & key paths, modification time & allowed content hashes
+ALLOWLIST: Dict[str, Any] = {
+    "path": "",
+    "key_path": "",
+    "mtime": None,
+    "hashes": set(),
+}
+
+# Verification results, keyed by posix path; each value holds ((size, mtime), allowed)
+VERIFIED: Dict[str, Tuple[Tuple[int, int], bool]] = {}
+
+
+########################################################################################
+# Signing
+########################################################################################
+
+
+def read_key(key_path: str | Path) -> bytes:
+    """
+    Read a signing key file, ignoring surrounding whitespace.
+
+    Parameters:
+        - key_path (str | Path)
+
+    Returns:
+        - bytes: Key
+    """
+    return Path(key_path).read_bytes().strip()
+
+
+def sign(hashes: List[str], key: bytes) -> str:
+    """
+    Generate the signature of a list of content hashes.
+
+    Parameters:
+        - hashes (list of str): Hexadecimal content hashes
+        - key (bytes): Signing key
+
+    Returns:
+        - str: Hexadecimal HMAC-SHA256 signature
+    """
+    message = json.dumps(sorted(hashes), separators=(",", ":")).encode("utf-8")
+    return hmac.new(key, message, hashlib.sha256).hexdigest()
+
+
+def write_allowlist(
+    directories: List[str | Path],
+    filepath: str | Path,
+    key_path: str | Path,
+):
+    """
+    Hash all scripts within several directories and write a signed allowlist.
+
+    Parameters:
+        - directories (list of str | Path)
+        - filepath (str | Path)
+        - key_path (str | Path): Signing key file
+    """
+    hashes = set()
+    for directory in directories:
+        for path in Path(directory).glob("*.py"):
+            if path.is_file():
+                hashes.add(hashlib.blake2b(path.read_bytes()).hexdigest())
+
+    document = {
+        "version": ALLOWLIST_VERSION,
+        "hashes": sorted(hashes),
+        "signature": sign(hashes=list(hashes), key=read_key(key_path=key_path)),
+    }
+    Path(filepath).write_text(json.dumps(document, indent=4), encoding="utf-8")
+
+
+########################################################################################
+# Verification
+########################################################################################
+
+
+def load(filepath: str | Path, key_path: str | Path) -> Set[str]:
+    """
+    Get the allowed content hashes, reading the allowlist only if it or the key path
+    changed. All cached verification results are dropped whenever it is read again.
+
+    Parameters:
+        - filepath (str | Path): Allowlist file
+        - key_path (str | Path): Signing key file
+
+    Returns:
+        - set of str: Allowed hexadecimal content hashes
+
+    Raises:
+        - ValueError: If the allowlist is not validly signed
+    """
+    filepath = Path(filepath).as_posix()
+    key_path = Path(key_path).as_posix()
+    mtime = os.stat(filepath).st_mtime_ns
+    if (
+        ALLOWLIST["path"] == filepath
+        and ALLOWLIST["key_path"] == key_path
+        and ALLOWLIST["mtime"] == mtime
+    ):
+        return ALLOWLIST["hashes"]
+
+    # Read & check the signature
+    document = json.loads(Path(filepath).read_text(encoding="utf-8"))
+    if document.get("version", ALLOWLIST_VERSION) > ALLOWLIST_VERSION:
+        raise ValueError(f"Unsupported allowlist version {document['version']}")
+
+    hashes = document.get("hashes", [])
+    signature = sign(hashes=hashes, key=read_key(key_path=key_path))
+    if not hmac.compare_digest(signature, document.get("signature", "")):
+        raise ValueError(f"Invalid allowlist signature in {filepath}")
+
+    VERIFIED.clear()
+    ALLOWLIST.update(
+        path=filepath,
+        key_path=key_path,
+        mtime=mtime,
+        hashes=set(hashes),
+    )
+
+    return ALLOWLIST["hashes"]
+
+
+def is_allowed(path: str | Path, filepath: str | Path, key_path: str | Path) -> bool:
+    """
+    Check whether a script's content is on the allowlist. The script is only hashed
+    again if its size or modification time changed since its last verification.
+
+    Parameters:
+        - path (str | Path): Script file
+        - filepath (str | Path): Allowlist file
+        - key_path (str | Path): Signing key file
+
+    Returns:
+        - bool: Whether the script may be run
+
+    Raises:
+        - ValueError: If the allowlist is not validly signed
+    """
+    hashes = load(filepath=filepath, key_path=key_path)
+
+    key = Path(path).as_posix()
+    stat = os.stat(key)
+    signature = (stat.st_size, stat.st_mtime_ns)
+
+    # Cache hit
+    cached = VERIFIED.get(key)
+    if cached and cached[0] == signature:
+        return cached[1]
+
+    allowed = hashlib.blake2b(Path(key).read_bytes()).hexdigest() in hashes
+    VERIFIED[key] = (signature, allowed)
+
+    return allowed
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Write a signed Shelf Made allowlist")
+    parser.add_argument("directories", nargs="+", help="Directories of allowed scripts")
+    parser.add_argument("-k", "--key", required=True, help="Signing key file path")
+    parser.add_argument("-o", "--output", required=True, help="Allowlist file path")
+    arguments = parser.parse_args()
+
+    write_allowlist(
+        directories=arguments.directories,
+        filepath=arguments.output,
+        key_path=arguments.key,
+    )
@@ -0,0 +1,429 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Any, Dict, Iterable, Iterator, List
+    from .shelf import Script, Shelf
+
+import os
+from contextlib import contextmanager
+from pathlib import Path
+
+from . import areas, cli, events, fanout, mirror, preferences, tasks, utils
+
+
+########################################################################################
+# Batch
+########################################################################################
+
+
+@contextmanager
+def batch() -> Iterator[preferences.Preferences]:
+    """
+    Collect all shelf changes made within and apply the resulting updates once: a
+    single concurrent re-scan, a single panel registration & a single preference save.
+    If the block raises, shelves are still re-scanned but preferences are not saved.
+    Batches may be nested; updates are applied when the outermost batch ends.
+
+    ### Use as context manager.
+
+    Yields:
+        - Preferences: Add-on preferences
+    """
+    prefs = preferences.Preferences.this()
+    batch_state = utils.BATCH
+    batch_state["depth"] += 1
+    failed = False
+    try:
+        with events.timed(kind="batch"):
+            yield prefs
+
+    except Exception:
+        failed = True
+        raise
+
+    finally:
+        batch_state["depth"] -= 1
+        if not batch_state["depth"]:
+            # Pop pending updates
+            scan = batch_state["scan"]
+            panels = batch_state["panels"]
+            save = batch_state["save"]
+            batch_state.update(save=False, scan=False, panels=False)
+
+            # Apply
+            if scan:
+                prefs.initialize_shelves()
+                mirror.start()
+
+            if panels or scan:
+                prefs.register_panels()
+
+            if save and not failed:
+                utils.save_userpref()
+
+
+########################################################################################
+# Shelves
+########################################################################################
+
+
+def shelf_index(shelf: int | str) -> int:
+    """
+    Find the index of a shelf by index, name or directory.
+
+    Parameters:
+        - shelf (int | str): Shelf index, name or directory
+
+    Returns:
+        - int: Shelf index
+
+    Raises:
+        - KeyError: If no such shelf exists
+    """
+    shelves = preferences.Preferences.this().shelves
+    if isinstance(shelf, int):
+        if -len(shelves) <= shelf < len(shelves):
+            return shelf % len(shelves)
+        raise KeyError(f"No shelf at index {shelf}")
+
+    for i, existing_shelf in enumerate(shelves):
+        if existing_shelf.name == shelf:
+            return i
+
+    directory = Path(shelf).as_posix()
+    for i, existing_shelf in enumerate(shelves):
+        if existing_shelf.directory == directory:
+            return i
+
+    raise KeyError(f"No shelf named {shelf}")
+
+
+def get_shelf(shelf: int | str) -> Shelf:
+    """
+    Find a shelf by index, name or directory.
+
+    Parameters:
+        - shelf (int | str): Shelf index, name or directory
+
+    Returns:
+        - Shelf
+    """
+    return preferences.Preferences.this().shelves[shelf_index(shelf=shelf)]
+
+
+def add_shelf(
+    directory: str | Path,
+    name: str = "",
+    icon: str = "NONE",
+    area_types: Iterable[str] | None = None,
+    **properties,
+) -> Shelf:
+    """
+    Add a new shelf.
+
+    Parameters:
+        - directory (str | Path): Script directory
+        - name (str): Display name, defaults to the directory name
+        - icon (str): Blender icon identifier
+        - area_types (iterable of str | None): 'area.ui_type' of all areas to display
+          the shelf in, defaults to the 3D viewport only
+        - properties: Additional shelf properties, e.g. 'columns' or 'height'
+
+    Returns:
+        - Shelf: New shelf
+    """
+    prefs = preferences.Preferences.this()
+    shelf = prefs.shelves.add()
+    shelf.name = name or Path(directory).name
+    shelf.icon = icon
+    if area_types is not None:
+        set_shelf_areas(shelf=shelf, area_types=area_types)
+
+    for attribute, value in properties.items():
+        setattr(shelf, attribute, value)
+
+    # Set last, triggering the (deferred) scan & save
+    shelf.directory = str(directory)
+
+    if not utils.defer(update="panels"):
+        prefs.register_panels()
+
+    return shelf
+
+
+def remove_shelf(shelf: int | str):
+    """
+    Remove a shelf.
+
+    Parameters:
+        - shelf (int | str): Shelf index, name or directory
+    """
+    prefs = preferences.Preferences.this()
+    prefs.shelves.remove(shelf_index(shelf=shelf))
+
+    if not utils.defer(update="panels"):
+        prefs.register_panels()
+
+    utils.save_userpref()
+
+
+def move_shelf(shelf: int | str, index: int):
+    """
+    Move a shelf to a new position.
+
+    Parameters:
+        - shelf (int | str): Shelf index, name or directory
+        - index (int): New position
+    """
+    shelves = preferences.Preferences.this().shelves
+    index = max(0, min(index, len(shelves) - 1))
+    shelves.move(shelf_index(shelf=shelf), index)
+    utils.save_userpref()
+
+
+def order_shelves(shelves: Iterable[int | str]):
+    """
+    Reorder shelves; the given shelves are placed first, in the given order. All other
+    shelves keep their relative order behind them.
+
+    Parameters:
+        - shelves (iterable of int | str): Shelf indices, names or directories
+    """
+    indices = list(dict.fromkeys(shelf_index(shelf=shelf) for shelf in shelves))
+    utils.reorder_collection(
+        collection=preferences.Preferences.this().shelves,
+        order=indices,
+    )
+    utils.save_userpref()
+
+
+def set_shelf(shelf: int | str, **properties) -> Shelf:
+    """
+    Set any properties of a shelf, e.g. 'name', 'icon', 'columns' or 'directory'.
+
+    Parameters:
+        - shelf (int | str): Shelf index, name or directory
+        - properties: Shelf property names & values
+
+    Returns:
+        - Shelf
+    """
+    shelf = get_shelf(shelf=shelf)
+    for attribute, value in properties.items():
+        setattr(shelf, attribute, value)
+
+    utils.save_userpref()
+
+    return shelf
+
+
+def set_shelf_areas(shelf: int | str | Shelf, area_types: Iterable[str]):
+    """
+    Set all areas a shelf is displayed in at once.
+
+    Parameters:
+        - shelf (int | str | Shelf): Shelf, shelf index, name or directory
+        - area_types (iterable of str): 'area.ui_type' of all areas to display in
+    """
+    if isinstance(shelf, (int, str)):
+        shelf = get_shelf(shelf=shelf)
+
+    visibility = 0
+    for area_type in area_types:
+        if area_type not in areas.AREA_BITS:
+            raise KeyError(f"Unknown area type {area_type}")
+        visibility |= areas.AREA_BITS[area_type]
+
+    shelf.visibility = visibility
+    utils.save_userpref()
+
+
+def set_shelf_icon(shelf: int | str, icon: str):
+    """
+    Set the icon of a shelf.
+
+    Parameters:
+        - shelf (int | str): Shelf index, name or directory
+        - icon (str): Blender icon identifier
+    """
+    set_shelf(shelf=shelf, icon=icon)
+
+
+########################################################################################
+# Scripts
+########################################################################################
+
+
+def get_script(shelf: int | str, script: str) -> Script:
+    """
+    Get the stored customizations of a script by file name. Scripts are only stored
+    once customized, so they are added if necessary; this works before the shelf's
+    scan has run, too.
+
+    Parameters:
+        - shelf (int | str): Shelf index, name or directory
+        - script (str): Script file name
+
+    Returns:
+        - Script
+    """
+    return get_shelf(shelf=shelf).script_override(script=script)
+
+
+def find_script(shelf: int | str, script: str) -> Path:
+    """
+    Find the path a script is run from by file name, file stem or display name.
+
+    Parameters:
+        - shelf (int | str): Shelf index, name or directory
+        - script (str): Script file name, file stem or display name
+
+    Returns:
+        - Path: Script file path, within the local mirror if mirroring is enabled
+
+    Raises:
+        - KeyError: If no such script exists
+    """
+    shelf = get_shelf(shelf=shelf)
+    for file_name, display_name, *_ in shelf.script_entries():
+        if script in {file_name, Path(file_name).stem, display_name}:
+            return shelf.script_path(script=file_name)
+
+    raise KeyError(f"No script named {script}")
+
+
+def set_script(shelf: int | str, script: str, **properties) -> Script:
+    """
+    Set any properties of a script, e.g. 'display_name' or 'icon'.
+
+    Parameters:
+        - shelf (int | str): Shelf index, name or directory
+        - script (str): Script file name
+        - properties: Script property names & values
+
+    Returns:
+        - Script
+    """
+    script = get_script(shelf=shelf, script=script)
+    for attribute, value in properties.items():
+        setattr(script, attribute, value)
+
+    utils.save_userpref()
+
+    return script
+
+
+def set_script_icon(shelf: int | str, script: str, icon: str):
+    """
+    Set the icon of a script.
+
+    Parameters:
+        - shelf (int | str): Shelf index, name or directory
+        - script (str): Script file name
+        - icon (str): Blender icon identifier
+    """
+    set_script(shelf=shelf, script=script, icon=icon)
+
+
+def move_script(shelf: int | str, script: str, index: int):
+    """
+    Move a script to a new position within its shelf.
+
+    Parameters:
+        - shelf (int | str): Shelf index, name or directory
+        - script (str): Script file name
+        - index (int): New position
+    """
+    if not get_shelf(shelf=shelf).move_script(script=script, index=index):
+        raise KeyError(f"No script named {script}")
+
+    utils.save_userpref()
+
+
+def order_scripts(shelf: int | str, scripts: Iterable[str]):
+    """
+    Reorder the scripts of a shelf in one pass; the given scripts are placed first, in
+    the given order. All other scripts keep their relative order behind them.
+
+    Parameters:
+        - shelf (int | str): Shelf index, name or directory
+        - scripts (iterable of str): Script file names
+    """
+    get_shelf(shelf=shelf).order_scripts(file_names=list(scripts))
+    utils.save_userpref()
+
+
+########################################################################################
+# Runs over many files
+########################################################################################
+
+
+def run_files(
+    shelf: int | str,
+    script: str,
+    files: str | Iterable[str],
+    jobs: int = 0,
+    files_per_process: int = 4,
+    save: bool = False,
+) -> List[str]:
+    """
+    Start running a shelf script in many blend files, in a bounded pool of background
+    Blender processes. The script is verified against the allowlist first. Per-file
+    results are collected in the file report.
+
+    Parameters:
+        - shelf (int | str): Shelf index, name or directory
+        - script (str): Script file name, file stem or display name
+        - files (str | iterable of str): Blend files, directories or glob patterns
+        - jobs (int): Maximum amount of Blender processes at once, 0 for one per CPU
+        - files_per_process (int): Files handled by each process
+        - save (bool): Save each file after running the script
+
+    Returns:
+        - list of str: Blend files the script is run in
+
+    Raises:
+        - KeyError: If no such shelf or script exists
+        - PermissionError: If the script is not on the allowlist
+        - RuntimeError: If the script is still running
+        - ValueError: If no existing blend files match
+    """
+    script_path = find_script(shelf=shelf, script=script)
+    if tasks.is_running(path=script_path):
+        raise RuntimeError(f"{script_path.name} is still running")
+
+    blocked = preferences.Preferences.this().verify_script(path=script_path)
+    if blocked:
+        raise PermissionError(blocked)
+
+    patterns = [files] if isinstance(files, (str, Path)) else list(files)
+    blend_files = [
+        blend_file
+        for blend_file in cli.expand_files(
+            patterns=[os.path.expanduser(str(pattern)) for pattern in patterns]
+        )
+        if blend_file.endswith(".blend") and Path(blend_file).is_file()
+    ]
+    if not blend_files:
+        raise ValueError(f"No blend files found in {', '.join(map(str, patterns))}")
+
+    fanout.start(
+        script_path=script_path,
+        files=blend_files,
+        jobs=jobs,
+        files_per_process=files_per_process,
+        save=save,
+    )
+
+    return blend_files
+
+
+def file_report() -> List[Dict[str, Any]]:
+    """
+    Get the per-file results of the last run in many files, as far as finished.
+
+    Returns:
+        - list of dict: 'file', 'duration' in seconds & 'error', if failed
+    """
+    return list(fanout.REPORT["results"])
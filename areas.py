@@ -0,0 +1,84 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Set
+
+
+########################################################################################
+# Statics
+########################################################################################
+
+
+# All areas shelves can be displayed in; each tuple containing
+#   - 'area.ui_type'
+#   - display name
+#   - icon
+#   - space type of the shelf panel
+# Each area's position defines its bit within 'Shelf.visibility', so new areas must
+# only ever be appended.
+AREAS = (
+    ("VIEW_3D", "3D Viewport", "VIEW3D", "VIEW_3D"),
+    ("IMAGE_EDITOR", "Image Editor", "IMAGE", "IMAGE_EDITOR"),
+    ("UV", "UV Editor", "UV", "IMAGE_EDITOR"),
+    ("CompositorNodeTree", "Compositor", "NODE_COMPOSITING", "NODE_EDITOR"),
+    ("TextureNodeTree", "Texture Node Editor", "NODE_TEXTURE", "NODE_EDITOR"),
+    ("GeometryNodeTree", "Geometry Node Editor", "GEOMETRY_NODES", "NODE_EDITOR"),
+    ("ShaderNodeTree", "Shader Editor", "NODE_MATERIAL", "NODE_EDITOR"),
+    ("SEQUENCE_EDITOR", "Video Sequencer", "SEQUENCE", "SEQUENCE_EDITOR"),
+    ("CLIP_EDITOR", "Movie Clip Editor", "TRACKER", "CLIP_EDITOR"),
+    ("DOPESHEET", "Dope Sheet", "ACTION", "DOPESHEET_EDITOR"),
+    ("TIMELINE", "Timeline", "TIME", "DOPESHEET_EDITOR"),
+    ("FCURVES", "Graph Editor", "GRAPH", "GRAPH_EDITOR"),
+    ("DRIVERS", "Drivers", "DRIVER", "GRAPH_EDITOR"),
+    ("NLA_EDITOR", "Nonlinear Animation", "NLA", "NLA_EDITOR"),
+    ("TEXT_EDITOR", "Text Editor", "TEXT", "TEXT_EDITOR"),
+    ("SPREADSHEET", "Spreadsheet", "SPREADSHEET", "SPREADSHEET"),
+)
+
+# Dictionary containing 'area.ui_type' keys and visibility bit values
+AREA_BITS = {area[0]: 1 << i for i, area in enumerate(AREAS)}
+
+# Dictionary containing 'area.ui_type' keys and area icon values
+AREA_ICONS = {area[0]: area[2] for area in AREAS}
+
+# Dictionary containing 'area.ui_type' keys and shelf panel space type values
+AREA_SPACE_TYPES = {area[0]: area[3] for area in AREAS}
+
+# Visibility bits of all areas combined
+ALL_AREAS = (1 << len(AREAS)) - 1
+
+
+########################################################################################
+# Utilities
+########################################################################################
+
+
+def attribute_name(area_type: str) -> str:
+    """
+    Generate the name of the shelf property toggling the visibility in an area.
+
+    Parameters:
+        - area_type (str): 'area.ui_type'
+
+    Returns:
+        - str: Property name
+    """
+    return f"enabled_{area_type.lower()}"
+
+
+def space_types(visibility: int) -> Set[str]:
+    """
+    Get the shelf panel space types needed to display the given areas.
+
+    Parameters:
+        - visibility (int): Visibility bits
+
+    Returns:
+        - set of str: Space types
+    """
+    return {
+        AREA_SPACE_TYPES[area_type]
+        for area_type, bit in AREA_BITS.items()
+        if visibility & bit
+    }
@@ -1,5 +1,7 @@
 import bpy
-from typing import List, Union, TypeVar
+from typing import Callable, Dict, List, Set, Union, TypeVar
+
+from . import events
 
 
 T = TypeVar("T")
@@ -38,6 +40,30 @@ def bpy_register(cls: T) -> T:
     return cls
 
 
+def bpy_register_lazy(group: str) -> Callable[[T], T]:
+    """
+    Add an object to the global catalogue to mark for on-demand registration with bpy.
+    Lazy classes are only registered once their group is requested.
+
+    ### Use as decorator.
+
+    Parameters:
+        - group (str): Name of the group the class is registered with
+
+    Returns:
+        - callable: Decorator returning the unchanged object
+    """
+
+    def decorator(cls: T) -> T:
+        classes = Catalogue.bpy_lazy_classes.setdefault(group, [])
+        if cls not in classes:
+            classes.append(cls)
+
+        return cls
+
+    return decorator
+
+
 ########################################################################################
 # Catalogue class
 ########################################################################################
@@ -48,20 +74,56 @@ class Catalogue:
 
     # Initialization lists
     bpy_register_classes: List[BPY_REGISTER_TYPE] = []
+    bpy_lazy_classes: Dict[str, List[BPY_REGISTER_TYPE]] = {}
+    bpy_registered_groups: Set[str] = set()
 
     # Initialization methods
     @classmethod
     def bpy_register(cls):
         """
-        Loop through all collected classes and register them with bpy.
+        Loop through all collected classes and register them with bpy. Lazy classes are
+        left for 'bpy_sync_groups'.
         """
-        for bpy_cls in cls.bpy_register_classes:
-            bpy.utils.register_class(bpy_cls)
+        with events.timed(kind="register", classes=len(cls.bpy_register_classes)):
+            for bpy_cls in cls.bpy_register_classes:
+                bpy.utils.register_class(bpy_cls)
 
     @classmethod
     def bpy_deregister(cls):
         """
-        Loop through all collected classes and deregister them with bpy.
+        Loop through all collected classes, including registered lazy ones, and
+        deregister them with bpy.
         """
+        cls.bpy_sync_groups(groups=set())
+
         for bpy_cls in reversed(cls.bpy_register_classes):
             bpy.utils.unregister_class(bpy_cls)
+
+    @classmethod
+    def bpy_sync_groups(cls, groups: Set[str]):
+        """
+        Register the lazy classes of all requested groups and deregister the classes of
+        all other groups. Groups that are already in the requested state are skipped.
+
+        Parameters:
+            - groups (set of str): Names of the groups to be registered
+        """
+        added = groups.intersection(cls.bpy_lazy_classes) - cls.bpy_registered_groups
+        removed = cls.bpy_registered_groups - groups
+        if not added and not removed:
+            return
+
+        with events.timed(
+            kind="register_groups",
+            added=sorted(added),
+            removed=sorted(removed),
+        ):
+            for group in removed:
+                for bpy_cls in reversed(cls.bpy_lazy_classes[group]):
+                    bpy.utils.unregister_class(bpy_cls)
+                cls.bpy_registered_groups.remove(group)
+
+            for group in added:
+                for bpy_cls in cls.bpy_lazy_classes[group]:
+                    bpy.utils.register_class(bpy_cls)
+                cls.bpy_registered_groups.add(group)
@@ -0,0 +1,559 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from types import ModuleType
+    from typing import Any, Dict, Iterator, List, Set
+
+import argparse
+import glob
+import importlib
+import json
+import os
+import subprocess
+import sys
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+
+
+# This module must not import bpy or any sibling module at module level. Run by Python,
+# it fans blend files out over background Blender processes, each running this module
+# again to open its files one by one & run a shelf script in them:
+#   python cli.py --shelf Modeling --script cleanup.py --save --jobs 8 shots/*.blend
+# Run by Blender directly, it runs the script in the open file or the given files:
+#   blender -b shot.blend --python cli.py -- --shelf Modeling --script cleanup.py
+# Shelves & scripts are found by name in the saved add-on preferences, or in an
+# exported configuration file given with '--config'; '--path' runs a script file as is.
+
+
+########################################################################################
+# Statics
+########################################################################################
+
+
+# Prefix of per-file results printed by Blender, telling them apart from other output
+RESULT_PREFIX = "shelfmade-cli:"
+
+# Lines of a Blender process' output to report if it ends without results
+ERROR_LINES = 20
+
+
+########################################################################################
+# Script lookup
+########################################################################################
+
+
+def config_script(config_path: str | Path, shelf: str, script: str) -> Path:
+    """
+    Find a script within an exported configuration file by shelf name or directory and
+    script file name, file stem or display name.
+
+    Parameters:
+        - config_path (str | Path): JSON or TOML configuration file
+        - shelf (str): Shelf name or directory
+        - script (str): Script file name, file stem or display name
+
+    Returns:
+        - Path: Script file path
+
+    Raises:
+        - KeyError: If no such shelf or script exists
+    """
+    path = Path(config_path)
+    if path.suffix.lower() == ".toml":
+        import tomllib
+
+        config = tomllib.loads(path.read_text(encoding="utf-8"))
+    else:
+        config = json.loads(path.read_text(encoding="utf-8"))
+
+    for shelf_config in config.get("shelves", []):
+        directory = Path(shelf_config["directory"])
+        if shelf not in {shelf_config.get("name"), directory.as_posix()}:
+            continue
+
+        display_names = {
+            script_config.get("display_name"): script_config["name"]
+            for script_config in shelf_config.get("scripts", [])
+        }
+        file_name = display_names.get(script, script)
+        for script_path in (directory / file_name, directory / f"{file_name}.py"):
+            if script_path.is_file():
+                return script_path
+
+        raise KeyError(f"No script named {script} in {directory}")
+
+    raise KeyError(f"No shelf named {shelf} in {path}")
+
+
+def import_addon() -> ModuleType:
+    """
+    Import this add-on as package within Blender, without registering it.
+
+    Returns:
+        - module: Add-on package
+    """
+    package = Path(__file__).resolve().parent
+    if str(package.parent) not in sys.path:
+        sys.path.append(str(package.parent))
+
+    return importlib.import_module(package.name)
+
+
+########################################################################################
+# Blender process
+########################################################################################
+
+
+def allowed_hashes(addon: ModuleType, arguments: argparse.Namespace) -> Set[str] | None:
+    """
+    Get the content hashes scripts are verified against: those of the allowlist given
+    on the command line, else of the allowlist set in the add-on preferences, if the
+    add-on is enabled in this Blender.
+
+    Parameters:
+        - addon (module): Add-on package
+        - arguments (Namespace): Parsed command line arguments
+
+    Returns:
+        - set of str | None: Allowed content hashes, None if all scripts may run
+
+    Raises:
+        - OSError: If the allowlist or its key cannot be read
+        - ValueError: If the allowlist is not validly signed
+    """
+    if arguments.allowlist:
+        return addon.allowlist.load(
+            filepath=arguments.allowlist,
+            key_path=arguments.allowlist_key,
+        )
+
+    try:
+        prefs = addon.preferences.Preferences.this()
+    except KeyError:
+        return None
+
+    return prefs.allowed_hashes()
+
+
+def run_script(addon: ModuleType, script_path: Path, allowed: Set[str] | None):
+    """
+    Run a shelf script to completion within Blender. Stepped scripts, scripts processing
+    the selected objects & async scripts are driven right away, as background Blender
+    has no UI events or timers to continue them.
+
+    Parameters:
+        - addon (module): Add-on package
+        - script_path (Path)
+        - allowed (set of str | None): Allowed content hashes, None to allow all
+    """
+    import bpy
+
+    namespace = addon.runner.run_script(path=script_path, allowed=allowed)
+    if callable(namespace.get(addon.runner.INVOKE_FUNCTION)):
+        print(
+            f"Warning: {script_path.name} defines invoke, it needs the UI & is skipped"
+        )
+
+    # Async scripts
+    addon.tasks.wait(path=script_path)
+
+    # Stepped scripts & object processing
+    steps = addon.runner.main_steps(namespace=namespace)
+    if steps is None:
+        names = [
+            obj.name for obj in getattr(bpy.context, "selected_objects", None) or []
+        ]
+        steps = addon.runner.process_steps(
+            namespace=namespace,
+            names=names,
+            chunk_size=len(names),
+        )
+        if steps is not None and not names:
+            print(f"Warning: {script_path.name} processes selected objects, none are")
+
+    for _ in steps or []:
+        pass
+
+
+def run_files(arguments: argparse.Namespace) -> int:
+    """
+    Run a shelf script in each given blend file, or the open one, within Blender. The
+    script is verified against the allowlist & compiled once through the add-on's code
+    cache, then run to completion in each file before it is saved. A result line is
+    printed per file.
+
+    Parameters:
+        - arguments (Namespace): Parsed command line arguments
+
+    Returns:
+        - int: Exit code, 1 if any file failed
+    """
+    import bpy
+
+    addon = import_addon()
+    blend_files = arguments.files or [bpy.data.filepath]
+    try:
+        if arguments.path:
+            script_path = Path(arguments.path)
+        elif arguments.config:
+            script_path = config_script(
+                config_path=arguments.config,
+                shelf=arguments.shelf,
+                script=arguments.script,
+            )
+        else:
+            script_path = addon.api.find_script(
+                shelf=arguments.shelf,
+                script=arguments.script,
+            )
+
+        # Verify before opening any file
+        allowed = allowed_hashes(addon=addon, arguments=arguments)
+        addon.runner.compile_script(path=script_path, allowed=allowed)
+
+    except Exception:
+        error = traceback.format_exc().splitlines()[-1]
+        traceback.print_exc()
+        for blend_file in blend_files:
+            result = {"file": blend_file, "duration": 0.0, "error": error}
+            print(RESULT_PREFIX + json.dumps(result), flush=True)
+
+        return 1
+
+    failed = False
+    for blend_file in blend_files:
+        result = {"file": blend_file}
+        started = time.perf_counter()
+        try:
+            if Path(blend_file).resolve() != Path(bpy.data.filepath).resolve():
+                bpy.ops.wm.open_mainfile(filepath=blend_file)
+
+            run_script(addon=addon, script_path=script_path, allowed=allowed)
+            if arguments.save:
+                bpy.ops.wm.save_mainfile()
+
+        except Exception:
+            result["error"] = traceback.format_exc().splitlines()[-1]
+            traceback.print_exc()
+            failed = True
+
+        result["duration"] = time.perf_counter() - started
+        print(RESULT_PREFIX + json.dumps(result), flush=True)
+
+    return int(failed)
+
+
+########################################################################################
+# Fan-out
+########################################################################################
+
+
+def expand_files(patterns: List[str]) -> List[str]:
+    """
+    Expand glob patterns & directories into blend files, keeping their order.
+
+    Parameters:
+        - patterns (list of str): Blend files, directories or glob patterns
+
+    Returns:
+        - list of str: Blend file paths, without duplicates
+    """
+    files = {}
+    for pattern in patterns:
+        if Path(pattern).is_dir():
+            matches = sorted(str(path) for path in Path(pattern).glob("*.blend"))
+        else:
+            matches = sorted(glob.glob(pattern, recursive=True)) or [pattern]
+
+        files.update(dict.fromkeys(matches))
+
+    return list(files)
+
+
+def chunk_files(files: List[str], files_per_process: int) -> List[List[str]]:
+    """
+    Split blend files into the chunks handled by each Blender process.
+
+    Parameters:
+        - files (list of str): Blend files
+        - files_per_process (int): Maximum amount of files per chunk
+
+    Returns:
+        - list of list of str: Chunks of blend files
+    """
+    files_per_process = max(files_per_process, 1)
+    return [
+        files[start : start + files_per_process]
+        for start in range(0, len(files), files_per_process)
+    ]
+
+
+def blender_command(
+    blender: str,
+    files: List[str],
+    shelf: str | None = None,
+    script: str | None = None,
+    path: str | Path | None = None,
+    config: str | None = None,
+    save: bool = False,
+    allowlist: str | None = None,
+    allowlist_key: str | None = None,
+) -> List[str]:
+    """
+    Generate the command running a shelf script over blend files in one background
+    Blender process. With a configuration file or a script file, the user's start-up
+    file & add-ons are skipped.
+
+    Parameters:
+        - blender (str): Blender executable
+        - files (list of str): Blend files
+        - shelf (str | None): Shelf name or directory
+        - script (str | None): Script file name, file stem or display name
+        - path (str | Path | None): Script file, used instead of shelf & script
+        - config (str | None): Configuration file, else the saved preferences are used
+        - save (bool): Save each file after running the script
+        - allowlist (str | None): Allowlist file scripts are verified against
+        - allowlist_key (str | None): Signing key file of the allowlist
+
+    Returns:
+        - list of str: Command arguments
+    """
+    command = [blender, "-b"]
+    if config or path:
+        command.append("--factory-startup")
+
+    command += ["--python", str(Path(__file__).resolve()), "--"]
+    if path:
+        command += ["--path", str(path)]
+    else:
+        command += ["--shelf", shelf, "--script", script]
+        if config:
+            command += ["--config", str(config)]
+    if save:
+        command.append("--save")
+    if allowlist:
+        command += [
+            "--allowlist",
+            str(allowlist),
+            "--allowlist-key",
+            str(allowlist_key),
+        ]
+
+    return command + files
+
+
+def collect_results(
+    output: str,
+    returncode: int,
+    files: List[str],
+    duration: float,
+) -> List[Dict[str, Any]]:
+    """
+    Collect the per-file results of a finished Blender process from its output. Files
+    without a result, e.g. after a crash, are reported as failed with the end of the
+    output.
+
+    Parameters:
+        - output (str): Output of the process
+        - returncode (int): Exit code of the process
+        - files (list of str): Blend files the process was given
+        - duration (float): Seconds the process ran
+
+    Returns:
+        - list of dict: Result of each file; 'file', 'duration' & 'error', if failed
+    """
+    results = {}
+    for line in output.splitlines():
+        if line.startswith(RESULT_PREFIX):
+            result = json.loads(line[len(RESULT_PREFIX) :])
+            results[result["file"]] = result
+
+    # Crashed or never reached
+    tail = "\n".join(output.splitlines()[-ERROR_LINES:])
+    for blend_file in files:
+        if blend_file not in results:
+            results[blend_file] = {
+                "file": blend_file,
+                "duration": duration,
+                "error": f"Exit code {returncode}:\n{tail}",
+            }
+
+    return [results[blend_file] for blend_file in files]
+
+
+def run_process(command: List[str], files: List[str]) -> List[Dict[str, Any]]:
+    """
+    Run a Blender process and collect its per-file results.
+
+    Parameters:
+        - command (list of str): Command arguments, as generated by 'blender_command'
+        - files (list of str): Blend files the process was given
+
+    Returns:
+        - list of dict: Result of each file; 'file', 'duration' & 'error', if failed
+    """
+    started = time.perf_counter()
+    process = subprocess.run(
+        command,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        errors="replace",
+    )
+
+    return collect_results(
+        output=process.stdout,
+        returncode=process.returncode,
+        files=files,
+        duration=time.perf_counter() - started,
+    )
+
+
+def fan_out(
+    blender: str,
+    files: List[str],
+    shelf: str | None = None,
+    script: str | None = None,
+    path: str | Path | None = None,
+    config: str | None = None,
+    save: bool = False,
+    jobs: int = 0,
+    files_per_process: int = 1,
+    allowlist: str | None = None,
+    allowlist_key: str | None = None,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Run a shelf script over many blend files in a bounded pool of background Blender
+    processes. Each process handles a few files in a row, compiling the script once.
+
+    Parameters:
+        - blender (str): Blender executable
+        - files (list of str): Blend files
+        - shelf (str | None): Shelf name or directory
+        - script (str | None): Script file name, file stem or display name
+        - path (str | Path | None): Script file, used instead of shelf & script
+        - config (str | None): Configuration file, else the saved preferences are used
+        - save (bool): Save each file after running the script
+        - jobs (int): Maximum amount of Blender processes at once, 0 for one per CPU
+        - files_per_process (int): Files handled by each process
+        - allowlist (str | None): Allowlist file scripts are verified against
+        - allowlist_key (str | None): Signing key file of the allowlist
+
+    Returns:
+        - Iterator of dict: Result of each file, in order of completion
+    """
+    with ThreadPoolExecutor(max_workers=jobs or os.cpu_count() or 1) as executor:
+        futures = [
+            executor.submit(
+                run_process,
+                blender_command(
+                    blender=blender,
+                    files=chunk,
+                    shelf=shelf,
+                    script=script,
+                    path=path,
+                    config=config,
+                    save=save,
+                    allowlist=allowlist,
+                    allowlist_key=allowlist_key,
+                ),
+                chunk,
+            )
+            for chunk in chunk_files(files=files, files_per_process=files_per_process)
+        ]
+        for future in as_completed(futures):
+            yield from future.result()
+
+
+def parse_arguments(arguments: List[str]) -> argparse.Namespace:
+    """
+    Parse the command line arguments of both the fan-out & the Blender process.
+
+    Parameters:
+        - arguments (list of str): Command line arguments
+
+    Returns:
+        - Namespace
+    """
+    parser = argparse.ArgumentParser(
+        description="Run a Shelf Made script over blend files in background Blender",
+    )
+    parser.add_argument("files", nargs="*", help="Blend files, directories or globs")
+    parser.add_argument("--shelf", help="Shelf name or directory")
+    parser.add_argument("--script", help="Script file or display name")
+    parser.add_argument("--path", help="Script file, instead of shelf & script")
+    parser.add_argument("--config", help="Exported configuration file")
+    parser.add_argument("--save", action="store_true", help="Save files after the run")
+    parser.add_argument("--allowlist", help="Allowlist file to verify the script")
+    parser.add_argument("--allowlist-key", help="Signing key file of the allowlist")
+    parser.add_argument("--blender", default="blender", help="Blender executable")
+    parser.add_argument(
+        "--jobs", type=int, default=0, help="Parallel Blender processes"
+    )
+    parser.add_argument(
+        "--files-per-process",
+        type=int,
+        default=4,
+        help="Files opened one by one in each Blender process",
+    )
+    parsed = parser.parse_args(arguments)
+    if not parsed.path and not (parsed.shelf and parsed.script):
+        parser.error("either --path or --shelf & --script are required")
+    if parsed.allowlist and not parsed.allowlist_key:
+        parser.error("--allowlist requires --allowlist-key")
+
+    return parsed
+
+
+def main(arguments: List[str]) -> int:
+    """
+    Fan blend files out over Blender processes and print their results.
+
+    Parameters:
+        - arguments (list of str): Command line arguments
+
+    Returns:
+        - int: Exit code, 1 if any file failed
+    """
+    parsed = parse_arguments(arguments=arguments)
+    files = expand_files(patterns=parsed.files)
+    if not files:
+        print("No blend files given")
+        return 1
+
+    failed = 0
+    for result in fan_out(
+        blender=parsed.blender,
+        files=files,
+        shelf=parsed.shelf,
+        script=parsed.script,
+        path=parsed.path,
+        config=parsed.config,
+        save=parsed.save,
+        jobs=parsed.jobs,
+        files_per_process=parsed.files_per_process,
+        allowlist=parsed.allowlist,
+        allowlist_key=parsed.allowlist_key,
+    ):
+        status = "failed" if "error" in result else "done"
+        print(f"{result['file']}: {status} in {result['duration']:.2f}s")
+        if "error" in result:
+            print(result["error"])
+            failed += 1
+
+    print(f"{len(files) - failed} of {len(files)} files done")
+    return int(bool(failed))
+
+
+if __name__ == "__main__":
+    try:
+        import bpy
+    except ImportError:
+        sys.exit(main(arguments=sys.argv[1:]))
+
+    # Blender passes script arguments after '--'
+    argv = sys.argv[sys.argv.index("--") + 1 :] if "--" in sys.argv else []
+    sys.exit(run_files(arguments=parse_arguments(arguments=argv)))
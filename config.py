@@ -0,0 +1,323 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Any
+    from .shelf import Script, Shelf
+
+import json
+from pathlib import Path
+
+from . import api, areas, preferences, utils
+
+
+########################################################################################
+# Statics
+########################################################################################
+
+
+# Version of the configuration file layout
+CONFIG_VERSION = 1
+
+# Shelf properties stored as they are
+SHELF_PROPERTIES = ("name", "icon", "columns", "height", "align")
+
+# Script properties stored as they are
+SCRIPT_PROPERTIES = ("display_name", "icon", "undo", "run_context")
+
+
+########################################################################################
+# Export
+########################################################################################
+
+
+def export_shelf(shelf: Shelf) -> dict:
+    """
+    Generate the configuration of a single shelf.
+
+    Parameters:
+        - shelf (Shelf)
+
+    Returns:
+        - dict: JSON compatible shelf configuration
+    """
+    shelf_config = {"directory": shelf.directory}
+    for attribute in SHELF_PROPERTIES:
+        shelf_config[attribute] = getattr(shelf, attribute)
+
+    shelf_config["area_types"] = [
+        area_type
+        for area_type, bit in areas.AREA_BITS.items()
+        if shelf.visibility & bit
+    ]
+
+    # Customized scripts only
+    shelf_config["scripts"] = [
+        {
+            "name": script.name,
+            **{
+                attribute: getattr(script, attribute) for attribute in SCRIPT_PROPERTIES
+            },
+        }
+        for script in shelf.scripts
+    ]
+
+    return shelf_config
+
+
+def export_config() -> dict:
+    """
+    Generate the configuration of all shelves.
+
+    Returns:
+        - dict: JSON compatible configuration
+    """
+    return {
+        "version": CONFIG_VERSION,
+        "shelves": [
+            export_shelf(shelf=shelf)
+            for shelf in preferences.Preferences.this().shelves
+        ],
+    }
+
+
+def write_config(filepath: str | Path):
+    """
+    Write the configuration of all shelves to a JSON file.
+
+    Parameters:
+        - filepath (str | Path)
+    """
+    Path(filepath).write_text(
+        json.dumps(export_config(), indent=4),
+        encoding="utf-8",
+    )
+
+
+########################################################################################
+# Import
+########################################################################################
+
+
+def read_config(filepath: str | Path) -> dict:
+    """
+    Read a configuration file. TOML files are supported if the running Python provides
+    'tomllib', all other files are read as JSON.
+
+    Parameters:
+        - filepath (str | Path)
+
+    Returns:
+        - dict: Configuration
+    """
+    path = Path(filepath)
+    if path.suffix.lower() == ".toml":
+        import tomllib
+
+        return tomllib.loads(path.read_text(encoding="utf-8"))
+
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def set_changed(data: Shelf | Script, attribute: str, value: Any) -> bool:
+    """
+    Set a property only if its value differs, to avoid needless update callbacks.
+
+    Parameters:
+        - data (Shelf | Script)
+        - attribute (str): Property name
+        - value (any): New value
+
+    Returns:
+        - bool: Whether the property was changed
+    """
+    if getattr(data, attribute) == value:
+        return False
+
+    setattr(data, attribute, value)
+    return True
+
+
+def apply_shelf(shelf: Shelf, shelf_config: dict) -> int:
+    """
+    Apply a shelf configuration, only changing differing properties.
+
+    Parameters:
+        - shelf (Shelf)
+        - shelf_config (dict): Shelf configuration
+
+    Returns:
+        - int: Amount of changes
+    """
+    changes = 0
+
+    # Properties
+    for attribute in SHELF_PROPERTIES:
+        if attribute in shelf_config:
+            changes += set_changed(shelf, attribute, shelf_config[attribute])
+
+    # Visibility
+    if "area_types" in shelf_config:
+        visibility = 0
+        for area_type in shelf_config["area_types"]:
+            visibility |= areas.AREA_BITS.get(area_type, 0)
+
+        changes += set_changed(shelf, "visibility", visibility)
+
+    # Scripts
+    script_configs = shelf_config.get("scripts", [])
+    for script_config in script_configs:
+        script = shelf.scripts.get(script_config["name"])
+        if not script:
+            script = shelf.script_override(script=script_config["name"])
+            changes += 1
+
+        for attribute in SCRIPT_PROPERTIES:
+            if attribute in script_config:
+                changes += set_changed(script, attribute, script_config[attribute])
+
+    changes += utils.reorder_collection(
+        collection=shelf.scripts,
+        order=[
+            shelf.scripts.find(script_config["name"])
+            for script_config in script_configs
+        ],
+    )
+
+    return changes
+
+
+def validate_config(config: Any):
+    """
+    Check the shape of a configuration before anything is applied.
+
+    Parameters:
+        - config (any): Parsed configuration
+
+    Raises:
+        - ValueError: If the configuration is malformed or of a newer version
+    """
+    if not isinstance(config, dict):
+        raise ValueError("Configuration is not an object")
+
+    version = config.get("version", CONFIG_VERSION)
+    if not isinstance(version, int) or version > CONFIG_VERSION:
+        raise ValueError(f"Unsupported configuration version {version}")
+
+    shelf_configs = config.get("shelves", [])
+    if not isinstance(shelf_configs, list):
+        raise ValueError("Configuration shelves must be a list")
+
+    for shelf_config in shelf_configs:
+        if not isinstance(shelf_config, dict) or not isinstance(
+            shelf_config.get("directory"), str
+        ):
+            raise ValueError("Each configured shelf needs a directory")
+
+        if not isinstance(shelf_config.get("area_types", []), list):
+            raise ValueError(
+                f"Area types of {shelf_config['directory']} must be a list"
+            )
+
+        script_configs = shelf_config.get("scripts", [])
+        if not isinstance(script_configs, list) or not all(
+            isinstance(script_config, dict)
+            and isinstance(script_config.get("name"), str)
+            for script_config in script_configs
+        ):
+            raise ValueError(
+                f"Scripts of {shelf_config['directory']} must each have a name"
+            )
+
+
+def resolve_directory(directory: str) -> str:
+    """
+    Resolve a shelf directory the way it is stored when set on a shelf, so configured
+    & existing directories compare equal.
+
+    Parameters:
+        - directory (str)
+
+    Returns:
+        - str: Resolved posix path, empty if no directory is given
+    """
+    if not directory:
+        return ""
+
+    return Path(directory).resolve().as_posix()
+
+
+def apply_config(config: dict, remove_missing: bool = False) -> int:
+    """
+    Compare a configuration to the current shelves and apply only the differences
+    within a single batch. Shelves are matched by resolved directory, as stored when
+    a shelf directory is set.
+
+    Parameters:
+        - config (dict): Configuration, as generated by 'export_config'
+        - remove_missing (bool): Remove shelves not found in the configuration
+
+    Returns:
+        - int: Amount of changes
+
+    Raises:
+        - ValueError: If the configuration is malformed or of a newer version
+    """
+    validate_config(config=config)
+
+    changes = 0
+    with api.batch() as prefs:
+        shelves = prefs.shelves
+        shelf_configs = config.get("shelves", [])
+        directories = [
+            resolve_directory(directory=shelf_config["directory"])
+            for shelf_config in shelf_configs
+        ]
+
+        # Resolve each stored directory once
+        resolved = [resolve_directory(directory=shelf.directory) for shelf in shelves]
+
+        # Remove shelves that are not configured
+        if remove_missing:
+            for i in reversed(range(len(shelves))):
+                if resolved[i] not in directories:
+                    shelves.remove(i)
+                    del resolved[i]
+                    utils.defer(update="panels")
+                    changes += 1
+
+        # Add or update configured shelves, the first one of each directory
+        indices = {}
+        for i, directory in enumerate(resolved):
+            indices.setdefault(directory, i)
+
+        for directory, shelf_config in zip(directories, shelf_configs):
+            if directory in indices:
+                shelf = shelves[indices[directory]]
+            else:
+                shelf = api.add_shelf(
+                    directory=directory,
+                    name=shelf_config.get("name", ""),
+                )
+                indices[directory] = len(shelves) - 1
+                changes += 1
+
+            changes += apply_shelf(shelf=shelf, shelf_config=shelf_config)
+
+        # Shelf order, configured shelves first
+        changes += utils.reorder_collection(
+            collection=shelves,
+            order=list(
+                dict.fromkeys(
+                    indices[directory]
+                    for directory in directories
+                    if directory in indices
+                )
+            ),
+        )
+
+        # Only save if anything changed
+        if changes:
+            utils.save_userpref()
+
+    return changes
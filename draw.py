@@ -2,13 +2,17 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from typing import List, Literal
+    from typing import Any, Dict, List, Literal, Tuple
     from bpy.types import Context, ID, Panel, Text, UILayout
-    from .shelf import Script, Shelf
+    from .shelf import Shelf
 
 import bpy
+import heapq
 import re
-from . import preferences
+import time
+from pathlib import Path
+
+from . import areas, events, fanout, hashing, preferences, tasks, usage, utils
 
 
 ########################################################################################
@@ -16,32 +20,89 @@ from . import preferences
 ########################################################################################
 
 
-# Dictionary containing 'area.ui_type' keys and area icon values
-AREA_TYPES = {
-    "VIEW_3D": "VIEW3D",
-    "IMAGE_EDITOR": "IMAGE",
-    "UV": "UV",
-    "CompositorNodeTree": "NODE_COMPOSITING",
-    "TextureNodeTree": "NODE_TEXTURE",
-    "GeometryNodeTree": "GEOMETRY_NODES",
-    "ShaderNodeTree": "NODE_MATERIAL",
-    "SEQUENCE_EDITOR": "SEQUENCE",
-    "CLIP_EDITOR": "TRACKER",
-    "DOPESHEET": "ACTION",
-    "TIMELINE": "TIME",
-    "FCURVES": "GRAPH",
-    "DRIVERS": "DRIVER",
-    "NLA_EDITOR": "NLA",
-    "TEXT_EDITOR": "TEXT",
-    # "CONSOLE": "CONSOLE",
-    # "INFO": "INFO",
-    # "OUTLINER": "OUTLINER",
-    # "PROPERTIES": "PROPERTIES",
-    # "FILES": "FILEBROWSER",
-    # "ASSETS": "ASSET_MANAGER",
-    "SPREADSHEET": "SPREADSHEET",
-    # "PREFERENCES": "PREFERENCES",
-}
+# Amount of events drawn in the event log panel
+EVENT_DRAW_LIMIT = 30
+
+# Amount of files drawn in the file report panel
+REPORT_DRAW_LIMIT = 30
+
+# Ranked scripts of the Frequent shelf & the cache key they were ranked for
+FREQUENT: Dict[str, Any] = {"key": None, "scripts": []}
+
+# Script paths of shelf buttons, keyed by shelf directory & file name, & the change
+# count they were generated at
+SCRIPT_PATHS: Dict[str, Any] = {"changes": None, "paths": {}}
+
+
+########################################################################################
+# Caches
+########################################################################################
+
+
+def button_path(shelf: Shelf, file_name: str) -> str:
+    """
+    Get the path a shelf button runs a script from, without looking the mirror up on
+    every redraw. Cached until shelf settings or scans change.
+
+    Parameters:
+        - shelf (Shelf)
+        - file_name (str): Script file name
+
+    Returns:
+        - str: Posix script path
+    """
+    if SCRIPT_PATHS["changes"] != utils.CHANGES["count"]:
+        SCRIPT_PATHS.update(changes=utils.CHANGES["count"], paths={})
+
+    key = (shelf.directory, file_name)
+    path = SCRIPT_PATHS["paths"].get(key)
+    if path is None:
+        path = shelf.script_path(script=file_name).as_posix()
+        SCRIPT_PATHS["paths"][key] = path
+
+    return path
+
+
+def ranked_scripts(
+    shelves: List[Shelf],
+    order: str,
+    limit: int,
+) -> List[Tuple[Any, ...]]:
+    """
+    Rank the scripts of several shelves that were run before. Cached until shelf
+    settings, scans or script runs change.
+
+    Parameters:
+        - shelves (list of Shelf): Shelves visible in the current area
+        - order (str): Frequent shelf order, FREQUENT or RECENT
+        - limit (int): Maximum amount of scripts
+
+    Returns:
+        - list of tuple: Score, script path, display name, icon, run operator & its
+          context of the highest ranked scripts
+    """
+    key = (
+        utils.CHANGES["count"],
+        order,
+        limit,
+        tuple(shelf.directory for shelf in shelves),
+    )
+    if FREQUENT["key"] == key:
+        return FREQUENT["scripts"]
+
+    score = usage.last_run if order == "RECENT" else usage.run_count
+    candidates = []
+    for shelf in shelves:
+        for file_name, *entry in shelf.script_entries():
+            path = button_path(shelf=shelf, file_name=file_name)
+            value = score(path=path)
+            if value:
+                candidates.append((value, path, *entry))
+
+    scripts = heapq.nlargest(limit, candidates, key=lambda candidate: candidate[0])
+    FREQUENT.update(key=key, scripts=scripts)
+
+    return scripts
 
 
 ########################################################################################
@@ -49,6 +110,132 @@ AREA_TYPES = {
 ########################################################################################
 
 
+def event_log(panel: Panel, context: Context):
+    """
+    Draw the most recent events, newest first. Failed events are highlighted.
+
+    Parameters:
+        - panel (Panel)
+        - context (Context)
+    """
+    col_events = panel.layout.column(align=True)
+
+    recent_events = events.recent(limit=EVENT_DRAW_LIMIT)
+    if not recent_events:
+        col_events.label(text="No Events Logged")
+        return
+
+    for event in recent_events:
+        row_event = col_events.row(align=True)
+        row_event.alert = "error" in event
+
+        # Time & type
+        row_event.label(text=time.strftime("%H:%M:%S", time.localtime(event["time"])))
+        row_event.label(text=event["kind"])
+
+        # Subject
+        subject = event.get("path") or event.get("directory") or event.get("name")
+        if subject:
+            row_event.label(text=Path(subject).name)
+        elif "shelves" in event:
+            row_event.label(text=f"{event['shelves']} Shelves")
+        else:
+            row_event.label(text="")
+
+        # Duration
+        if "duration" in event:
+            row_event.label(text=f"{event['duration'] * 1000:.1f} ms")
+        else:
+            row_event.label(text="")
+
+
+def file_report(panel: Panel, context: Context):
+    """
+    Draw the results of the last run of a script in many files, failed files first.
+
+    Parameters:
+        - panel (Panel)
+        - context (Context)
+    """
+    report = fanout.REPORT
+    results = report["results"]
+    failed = [result for result in results if "error" in result]
+
+    # Summary
+    col_report = panel.layout.column(align=True)
+    col_report.label(text=Path(report["script"]).name, icon="FILE_SCRIPT")
+    row_summary = col_report.row(align=True)
+    row_summary.alert = bool(failed)
+    row_summary.label(text=f"{len(results)} of {report['total']} Files")
+    row_summary.label(text=f"{len(failed)} Failed")
+    if tasks.is_running(path=report["script"]):
+        col_report.label(
+            text=f"Running for {time.time() - report['started']:.0f} s",
+            icon="SORTTIME",
+        )
+
+    # Files
+    col_files = panel.layout.column(align=True)
+    ordered = failed + [result for result in results if "error" not in result]
+    for result in ordered[:REPORT_DRAW_LIMIT]:
+        row_file = col_files.row(align=True)
+        row_file.alert = "error" in result
+        row_file.label(
+            text=Path(result["file"]).name,
+            icon="ERROR" if "error" in result else "CHECKMARK",
+        )
+        row_file.label(text=f"{result['duration']:.1f} s")
+
+    if len(ordered) > REPORT_DRAW_LIMIT:
+        col_files.label(text=f"{len(ordered) - REPORT_DRAW_LIMIT} More, See Export")
+
+
+def frequent_scripts(layout: UILayout, context: Context):
+    """
+    Draw a virtual shelf holding the most used or most recently run scripts of all
+    shelves visible in the current area. Not drawn if none of them was run yet.
+
+    Parameters:
+        - layout (UILayout)
+        - context (Context)
+    """
+    if TYPE_CHECKING:
+        shelf: Shelf
+
+    prefs = preferences.Preferences.this()
+    text = "Recent" if prefs.frequent_order == "RECENT" else "Frequent"
+
+    # Rank all scripts that were run before
+    scripts = ranked_scripts(
+        shelves=[shelf for shelf in prefs.shelves if shelf.is_visible(context=context)],
+        order=prefs.frequent_order,
+        limit=prefs.frequent_limit,
+    )
+    if not scripts:
+        return
+
+    # Title & expander
+    box_frequent = layout.box()
+    if show_layout(
+        layout=box_frequent.row(),
+        data=prefs,
+        property="show_frequent",
+        text=text,
+        alignment="LEFT",
+        icon="SORTTIME",
+    ):
+        # Run script operators
+        col_frequent = box_frequent.column(align=True)
+        for _, script_path, display_name, icon, operator, run_context in scripts:
+            row_script = col_frequent.row(align=True)
+            row_script.operator_context = run_context
+            row_script.operator(
+                operator=operator,
+                text=display_name,
+                icon=icon,
+            ).filepath = script_path
+
+
 def local_scripts(panel: Panel, context: Context):
     """
     Draw all python script text datablocks found in the currently loaded blend file.
@@ -104,17 +291,36 @@ def shelf_visibility(panel: Panel, context: Context, index: int):
 
     # Area type toggles
     col_areas = layout.column()
-    for area_type, icon in AREA_TYPES.items():
+    for area_type, icon in areas.AREA_ICONS.items():
         # Area type row
         row_area = col_areas.row()
         row_area.alignment = "LEFT"
 
         # Area type toggle
-        property = f"enabled_{area_type.lower()}"
+        property = areas.attribute_name(area_type=area_type)
         row_area.prop(data=shelf, property=property, text="")
         row_area.prop(data=shelf, property=property, icon=icon, emboss=False)
 
 
+def running_scripts(layout: UILayout):
+    """
+    Draw all running async scripts with their running time and a cancel button.
+
+    Parameters:
+        - layout (UILayout)
+    """
+    col_running = layout.box().column(align=True)
+    for script_path, seconds in tasks.running():
+        row_running = col_running.row(align=True)
+        row_running.label(text=Path(script_path).stem, icon="SORTTIME")
+        row_running.label(text=f"{seconds:.0f} s")
+        row_running.operator(
+            operator="shelfmade.cancel_script",
+            text="",
+            icon="CANCEL",
+        ).filepath = script_path
+
+
 def shelf_scripts(panel: Panel, context: Context):
     """
     Draw all shelves that are visible in the current area.
@@ -126,7 +332,6 @@ def shelf_scripts(panel: Panel, context: Context):
         - context (Context)
     """
     if TYPE_CHECKING:
-        script: Script
         shelf: Shelf
         row_script: UILayout
 
@@ -137,6 +342,14 @@ def shelf_scripts(panel: Panel, context: Context):
         layout.operator(operator="shelfmade.add_shelf", icon="ADD")
         return
 
+    # Running async scripts
+    if tasks.TASKS:
+        running_scripts(layout=layout)
+
+    # Virtual shelf of the most used scripts
+    if prefs.use_frequent_shelf:
+        frequent_scripts(layout=layout, context=context)
+
     # Draw each shelf
     for sh_i, shelf in enumerate(shelves):
         if not shelf.is_visible(context=context):
@@ -155,7 +368,7 @@ def shelf_scripts(panel: Panel, context: Context):
             icon="" if shelf.icon == "NONE" else shelf.icon,
         ):
             # Don't draw if scripts are empty
-            scripts = [s for s in shelf.scripts if s.is_available]
+            scripts = shelf.script_entries()
             if scripts:
 
                 # Generate grid flow
@@ -170,19 +383,25 @@ def shelf_scripts(panel: Panel, context: Context):
                     columns.append(grid_shelf.column(align=shelf.align))
 
                 # Draw script buttons
-                for sc_i, script in enumerate(scripts):
+                for sc_i, entry in enumerate(scripts):
+                    file_name, display_name, icon, operator, run_context = entry
 
                     # Assign to column & set height
                     row_script = columns[sc_i % shelf.columns].row(align=True)
                     row_script.scale_y = shelf.height
 
                     # Run script operator
-                    row_script.operator_context = "EXEC_DEFAULT"
+                    path = button_path(shelf=shelf, file_name=file_name)
+                    row_script.operator_context = run_context
                     row_script.operator(
-                        operator="wm.run_script",
-                        text=script.display_name,
-                        icon=script.icon,
-                    ).filepath = str(shelf.script_path(script=script.name))
+                        operator=operator,
+                        text=display_name,
+                        icon=icon,
+                    ).filepath = path
+
+                    # Mark scripts changed since their last run
+                    if prefs.use_hashing and hashing.is_modified(path=path):
+                        row_script.label(text="", icon="FILE_REFRESH")
 
                     # Menu button
                     if not prefs.is_locked:
@@ -192,7 +411,7 @@ def shelf_scripts(panel: Panel, context: Context):
                             text="",
                         )
                         op_script.index = sh_i
-                        op_script.script = script.name
+                        op_script.script = file_name
 
             else:
                 row_noscripts = box_shelf.row()
@@ -0,0 +1,109 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Deque, Iterator, List
+
+import json
+import time
+from collections import deque
+from contextlib import contextmanager
+from pathlib import Path
+
+
+########################################################################################
+# Statics
+########################################################################################
+
+
+# Maximum amount of events kept in memory; older events are dropped
+EVENT_LIMIT = 2000
+
+# Ring buffer of structured events, each a JSON compatible dictionary
+EVENTS: Deque[dict] = deque(maxlen=EVENT_LIMIT)
+
+
+########################################################################################
+# Event log
+########################################################################################
+
+
+def log(kind: str, **data) -> dict:
+    """
+    Append an event to the ring buffer. Safe to call from worker threads.
+
+    Parameters:
+        - kind (str): Event type, e.g. 'scan_start' or 'run'
+        - data: Additional JSON compatible event fields
+
+    Returns:
+        - dict: The logged event
+    """
+    event = {"time": time.time(), "kind": kind, **data}
+    EVENTS.append(event)
+    return event
+
+
+@contextmanager
+def timed(kind: str, **data) -> Iterator[dict]:
+    """
+    Log an event once the wrapped block is done, including its duration in seconds and
+    the error message, if any. The yielded event may be extended within the block.
+
+    ### Use as context manager.
+
+    Parameters:
+        - kind (str): Event type
+        - data: Additional JSON compatible event fields
+
+    Yields:
+        - dict: Event fields, logged on exit
+    """
+    event = dict(data)
+    start = time.perf_counter()
+    try:
+        yield event
+    except Exception as e:
+        event["error"] = f"{type(e).__name__}: {e}"
+        raise
+    finally:
+        event["duration"] = time.perf_counter() - start
+        log(kind, **event)
+
+
+def recent(limit: int) -> List[dict]:
+    """
+    Get the most recent events. Iterates a snapshot, as worker threads may log events
+    meanwhile.
+
+    Parameters:
+        - limit (int): Maximum amount of events
+
+    Returns:
+        - list of dict: Events, newest first
+    """
+    events = []
+    for event in reversed(list(EVENTS)):
+        if len(events) >= limit:
+            break
+        events.append(event)
+
+    return events
+
+
+def export(filepath: str | Path) -> int:
+    """
+    Write all buffered events to a JSON Lines file.
+
+    Parameters:
+        - filepath (str | Path)
+
+    Returns:
+        - int: Amount of exported events
+    """
+    events = list(EVENTS)
+    with open(filepath, "w", encoding="utf-8") as f:
+        for event in events:
+            f.write(json.dumps(event, default=str) + "\n")
+
+    return len(events)
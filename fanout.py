@@ -0,0 +1,195 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Any, Dict, List
+
+import asyncio
+import csv
+import os
+import time
+from pathlib import Path
+
+import bpy
+
+from . import cli, events, preferences, tasks
+
+
+########################################################################################
+# Statics
+########################################################################################
+
+
+# Columns of the exported file report
+REPORT_COLUMNS = ("file", "status", "duration", "error")
+
+# Last run over many blend files: script path, amount of files, results of finished
+# files & start time
+REPORT: Dict[str, Any] = {
+    "script": "",
+    "total": 0,
+    "results": [],
+    "started": 0.0,
+}
+
+
+########################################################################################
+# Runs over many files
+########################################################################################
+
+
+async def run_chunk(
+    command: List[str],
+    files: List[str],
+    semaphore: asyncio.Semaphore,
+) -> List[Dict[str, Any]]:
+    """
+    Run a single Blender process once the semaphore allows it, adding its per-file
+    results to the report. If cancelled, the process is killed.
+
+    Parameters:
+        - command (list of str): Command arguments, as generated by 'blender_command'
+        - files (list of str): Blend files the process is given
+        - semaphore (Semaphore): Bounds the amount of processes at once
+
+    Returns:
+        - list of dict: Result of each file
+    """
+    async with semaphore:
+        started = time.perf_counter()
+        process = await asyncio.create_subprocess_exec(
+            *command,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT,
+        )
+        try:
+            output, _ = await process.communicate()
+        except asyncio.CancelledError:
+            process.kill()
+            await process.wait()
+            raise
+
+    results = cli.collect_results(
+        output=output.decode("utf-8", "replace"),
+        returncode=process.returncode,
+        files=files,
+        duration=time.perf_counter() - started,
+    )
+    REPORT["results"].extend(results)
+    tasks.redraw()
+
+    return results
+
+
+async def run(
+    script_path: str | Path,
+    files: List[str],
+    jobs: int = 0,
+    files_per_process: int = 4,
+    save: bool = False,
+) -> List[Dict[str, Any]]:
+    """
+    Run a script over many blend files in a bounded pool of background Blender
+    processes, replacing the report. Each process opens a few files in a row and
+    verifies the script against the allowlist set in the preferences.
+
+    Parameters:
+        - script_path (str | Path)
+        - files (list of str): Blend files
+        - jobs (int): Maximum amount of Blender processes at once, 0 for one per CPU
+        - files_per_process (int): Files handled by each process
+        - save (bool): Save each file after running the script
+
+    Returns:
+        - list of dict: Result of each file, in order of completion
+    """
+    REPORT.update(
+        script=Path(script_path).as_posix(),
+        total=len(files),
+        results=[],
+        started=time.time(),
+    )
+    semaphore = asyncio.Semaphore(jobs or os.cpu_count() or 1)
+    prefs = preferences.Preferences.this()
+
+    with events.timed(kind="run_files", path=REPORT["script"]) as event:
+        await asyncio.gather(
+            *(
+                run_chunk(
+                    command=cli.blender_command(
+                        blender=bpy.app.binary_path,
+                        files=chunk,
+                        path=script_path,
+                        save=save,
+                        allowlist=prefs.allowlist_path or None,
+                        allowlist_key=prefs.allowlist_key_path or None,
+                    ),
+                    files=chunk,
+                    semaphore=semaphore,
+                )
+                for chunk in cli.chunk_files(
+                    files=files,
+                    files_per_process=files_per_process,
+                )
+            )
+        )
+        event["files"] = len(files)
+        event["failed"] = sum("error" in result for result in REPORT["results"])
+
+    return REPORT["results"]
+
+
+def start(
+    script_path: str | Path,
+    files: List[str],
+    jobs: int = 0,
+    files_per_process: int = 4,
+    save: bool = False,
+):
+    """
+    Start a run over many blend files in the background. It is listed with all running
+    scripts and can be cancelled, killing its Blender processes.
+
+    Parameters:
+        - script_path (str | Path)
+        - files (list of str): Blend files
+        - jobs (int): Maximum amount of Blender processes at once, 0 for one per CPU
+        - files_per_process (int): Files handled by each process
+        - save (bool): Save each file after running the script
+    """
+    tasks.start(
+        path=script_path,
+        coroutine=run(
+            script_path=script_path,
+            files=files,
+            jobs=jobs,
+            files_per_process=files_per_process,
+            save=save,
+        ),
+    )
+
+
+def write_report(filepath: str | Path) -> int:
+    """
+    Write the results of the last run over many files to a CSV file.
+
+    Parameters:
+        - filepath (str | Path)
+
+    Returns:
+        - int: Amount of files written
+    """
+    with open(filepath, "w", encoding="utf-8", newline="") as report_file:
+        writer = csv.writer(report_file)
+        writer.writerow(REPORT_COLUMNS)
+        for result in REPORT["results"]:
+            writer.writerow(
+                (
+                    result["file"],
+                    "failed" if "error" in result else "done",
+                    f"{result['duration']:.3f}",
+                    result.get("error", ""),
+                )
+            )
+
+    return len(REPORT["results"])
@@ -0,0 +1,286 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+    from typing import Dict, List, Tuple
+
+import hashlib
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import bpy
+
+from . import events
+
+
+########################################################################################
+# Statics
+########################################################################################
+
+
+# Content hashes, keyed by posix path; each value holds ((size, mtime), digest)
+HASH_CACHE: Dict[str, Tuple[Tuple[int, int], str]] = {}
+
+# Content hashes of scripts at their last run, keyed by posix path
+RUN_HASHES: Dict[str, str] = {}
+
+# Seconds between two checks whether background hashing has finished
+POLL_INTERVAL = 0.2
+
+# Maximum amount of files hashed at the same time
+MAX_WORKERS = 2
+
+# Worker pool for background hashing, kept apart from directory scans; created on first
+# use
+EXECUTOR: ThreadPoolExecutor | None = None
+
+# Running background hash jobs
+PENDING: List[Future] = []
+
+
+########################################################################################
+# Hashing
+########################################################################################
+
+
+def data_hash(data: bytes) -> str:
+    """
+    Generate the content hash of file data.
+
+    Parameters:
+        - data (bytes)
+
+    Returns:
+        - str: Hexadecimal BLAKE2b digest
+    """
+    return hashlib.blake2b(data).hexdigest()
+
+
+def cached_hash(path: str | Path) -> str | None:
+    """
+    Get the last known content hash of a file without touching the file system.
+
+    Parameters:
+        - path (str | Path)
+
+    Returns:
+        - str | None: Hexadecimal digest, None if never hashed
+    """
+    cached = HASH_CACHE.get(Path(path).as_posix())
+    if cached:
+        return cached[1]
+
+
+def file_hash(path: str | Path) -> str:
+    """
+    Get the content hash of a file. The file is only read if its size or modification
+    time changed since it was last hashed. Safe to call from worker threads.
+
+    Parameters:
+        - path (str | Path)
+
+    Returns:
+        - str: Hexadecimal digest
+    """
+    key = Path(path).as_posix()
+    stat = os.stat(key)
+    signature = (stat.st_size, stat.st_mtime_ns)
+
+    cached = HASH_CACHE.get(key)
+    if cached and cached[0] == signature:
+        return cached[1]
+
+    digest = data_hash(data=Path(key).read_bytes())
+    HASH_CACHE[key] = (signature, digest)
+
+    return digest
+
+
+def store_hash(path: str | Path, signature: Tuple[int, int], data: bytes) -> str:
+    """
+    Hash file data that has already been read and store it in the cache.
+
+    Parameters:
+        - path (str | Path)
+        - signature (tuple of int): File size and modification time in nanoseconds
+        - data (bytes): File content
+
+    Returns:
+        - str: Hexadecimal digest
+    """
+    digest = data_hash(data=data)
+    HASH_CACHE[Path(path).as_posix()] = (signature, digest)
+    return digest
+
+
+def hash_files(paths: List[str]) -> int:
+    """
+    Hash several files, skipping unchanged and unreadable ones.
+
+    Parameters:
+        - paths (list of str)
+
+    Returns:
+        - int: Amount of hashed files
+    """
+    hashed = 0
+    with events.timed(kind="hash", files=len(paths)) as event:
+        for path in paths:
+            try:
+                file_hash(path=path)
+                hashed += 1
+            except OSError:
+                continue
+
+        event["hashed"] = hashed
+
+    return hashed
+
+
+def executor() -> ThreadPoolExecutor:
+    """
+    Get the hashing worker pool, creating it if necessary.
+
+    Returns:
+        - ThreadPoolExecutor
+    """
+    global EXECUTOR
+    if not EXECUTOR:
+        EXECUTOR = ThreadPoolExecutor(
+            max_workers=MAX_WORKERS,
+            thread_name_prefix="shelfmade_hash",
+        )
+
+    return EXECUTOR
+
+
+def shutdown():
+    """
+    Stop waiting for background hashing and shut the hashing worker pool down without
+    waiting for running jobs.
+    """
+    global EXECUTOR
+    if bpy.app.timers.is_registered(hash_timer):
+        bpy.app.timers.unregister(hash_timer)
+
+    PENDING.clear()
+    if EXECUTOR:
+        EXECUTOR.shutdown(wait=False, cancel_futures=True)
+        EXECUTOR = None
+
+
+def hash_files_later(paths: List[str]):
+    """
+    Hash several files on a worker thread and redraw all areas once done.
+
+    Parameters:
+        - paths (list of str)
+    """
+    if not paths:
+        return
+
+    PENDING.append(executor().submit(hash_files, paths))
+    if not bpy.app.timers.is_registered(hash_timer):
+        bpy.app.timers.register(hash_timer, first_interval=POLL_INTERVAL)
+
+
+def hash_timer() -> float | None:
+    """
+    Wait for background hashing to finish, then redraw all areas.
+
+    Returns:
+        - float | None: Seconds until the next check, None when done
+    """
+    PENDING[:] = [future for future in PENDING if not future.done()]
+    if PENDING:
+        return POLL_INTERVAL
+
+    for window in bpy.context.window_manager.windows:
+        for area in window.screen.areas:
+            area.tag_redraw()
+
+
+########################################################################################
+# Change detection
+########################################################################################
+
+
+def record_run(path: str | Path):
+    """
+    Remember the content hash of a script at the time it is run.
+
+    Parameters:
+        - path (str | Path)
+    """
+    try:
+        RUN_HASHES[Path(path).as_posix()] = file_hash(path=path)
+    except OSError:
+        pass
+
+
+def is_modified(path: str | Path) -> bool:
+    """
+    Check whether a script changed since its last run, using known hashes only.
+
+    Parameters:
+        - path (str | Path)
+
+    Returns:
+        - bool: Whether the script was run before and its content differs since
+    """
+    key = Path(path).as_posix()
+    run_hash = RUN_HASHES.get(key)
+    return bool(run_hash) and run_hash != cached_hash(path=key)
+
+
+########################################################################################
+# Persistence
+########################################################################################
+
+
+def cache_path() -> Path:
+    """
+    Get the location of the hash cache file within the user config directory.
+
+    Returns:
+        - Path
+    """
+    config = bpy.utils.user_resource("CONFIG", path="shelfmade", create=True)
+    return Path(config, "hashes.json")
+
+
+def load():
+    """
+    Read known hashes from disk, so unchanged files are not hashed again after a
+    restart.
+    """
+    path = cache_path()
+    if not path.is_file():
+        return
+
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+        files = {
+            key: (tuple(value[0]), value[1]) for key, value in data["files"].items()
+        }
+        runs = dict(data["runs"])
+    except (AttributeError, KeyError, OSError, TypeError, ValueError):
+        print(f"Could not read hash cache {path}")
+        return
+
+    HASH_CACHE.update(files)
+    RUN_HASHES.update(runs)
+
+
+def save():
+    """
+    Write known hashes to disk.
+    """
+    data = {"files": dict(HASH_CACHE), "runs": RUN_HASHES}
+    try:
+        cache_path().write_text(json.dumps(data), encoding="utf-8")
+    except OSError:
+        print("Could not write hash cache")
@@ -0,0 +1,272 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Any, Dict, List
+
+import argparse
+import hashlib
+import json
+import os
+import time
+import urllib.request
+from abc import ABC, abstractmethod
+from pathlib import Path
+
+
+# This module must not import bpy or any sibling module, so CI jobs can run it on its
+# own to publish an index:
+#   python index.py --output /studio/shelves/index.json /studio/shelves/*/
+
+
+########################################################################################
+# Statics
+########################################################################################
+
+
+# Version of the index file layout
+INDEX_VERSION = 1
+
+# Seconds a fetched index is re-used before it is fetched again
+INDEX_LIFETIME = 30.0
+
+# Seconds to wait for a remote index service
+REQUEST_TIMEOUT = 5.0
+
+# Provider instances, keyed by source
+PROVIDERS: Dict[str, IndexProvider] = {}
+
+
+########################################################################################
+# Validation
+########################################################################################
+
+
+def validate(document: Any) -> Dict[str, List[dict]]:
+    """
+    Check the shape of an index document.
+
+    Parameters:
+        - document (any): Parsed index document
+
+    Returns:
+        - dict: Posix directory keys, lists of script dictionaries values
+
+    Raises:
+        - ValueError: If the document is malformed or of a newer version
+    """
+    if not isinstance(document, dict):
+        raise ValueError("Index document is not an object")
+
+    version = document.get("version", INDEX_VERSION)
+    if not isinstance(version, int) or version > INDEX_VERSION:
+        raise ValueError(f"Unsupported index version {version}")
+
+    directories = document.get("directories", {})
+    if not isinstance(directories, dict) or not all(
+        isinstance(scripts, list)
+        and all(
+            isinstance(script, dict) and isinstance(script.get("name"), str)
+            for script in scripts
+        )
+        for scripts in directories.values()
+    ):
+        raise ValueError("Index directories must list scripts with a name each")
+
+    return directories
+
+
+########################################################################################
+# Providers
+########################################################################################
+
+
+class IndexProvider(ABC):
+    """
+    Base class for sources publishing a pre-computed script index, so clients do not
+    need to walk the shelf directories themselves. An index maps posix directory paths
+    to their scripts, each a dictionary with 'name', 'size', 'mtime', 'hash' & optional
+    'metadata' keys.
+    """
+
+    def __init__(self, source: str):
+        self.source = source
+        self.index: Dict[str, List[dict]] = {}
+        self.fetched = 0.0
+
+    @abstractmethod
+    def load(self) -> dict:
+        """
+        Load the raw index document. Implemented by inheriting providers.
+
+        Returns:
+            - dict: Index document
+        """
+
+    def is_outdated(self) -> bool:
+        """
+        Returns:
+            - bool: Whether the index has to be fetched again
+        """
+        return not self.fetched or time.monotonic() - self.fetched > INDEX_LIFETIME
+
+    def fetch(self) -> Dict[str, List[dict]]:
+        """
+        Get the index, loading it again only if it is outdated.
+
+        Returns:
+            - dict: Posix directory keys, lists of script dictionaries values
+
+        Raises:
+            - ValueError: If the index document is malformed or of a newer version
+        """
+        if self.is_outdated():
+            self.index = validate(document=self.load())
+            self.fetched = time.monotonic()
+
+        return self.index
+
+
+class FileIndexProvider(IndexProvider):
+    """Reads the index from a JSON file, e.g. written by a CI job; re-read on change"""
+
+    def __init__(self, source: str):
+        super().__init__(source=source)
+        self.mtime = None
+        self.changed_mtime = None
+
+    def is_outdated(self) -> bool:
+        """
+        Returns:
+            - bool: Whether the index file changed since it was last read
+        """
+        if not super().is_outdated():
+            return False
+
+        mtime = os.stat(self.source).st_mtime_ns
+        if mtime == self.mtime:
+            self.fetched = time.monotonic()
+            return False
+
+        self.changed_mtime = mtime
+        return True
+
+    def fetch(self) -> Dict[str, List[dict]]:
+        """
+        Get the index, reading the file again only if it changed. Its modification time
+        is only kept once the file was read & parsed, so a failed read is retried.
+
+        Returns:
+            - dict: Posix directory keys, lists of script dictionaries values
+        """
+        index = super().fetch()
+        if self.changed_mtime is not None:
+            self.mtime, self.changed_mtime = self.changed_mtime, None
+
+        return index
+
+    def load(self) -> dict:
+        """
+        Returns:
+            - dict: Index document read from the file
+        """
+        return json.loads(Path(self.source).read_text(encoding="utf-8"))
+
+
+class ServiceIndexProvider(IndexProvider):
+    """Fetches the index from a central service in a single HTTP request"""
+
+    def load(self) -> dict:
+        """
+        Returns:
+            - dict: Index document served at the source URL
+        """
+        with urllib.request.urlopen(self.source, timeout=REQUEST_TIMEOUT) as response:
+            return json.loads(response.read().decode("utf-8"))
+
+
+def provider(source: str) -> IndexProvider | None:
+    """
+    Get the provider for an index source, re-using existing instances.
+
+    Parameters:
+        - source (str): Index file path or http(s) URL; empty to disable
+
+    Returns:
+        - IndexProvider | None
+    """
+    if not source:
+        return None
+
+    if source not in PROVIDERS:
+        if source.startswith(("http://", "https://")):
+            PROVIDERS[source] = ServiceIndexProvider(source=source)
+        else:
+            PROVIDERS[source] = FileIndexProvider(source=source)
+
+    return PROVIDERS[source]
+
+
+########################################################################################
+# Index generation
+########################################################################################
+
+
+def index_directory(directory: str | Path) -> List[dict]:
+    """
+    Generate the index entries of all scripts within a directory.
+
+    Parameters:
+        - directory (str | Path)
+
+    Returns:
+        - list of dict: Sorted script dictionaries
+    """
+    scripts = []
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if not entry.name.endswith(".py") or not entry.is_file():
+                continue
+
+            stat = entry.stat()
+            scripts.append(
+                {
+                    "name": entry.name,
+                    "size": stat.st_size,
+                    "mtime": stat.st_mtime_ns,
+                    "hash": hashlib.blake2b(Path(entry.path).read_bytes()).hexdigest(),
+                }
+            )
+
+    return sorted(scripts, key=lambda script: script["name"])
+
+
+def write_index(directories: List[str | Path], filepath: str | Path):
+    """
+    Index several directories and write the index to a JSON file.
+
+    Parameters:
+        - directories (list of str | Path)
+        - filepath (str | Path)
+    """
+    document = {
+        "version": INDEX_VERSION,
+        "directories": {
+            Path(directory).resolve().as_posix(): index_directory(directory=directory)
+            for directory in directories
+        },
+    }
+
+    # Replace atomically, clients may read at any time
+    temp_path = Path(f"{filepath}.tmp")
+    temp_path.write_text(json.dumps(document), encoding="utf-8")
+    os.replace(temp_path, filepath)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Write a Shelf Made script index")
+    parser.add_argument("directories", nargs="+", help="Shelf directories to index")
+    parser.add_argument("-o", "--output", required=True, help="Index file path")
+    arguments = parser.parse_args()
+
+    write_index(directories=arguments.directories, filepath=arguments.output)
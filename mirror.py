@@ -0,0 +1,304 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Dict, List, Tuple
+
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+
+import bpy
+
+from . import preferences
+
+
+########################################################################################
+# Statics
+########################################################################################
+
+
+# Name of the file holding the state of a mirrored directory; hidden, as hidden source
+# files are not mirrored
+MANIFEST_NAME = ".manifest.json"
+
+# Manifest name of earlier versions, removed from mirrors when syncing
+LEGACY_MANIFEST_NAME = "manifest.json"
+
+# Source directories that are not mirrored
+SKIPPED_DIRECTORIES = {"__pycache__"}
+
+# Seconds between two background syncs
+SYNC_INTERVAL = 60.0
+
+# Seconds between two checks whether a running sync has finished
+POLL_INTERVAL = 0.5
+
+# Background sync state; the worker thread only ever writes 'changed'
+SYNC = {"thread": None, "changed": False, "next": 0.0}
+
+
+########################################################################################
+# Paths
+########################################################################################
+
+
+def mirror_root() -> Path | None:
+    """
+    Get the root directory of all mirrors, if mirroring is enabled.
+
+    Returns:
+        - Path | None: Mirror root, None if disabled
+    """
+    prefs = preferences.Preferences.this()
+    if not prefs.use_mirror:
+        return None
+
+    if prefs.mirror_directory:
+        return Path(bpy.path.abspath(prefs.mirror_directory))
+
+    return Path(bpy.utils.user_resource("CONFIG", path="shelfmade/mirror"))
+
+
+def mirror_path(root: Path, directory: str) -> Path:
+    """
+    Generate the mirror location for a shelf directory.
+
+    Parameters:
+        - root (Path): Mirror root
+        - directory (str): Source shelf directory
+
+    Returns:
+        - Path
+    """
+    name = hashlib.blake2b(directory.encode("utf-8"), digest_size=8).hexdigest()
+    return root / name
+
+
+def local_directory(directory: str) -> Path | None:
+    """
+    Get the mirror of a shelf directory, if mirroring is enabled and the mirror has
+    been synced at least once.
+
+    Parameters:
+        - directory (str): Source shelf directory
+
+    Returns:
+        - Path | None: Local mirror directory
+    """
+    root = mirror_root()
+    if not root or not directory:
+        return None
+
+    path = mirror_path(root=root, directory=directory)
+    if (path / MANIFEST_NAME).is_file():
+        return path
+
+
+########################################################################################
+# Sync
+########################################################################################
+
+
+def read_manifest(path: Path) -> Dict[str, dict]:
+    """
+    Read the manifest of a mirror directory.
+
+    Parameters:
+        - path (Path): Mirror directory
+
+    Returns:
+        - dict: File name keys, dictionaries with 'size', 'mtime' & 'hash' values
+    """
+    try:
+        return json.loads((path / MANIFEST_NAME).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+def list_files(directory: str, prefix: str = "") -> List[Tuple[str, str, int, int]]:
+    """
+    List all files within a source directory & its sub-directories, skipping hidden
+    entries and Python caches. Symbolic links to directories are not followed.
+
+    Parameters:
+        - directory (str)
+        - prefix (str): Relative posix path of the directory, for recursion
+
+    Returns:
+        - list of tuple: Relative posix path, file path, size & modification time in
+          nanoseconds of each file
+    """
+    files = []
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.name.startswith(".") or entry.name in SKIPPED_DIRECTORIES:
+                continue
+
+            name = prefix + entry.name
+            if entry.is_dir(follow_symlinks=False):
+                files += list_files(directory=entry.path, prefix=f"{name}/")
+            elif entry.is_file():
+                stat = entry.stat()
+                files.append((name, entry.path, stat.st_size, stat.st_mtime_ns))
+
+    return files
+
+
+def sync_directory(root: Path, directory: str) -> bool:
+    """
+    Bring the mirror of a shelf directory up to date. The whole directory is mirrored,
+    so scripts find data files & modules next to them. Files are only read if their
+    size or modification time changed, and only written if their content hash changed.
+    Never touches bpy, so it is safe to call from a worker thread.
+
+    Parameters:
+        - root (Path): Mirror root
+        - directory (str): Source shelf directory
+
+    Returns:
+        - bool: Whether the mirrored file list or any file changed
+    """
+    path = mirror_path(root=root, directory=directory)
+    manifest = read_manifest(path=path)
+    new_manifest = {}
+    changed = not (path / MANIFEST_NAME).is_file()
+
+    # List source, keep the existing mirror if the source is unreachable
+    try:
+        files = list_files(directory=directory)
+    except OSError:
+        return False
+
+    path.mkdir(parents=True, exist_ok=True)
+    for name, source_path, size, mtime in files:
+        state = manifest.get(name)
+        mirrored_path = path / name
+
+        # Unchanged stat, skip reading
+        if (
+            state
+            and state["size"] == size
+            and state["mtime"] == mtime
+            and mirrored_path.is_file()
+        ):
+            new_manifest[name] = state
+            continue
+
+        # Copy if content changed
+        try:
+            data = Path(source_path).read_bytes()
+        except OSError:
+            if state:
+                new_manifest[name] = state
+            continue
+
+        digest = hashlib.blake2b(data).hexdigest()
+        if not state or state["hash"] != digest or not mirrored_path.is_file():
+            mirrored_path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = mirrored_path.with_name(f".{mirrored_path.name}.tmp")
+            temp_path.write_bytes(data)
+            os.replace(temp_path, mirrored_path)
+            changed = True
+
+        new_manifest[name] = {"size": size, "mtime": mtime, "hash": digest}
+
+    # Remove the manifest of earlier versions, unless it is a mirrored file
+    if LEGACY_MANIFEST_NAME not in new_manifest:
+        (path / LEGACY_MANIFEST_NAME).unlink(missing_ok=True)
+
+    # Remove files that vanished from the source
+    for name in set(manifest) - set(new_manifest):
+        (path / name).unlink(missing_ok=True)
+        changed = True
+
+    # Write manifest
+    (path / MANIFEST_NAME).write_text(json.dumps(new_manifest), encoding="utf-8")
+
+    return changed
+
+
+def sync_directories(root: Path, directories: List[str]):
+    """
+    Sync several shelf directories and flag whether any of them changed.
+
+    Parameters:
+        - root (Path): Mirror root
+        - directories (list of str): Source shelf directories
+    """
+    changed = False
+    for directory in directories:
+        try:
+            changed = sync_directory(root=root, directory=directory) or changed
+        except OSError as e:
+            print(f"Could not mirror {directory}: {e}")
+
+    SYNC["changed"] = changed
+
+
+def sync_timer() -> float | None:
+    """
+    Start background syncs at regular intervals and re-initialize the shelves once a
+    sync has changed any mirror.
+
+    Returns:
+        - float | None: Seconds until the next call, None to stop
+    """
+    # Wait for running sync
+    thread = SYNC["thread"]
+    if thread and thread.is_alive():
+        return POLL_INTERVAL
+
+    prefs = preferences.Preferences.this()
+
+    # Sync finished
+    if thread:
+        SYNC["thread"] = None
+        if SYNC["changed"]:
+            prefs.initialize_shelves()
+            for window in bpy.context.window_manager.windows:
+                for area in window.screen.areas:
+                    area.tag_redraw()
+
+    # Mirroring disabled
+    root = mirror_root()
+    if not root:
+        return None
+
+    # Start next sync
+    if time.monotonic() >= SYNC["next"]:
+        SYNC["next"] = time.monotonic() + SYNC_INTERVAL
+        directories = [shelf.directory for shelf in prefs.shelves if shelf.directory]
+        thread = threading.Thread(
+            target=sync_directories,
+            args=(root, directories),
+            daemon=True,
+        )
+        SYNC["thread"] = thread
+        thread.start()
+        return POLL_INTERVAL
+
+    return SYNC["next"] - time.monotonic()
+
+
+def start():
+    """
+    (Re-)start the background sync timer, syncing right away, if mirroring is enabled.
+    """
+    SYNC["next"] = 0.0
+    if not mirror_root():
+        return
+
+    stop()
+    bpy.app.timers.register(sync_timer, persistent=True)
+
+
+def stop():
+    """
+    Stop the background sync timer. A running sync is left to finish on its own.
+    """
+    if bpy.app.timers.is_registered(sync_timer):
+        bpy.app.timers.unregister(sync_timer)
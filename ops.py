@@ -4,8 +4,10 @@ from typing import Literal, Set, TYPE_CHECKING
 if TYPE_CHECKING:
     from typing import List, Tuple
     from bpy.types import Context, Event, Text
-    from . import shelf
 
+import os
+import sys
+import time
 from pathlib import Path
 
 import bpy
@@ -13,7 +15,25 @@ from bpy.props import BoolProperty, EnumProperty, IntProperty, StringProperty
 from bpy.types import Operator
 from bpy_extras import io_utils
 
-from . import catalogue, draw, preferences, utils
+from . import (
+    areas,
+    catalogue,
+    cli,
+    config,
+    draw,
+    events,
+    fanout,
+    hashing,
+    mirror,
+    pool,
+    preferences,
+    runner,
+    sandbox,
+    shelf,
+    tasks,
+    usage,
+    utils,
+)
 
 
 OPERATOR_RETURN_ITEMS = Set[
@@ -140,7 +160,8 @@ class SHELFMADE_OT_AddShelf(Operator, io_utils.ImportHelper):
             shelf: shelf.Shelf
 
         # Add a new shelf
-        shelf = preferences.Preferences.this().shelves.add()
+        prefs = preferences.Preferences.this()
+        shelf = prefs.shelves.add()
 
         # Set its directory and name
         if self.directory:
@@ -149,11 +170,40 @@ class SHELFMADE_OT_AddShelf(Operator, io_utils.ImportHelper):
 
         # Set editor visibility
         if self.add_to_all_editors:
-            for area_type in draw.AREA_TYPES.keys():
-                setattr(shelf, f"enabled_{area_type.lower()}", True)
+            shelf.visibility = areas.ALL_AREAS
+
+        # Update shelf panels
+        prefs.register_panels()
 
         # Save user preferences
-        bpy.ops.wm.save_userpref()
+        utils.save_userpref()
+
+        return {"FINISHED"}
+
+
+@catalogue.bpy_register
+class SHELFMADE_OT_CancelScript(Operator):
+    """Cancel this running script"""
+
+    bl_idname = "shelfmade.cancel_script"
+    bl_label = "Cancel Script"
+    bl_options = {"INTERNAL"}
+
+    filepath: StringProperty(name="Script Path")
+
+    def execute(self, context: Context) -> OPERATOR_RETURN_ITEMS:
+        """
+        Request cancellation of a running async script. The script is stopped at its
+        next 'await'.
+
+        Parameters:
+            - context (Context)
+
+        Returns:
+            - set of str: CANCELLED, FINISHED, INTERFACE, PASS_THROUGH, RUNNING_MODAL
+        """
+        if not tasks.cancel(path=self.filepath):
+            return {"CANCELLED"}
 
         return {"FINISHED"}
 
@@ -195,7 +245,7 @@ class SHELFMADE_OT_CleanShelves(Operator):
         preferences.Preferences.this().clean()
 
         # Save user preferences
-        bpy.ops.wm.save_userpref()
+        utils.save_userpref()
 
         # Redraw UI
         context.area.tag_redraw()
@@ -219,6 +269,11 @@ class SHELFMADE_OT_CallScriptMenu(Operator):
             ("OPEN", "Open", "Open this script in the editor", "GREASEPENCIL", 2),
             ("UP", "Move Up", "Move this script up in the list", "TRIA_UP", 3),
             ("DOWN", "Move Down", "Move this script down in the list", "TRIA_DOWN", 4),
+            ("POSITION", "Move To", "Move this script to any position", "SORTSIZE", 5),
+            ("SORT", "Sort Scripts", "Sort all scripts of this shelf", "SORTALPHA", 6),
+            ("ISOLATED", "Run Isolated", "Run in a separate process", "LOCKED", 7),
+            ("OPTIONS", "Run Options", "Set undo & context", "PREFERENCES", 8),
+            ("FILES", "Run on Files", "Run in many blend files", "FILE_BLEND", 9),
         ),
         name="Mode",
     )
@@ -254,7 +309,7 @@ class SHELFMADE_OT_CallScriptMenu(Operator):
                 filepath=str(
                     preferences.Preferences.this()
                     .shelves[self.index]
-                    .script_path(script=self.script)
+                    .script_path(script=self.script, source=True)
                 ),
             )
 
@@ -266,6 +321,46 @@ class SHELFMADE_OT_CallScriptMenu(Operator):
                 direction=self.mode,
             )
 
+        elif self.mode == "POSITION":
+            bpy.ops.shelfmade.set_script_position(
+                "INVOKE_DEFAULT",
+                index=self.index,
+                script=self.script,
+            )
+
+        elif self.mode == "SORT":
+            bpy.ops.shelfmade.sort_scripts(
+                "INVOKE_DEFAULT",
+                index=self.index,
+            )
+
+        elif self.mode == "OPTIONS":
+            bpy.ops.shelfmade.set_script_options(
+                "INVOKE_DEFAULT",
+                index=self.index,
+                script=self.script,
+            )
+
+        elif self.mode == "FILES":
+            bpy.ops.shelfmade.run_files(
+                "INVOKE_DEFAULT",
+                filepath=str(
+                    preferences.Preferences.this()
+                    .shelves[self.index]
+                    .script_path(script=self.script)
+                ),
+            )
+
+        elif self.mode == "ISOLATED":
+            bpy.ops.shelfmade.run_isolated(
+                "INVOKE_DEFAULT",
+                filepath=str(
+                    preferences.Preferences.this()
+                    .shelves[self.index]
+                    .script_path(script=self.script)
+                ),
+            )
+
         return {"FINISHED"}
 
 
@@ -287,6 +382,8 @@ class SHELFMADE_OT_CallShelfMenu(Operator):
             ("REMOVE", "Remove", "Remove this shelf", "X", 4),
             ("UP", "Move Up", "Move this shelf up in the list", "TRIA_UP", 5),
             ("DOWN", "Move Down", "Move this shelf down in the list", "TRIA_DOWN", 6),
+            ("POSITION", "Move To", "Move this shelf to any position", "SORTSIZE", 7),
+            ("SORT", "Sort Scripts", "Sort all scripts of this shelf", "SORTALPHA", 8),
         ),
         name="Mode",
     )
@@ -337,6 +434,18 @@ class SHELFMADE_OT_CallShelfMenu(Operator):
                 direction=self.mode,
             )
 
+        elif self.mode == "POSITION":
+            bpy.ops.shelfmade.set_shelf_position(
+                "INVOKE_DEFAULT",
+                index=self.index,
+            )
+
+        elif self.mode == "SORT":
+            bpy.ops.shelfmade.sort_scripts(
+                "INVOKE_DEFAULT",
+                index=self.index,
+            )
+
         return {"FINISHED"}
 
 
@@ -384,7 +493,135 @@ class SHELFMADE_OT_EditShelfVisibility(Operator):
             - set of str: CANCELLED, FINISHED, INTERFACE, PASS_THROUGH, RUNNING_MODAL
         """
         # Save user preferences
-        bpy.ops.wm.save_userpref()
+        utils.save_userpref()
+
+        return {"FINISHED"}
+
+
+@catalogue.bpy_register
+class SHELFMADE_OT_ExportConfig(Operator, io_utils.ExportHelper):
+    """Export the configuration of all shelves and scripts as a JSON file"""
+
+    bl_idname = "shelfmade.export_config"
+    bl_label = "Export Shelf Configuration"
+    bl_options = {"INTERNAL"}
+
+    filename_ext = ".json"
+    filter_glob: StringProperty(default="*.json", options={"HIDDEN"})
+
+    def execute(self, context: Context) -> OPERATOR_RETURN_ITEMS:
+        """
+        Write the shelf configuration to the selected file.
+
+        Parameters:
+            - context (Context)
+
+        Returns:
+            - set of str: CANCELLED, FINISHED, INTERFACE, PASS_THROUGH, RUNNING_MODAL
+        """
+        config.write_config(filepath=self.filepath)
+
+        return {"FINISHED"}
+
+
+@catalogue.bpy_register
+class SHELFMADE_OT_ExportEvents(Operator, io_utils.ExportHelper):
+    """Export the event log as a JSON Lines file"""
+
+    bl_idname = "shelfmade.export_events"
+    bl_label = "Export Event Log"
+    bl_options = {"INTERNAL"}
+
+    filename_ext = ".jsonl"
+    filter_glob: StringProperty(default="*.jsonl", options={"HIDDEN"})
+
+    def execute(self, context: Context) -> OPERATOR_RETURN_ITEMS:
+        """
+        Write all buffered events to the selected file.
+
+        Parameters:
+            - context (Context)
+
+        Returns:
+            - set of str: CANCELLED, FINISHED, INTERFACE, PASS_THROUGH, RUNNING_MODAL
+        """
+        count = events.export(filepath=self.filepath)
+        self.report({"INFO"}, f"Exported {count} events to {self.filepath}")
+
+        return {"FINISHED"}
+
+
+@catalogue.bpy_register
+class SHELFMADE_OT_ExportFileReport(Operator, io_utils.ExportHelper):
+    """Export the results of the last run on many files as a CSV file"""
+
+    bl_idname = "shelfmade.export_file_report"
+    bl_label = "Export File Report"
+    bl_options = {"INTERNAL"}
+
+    filename_ext = ".csv"
+    filter_glob: StringProperty(default="*.csv", options={"HIDDEN"})
+
+    def execute(self, context: Context) -> OPERATOR_RETURN_ITEMS:
+        """
+        Write the per-file results, timings & errors to the selected file.
+
+        Parameters:
+            - context (Context)
+
+        Returns:
+            - set of str: CANCELLED, FINISHED, INTERFACE, PASS_THROUGH, RUNNING_MODAL
+        """
+        count = fanout.write_report(filepath=self.filepath)
+        self.report({"INFO"}, f"Exported {count} file results to {self.filepath}")
+
+        return {"FINISHED"}
+
+
+@catalogue.bpy_register
+class SHELFMADE_OT_ImportConfig(Operator, io_utils.ImportHelper):
+    """Apply a shelf configuration file, changing only what differs"""
+
+    bl_idname = "shelfmade.import_config"
+    bl_label = "Import Shelf Configuration"
+    bl_options = {"INTERNAL"}
+
+    filter_glob: StringProperty(default="*.json;*.toml", options={"HIDDEN"})
+    remove_missing: BoolProperty(
+        name="Remove Other Shelves",
+        description="Remove all shelves that are not part of the configuration",
+        default=False,
+    )
+
+    def execute(self, context: Context) -> OPERATOR_RETURN_ITEMS:
+        """
+        Read the selected configuration file and apply it. Redraw the current area.
+
+        Parameters:
+            - context (Context)
+
+        Returns:
+            - set of str: CANCELLED, FINISHED, INTERFACE, PASS_THROUGH, RUNNING_MODAL
+        """
+        try:
+            shelf_config = config.read_config(filepath=self.filepath)
+        except (OSError, ValueError, ImportError) as e:
+            self.report({"ERROR"}, f"Could not read {self.filepath}: {e}")
+            return {"CANCELLED"}
+
+        try:
+            changes = config.apply_config(
+                config=shelf_config,
+                remove_missing=self.remove_missing,
+            )
+        except ValueError as e:
+            self.report({"ERROR"}, f"Could not apply {self.filepath}: {e}")
+            return {"CANCELLED"}
+
+        self.report({"INFO"}, f"Applied {changes} changes")
+
+        # Redraw UI
+        context.area.tag_redraw()
 
         return {"FINISHED"}
 
@@ -418,21 +655,27 @@ class SHELFMADE_OT_MoveScript(Operator):
         Returns:
             - set of str: CANCELLED, FINISHED, INTERFACE, PASS_THROUGH, RUNNING_MODAL
         """
-        scripts = preferences.Preferences.this().shelves[self.index].scripts
-        current_index = scripts.find(self.script)
+        if TYPE_CHECKING:
+            shelf: shelf.Shelf
+
+        shelf = preferences.Preferences.this().shelves[self.index]
+        file_names = shelf.script_names()
+        if self.script not in file_names:
+            return {"CANCELLED"}
 
         # Get new index
+        current_index = file_names.index(self.script)
         new_index = current_index - 1 if self.direction == "UP" else current_index + 1
 
         # Don't move past first or last position
-        if current_index < 0 or current_index >= len(scripts):
+        if new_index < 0 or new_index >= len(file_names):
             return {"CANCELLED"}
 
-        # Move
-        scripts.move(current_index, new_index)
+        # Move, storing the new order
+        shelf.move_script(script=self.script, index=new_index)
 
         # Save user preferences
-        bpy.ops.wm.save_userpref()
+        utils.save_userpref()
 
         return {"FINISHED"}
 
@@ -498,7 +741,7 @@ class SHELFMADE_OT_MoveShelf(Operator):
         shelves.move(self.index, new_index)
 
         # Save user preferences
-        bpy.ops.wm.save_userpref()
+        utils.save_userpref()
 
         return {"FINISHED"}
 
@@ -560,7 +803,7 @@ class SHELFMADE_OT_OpenScript(Operator, io_utils.ImportHelper):
             script = utils.open_script_file(filepath=script_path)
 
         # Ensure text editor
-        if context.area.ui_type in draw.AREA_TYPES.keys():
+        if context.area.ui_type in areas.AREA_BITS:
             area = utils.find_or_create_area(
                 context=context,
                 type="TEXT_EDITOR",
@@ -611,7 +854,7 @@ class SHELFMADE_OT_Reload(Operator):
         preferences.Preferences.this().initialize_shelves()
 
         # Save user preferences
-        bpy.ops.wm.save_userpref()
+        utils.save_userpref()
 
         # Redraw UI
         context.area.tag_redraw()
@@ -658,11 +901,12 @@ class SHELFMADE_OT_RemoveShelf(Operator):
         prefs = preferences.Preferences.this()
         prefs.shelves.remove(self.index)
 
-        # Re-initialize existing shelves
+        # Re-initialize existing shelves & update shelf panels
         prefs.initialize_shelves()
+        prefs.register_panels()
 
         # Save user preferences
-        bpy.ops.wm.save_userpref()
+        utils.save_userpref()
 
         # Redraw UI
         context.area.tag_redraw()
@@ -699,8 +943,8 @@ class SHELFMADE_OT_RenameScript(Operator):
 
         # Store current name
         shelf = preferences.Preferences.this().shelves[self.index]
-        script = shelf.scripts[self.script]
-        self.name = script.display_name
+        script = shelf.scripts.get(self.script)
+        self.name = script.display_name if script else Path(self.script).stem
 
         # Draw dialog
         return context.window_manager.invoke_props_dialog(self)
@@ -713,19 +957,13 @@ class SHELFMADE_OT_RenameScript(Operator):
         Parameters:
             - context (Context)
         """
-        if TYPE_CHECKING:
-            script: shelf.Script
-            shelf: shelf.Shelf
-
         layout = self.layout
-        shelf = preferences.Preferences.this().shelves[self.index]
-        script = shelf.scripts[self.script]
 
         # Original file name
         row_original = layout.row()
         row_original.enabled = False
         row_original.label(text="", icon="FILE")
-        row_original.prop(data=script, property="name", text="")
+        row_original.prop(data=self, property="script", text="")
 
         # Script name
         row_new = layout.row()
@@ -752,13 +990,13 @@ class SHELFMADE_OT_RenameScript(Operator):
         if not self.name:
             return {"CANCELLED"}
 
-        # Rename
+        # Rename, storing the customization
         shelf = preferences.Preferences.this().shelves[self.index]
-        script = shelf.scripts[self.script]
+        script = shelf.script_override(script=self.script)
         script.display_name = self.name
 
         # Save user preferences
-        bpy.ops.wm.save_userpref()
+        utils.save_userpref()
 
         # Redraw UI
         context.area.tag_redraw()
@@ -826,7 +1064,7 @@ class SHELFMADE_OT_RenameShelf(Operator):
         preferences.Preferences.this().shelves[self.index].name = self.name
 
         # Save user preferences
-        bpy.ops.wm.save_userpref()
+        utils.save_userpref()
 
         # Redraw UI
         context.area.tag_redraw()
@@ -835,18 +1073,40 @@ class SHELFMADE_OT_RenameShelf(Operator):
 
 
 @catalogue.bpy_register
-class SHELFMADE_OT_RunScript(Operator, io_utils.ImportHelper):
-    """Execute this Python script file"""
+class SHELFMADE_OT_RunFiles(Operator):
+    """Run this script in many blend files, in background Blender processes"""
 
-    bl_idname = "wm.run_script"
-    bl_label = "Run Script"
-    bl_options = {"UNDO"}
+    bl_idname = "shelfmade.run_files"
+    bl_label = "Run on Files"
+    bl_options = {"INTERNAL"}
 
     filepath: StringProperty(name="File Path", subtype="FILE_PATH")
+    files: StringProperty(
+        name="Blend Files",
+        description="Directory or glob pattern of blend files, e.g. /shots/**/*.blend",
+    )
+    files_per_process: IntProperty(
+        name="Files per Process",
+        description="Files opened one by one in each Blender process",
+        default=4,
+        min=1,
+        soft_max=50,
+    )
+    jobs: IntProperty(
+        name="Processes",
+        description="Blender processes running at once, 0 for one per CPU",
+        default=0,
+        min=0,
+        soft_max=32,
+    )
+    save: BoolProperty(
+        name="Save Files",
+        description="Save each file after running the script",
+    )
 
     def invoke(self, context: Context, event: Event) -> OPERATOR_RETURN_ITEMS:
         """
-        Open the file browser dialog for script file selection.
+        Invoke the operator properties dialog, suggesting the current file's directory.
 
         Parameters:
             - context (Context)
@@ -855,14 +1115,16 @@ class SHELFMADE_OT_RunScript(Operator, io_utils.ImportHelper):
         Returns:
             - set of str: CANCELLED, FINISHED, INTERFACE, PASS_THROUGH, RUNNING_MODAL
         """
-        context.window_manager.fileselect_add(self)
+        if not self.files and bpy.data.filepath:
+            self.files = str(Path(bpy.data.filepath).parent)
 
-        return {"RUNNING_MODAL"}
+        return context.window_manager.invoke_props_dialog(self)
 
     def execute(self, context: Context) -> OPERATOR_RETURN_ITEMS:
         """
-        Load a script file as a text datablock into the current blend file. Run it and
-        remove it right after. Raise any exceptions that might have occured afterwards.
+        Start running a script in all matching blend files in the background. Results,
+        timings & errors of each file are shown in the file report panel. The run is
+        listed with all running scripts and can be cancelled.
 
         Parameters:
             - context (Context)
@@ -870,93 +1132,98 @@ class SHELFMADE_OT_RunScript(Operator, io_utils.ImportHelper):
         Returns:
             - set of str: CANCELLED, FINISHED, INTERFACE, PASS_THROUGH, RUNNING_MODAL
         """
-        # Check the script
         script_path = Path(self.filepath)
         if not script_path.exists():
             print(f"Script file {self.filepath} not found")
             return {"CANCELLED"}
 
-        # Exception store
-        exception = None
-
-        # Run script
-        text = utils.open_script_file(filepath=script_path)
-        with context.temp_override(edit_text=text):
-            try:
-                bpy.ops.text.run_script()
+        if tasks.is_running(path=script_path):
+            self.report({"WARNING"}, f"{script_path.name} is still running")
+            return {"CANCELLED"}
 
-            # If the script causes an exception, store it for later
-            except Exception as e:
-                exception = e
+        blocked = preferences.Preferences.this().verify_script(path=script_path)
+        if blocked:
+            self.report({"ERROR"}, blocked)
+            return {"CANCELLED"}
 
-        # Remove script
-        try:
-            bpy.data.texts.remove(text)
-        except ReferenceError:
-            print("Could not delete script, already removed")
+        # Find the files
+        files = [
+            blend_file
+            for blend_file in cli.expand_files(
+                patterns=[os.path.expanduser(self.files)]
+            )
+            if blend_file.endswith(".blend") and Path(blend_file).is_file()
+        ]
+        if not files:
+            self.report({"ERROR"}, f"No blend files found in {self.files}")
+            return {"CANCELLED"}
 
-        # Raise potential exception after cleanup
-        if exception:
-            raise exception
+        usage.record_run(path=script_path)
+        fanout.start(
+            script_path=script_path,
+            files=files,
+            jobs=self.jobs,
+            files_per_process=self.files_per_process,
+            save=self.save,
+        )
+        self.report({"INFO"}, f"Running {script_path.name} in {len(files)} files")
 
         return {"FINISHED"}
 
 
 @catalogue.bpy_register
-class SHELFMADE_OT_RunText(Operator):
-    """Execute this local text datablock"""
+class SHELFMADE_OT_RunIsolated(Operator):
+    """Run this script in a separate process; a crash does not affect this session"""
 
-    bl_idname = "wm.run_text"
-    bl_label = "Run Text Datablock"
-    bl_options = {"UNDO"}
+    bl_idname = "shelfmade.run_isolated"
+    bl_label = "Run Isolated"
+    bl_options = {"INTERNAL"}
 
-    name: StringProperty(name="Text Name")
+    filepath: StringProperty(name="File Path", subtype="FILE_PATH")
+    mode: EnumProperty(
+        items=(
+            ("PYTHON", "Python", "Run as pure Python script, without bpy", 0),
+            ("BLENDER", "Blender", "Run in a background Blender process", 1),
+        ),
+        name="Process",
+    )
+    use_blend_file: BoolProperty(
+        name="Open Saved File",
+        description="Open the last saved state of the current file in Blender first",
+        default=True,
+    )
 
-    def execute(self, context: Context) -> OPERATOR_RETURN_ITEMS:
+    def invoke(self, context: Context, event: Event) -> OPERATOR_RETURN_ITEMS:
         """
-        Run a text datablock from within the current blend file.
+        Invoke the operator properties dialog to choose the process.
 
         Parameters:
             - context (Context)
+            - event (Event)
 
         Returns:
             - set of str: CANCELLED, FINISHED, INTERFACE, PASS_THROUGH, RUNNING_MODAL
         """
-        # Run the local script using the basic operator
-        with context.temp_override(edit_text=bpy.data.texts[self.name]):
-            bpy.ops.text.run_script()
-
-        return {"FINISHED"}
-
-
-@catalogue.bpy_register
-class SHELFMADE_OT_SaveTextToShelf(Operator):
-    """Save this text datablock to a shelf directory"""
-
-    bl_idname = "text.save_text_to_shelf"
-    bl_label = "Save To Shelf"
-    bl_options = {"INTERNAL"}
-
-    shelf: EnumProperty(items=enum_shelves, name="Shelf")
+        return context.window_manager.invoke_props_dialog(self)
 
-    @classmethod
-    def poll(cls, context: Context) -> bool:
+    def draw(self, context: Context):
         """
-        Make this operator availble in the text editor if there's an active text
-        datablock.
+        Draw the process options.
 
         Parameters:
             - context (Context)
-
-        Returns:
-            - bool: Whether this operator is available or not
         """
-        return context.area.type == "TEXT_EDITOR" and context.space_data.text
+        layout = self.layout
+        layout.prop(data=self, property="mode", expand=True)
+        row_blend = layout.row()
+        row_blend.enabled = self.mode == "BLENDER" and bool(bpy.data.filepath)
+        row_blend.prop(data=self, property="use_blend_file")
 
     def execute(self, context: Context) -> OPERATOR_RETURN_ITEMS:
         """
-        Save the currently opened text datablock to selected shelf.
-        Re-initiate the shelf. Save user preferences
+        Start a script in a separate process in the background. Its results are kept
+        as the script's last isolated results; failures are reported in the console &
+        event log. The run is listed with all running scripts and can be cancelled.
 
         Parameters:
             - context (Context)
@@ -964,41 +1231,376 @@ class SHELFMADE_OT_SaveTextToShelf(Operator):
         Returns:
             - set of str: CANCELLED, FINISHED, INTERFACE, PASS_THROUGH, RUNNING_MODAL
         """
-        if TYPE_CHECKING:
-            shelf: shelf.Shelf
-            text: Text
-
-        # Cancel if no shelves are available
-        if self.shelf == "NONE":
+        script_path = Path(self.filepath)
+        if not script_path.exists():
+            print(f"Script file {self.filepath} not found")
             return {"CANCELLED"}
 
-        # Ensure python extension
-        text = context.space_data.text
-        if not text.name.endswith(".py"):
-            text.name += ".py"
+        if tasks.is_running(path=script_path):
+            self.report({"WARNING"}, f"{script_path.name} is still running")
+            return {"CANCELLED"}
 
-        # Save text
-        shelf = preferences.Preferences.this().shelves[int(self.shelf)]
-        filepath = str(Path(shelf.directory, text.name))
-        bpy.ops.text.save_as("EXEC_DEFAULT", filepath=filepath)
+        # Isolation does not replace the allowlist
+        prefs = preferences.Preferences.this()
+        blocked = prefs.verify_script(path=script_path)
+        if blocked:
+            self.report({"ERROR"}, blocked)
+            return {"CANCELLED"}
 
-        # Reload shelf
-        shelf.initialize_scripts()
+        # The process only runs the content verified here
+        digest = None
+        allowed = prefs.allowed_hashes()
+        if allowed is not None:
+            digest = hashing.data_hash(data=script_path.read_bytes())
+            if digest not in allowed:
+                events.log(kind="run_blocked", path=script_path.as_posix())
+                self.report({"ERROR"}, f"{script_path.name} is not on the allowlist")
+                return {"CANCELLED"}
+
+        # Start the process
+        if self.mode == "PYTHON":
+            coroutine = sandbox.run_isolated(
+                script_path=script_path,
+                python=sys.executable,
+                digest=digest,
+            )
+        elif pool.is_running():
+            coroutine = pool.run(
+                script_path=script_path,
+                blend_file=bpy.data.filepath if self.use_blend_file else None,
+                digest=digest,
+            )
+        else:
+            coroutine = sandbox.run_isolated(
+                script_path=script_path,
+                blender=bpy.app.binary_path,
+                blend_file=bpy.data.filepath if self.use_blend_file else None,
+                digest=digest,
+            )
 
-        # Save user preferences
-        bpy.ops.wm.save_userpref()
+        usage.record_run(path=script_path)
+        tasks.start(path=script_path, coroutine=coroutine)
 
         return {"FINISHED"}
 
 
-@catalogue.bpy_register
-class SHELFMADE_OT_SetScriptIcon(Operator):
-    """Select an icon for this script"""
+class RunScript(Operator, io_utils.ImportHelper):
+    """Base of the script run operators, registered once per undo policy"""
 
-    bl_idname = "shelfmade.set_script_icon"
-    bl_label = "Set Script Icon"
-    bl_options = {"INTERNAL"}
-    bl_property = "icon"
+    bl_label = "Run Script"
+
+    filepath: StringProperty(
+        name="File Path",
+        subtype="FILE_PATH",
+        options={"SKIP_SAVE"},
+    )
+
+    def invoke(self, context: Context, event: Event) -> OPERATOR_RETURN_ITEMS:
+        """
+        Run a script invoked from a shelf button right away, handing the event to the
+        script's 'invoke' hook, else open the file browser dialog for script file
+        selection.
+
+        Parameters:
+            - context (Context)
+            - event (Event)
+
+        Returns:
+            - set of str: CANCELLED, FINISHED, INTERFACE, PASS_THROUGH, RUNNING_MODAL
+        """
+        if self.filepath:
+            return self.run(context=context, event=event)
+
+        context.window_manager.fileselect_add(self)
+
+        return {"RUNNING_MODAL"}
+
+    def execute(self, context: Context) -> OPERATOR_RETURN_ITEMS:
+        """
+        Run a script file without an event; its 'invoke' hook is not called.
+
+        Parameters:
+            - context (Context)
+
+        Returns:
+            - set of str: CANCELLED, FINISHED, INTERFACE, PASS_THROUGH, RUNNING_MODAL
+        """
+        return self.run(context=context)
+
+    def run(
+        self, context: Context, event: Event | None = None
+    ) -> OPERATOR_RETURN_ITEMS:
+        """
+        Run a script file from the compiled code cache and record the run in the usage
+        history, hash cache & event log. If an allowlist is set, scripts not on it are
+        refused. If invoked, e.g. from a button set to the Invoke run context, a
+        script's 'invoke(context, event)' function is called after the script ran.
+        Async scripts keep running in the background; they cannot be started again
+        until done. Stepped scripts & scripts processing the selected objects in chunks
+        continue as modal operator, showing their progress. Exceptions raised by the
+        script are passed on.
+
+        Parameters:
+            - context (Context)
+            - event (Event | None): Event the operator was invoked with, if any
+
+        Returns:
+            - set of str: CANCELLED, FINISHED, INTERFACE, PASS_THROUGH, RUNNING_MODAL
+        """
+        # Check the script
+        script_path = Path(self.filepath)
+        if not script_path.exists():
+            print(f"Script file {self.filepath} not found")
+            return {"CANCELLED"}
+
+        # Async scripts run once at a time
+        if tasks.is_running(path=script_path):
+            self.report({"WARNING"}, f"{script_path.name} is still running")
+            return {"CANCELLED"}
+
+        # Verify the script against the allowlist
+        prefs = preferences.Preferences.this()
+        blocked = prefs.verify_script(path=script_path)
+        if blocked:
+            self.report({"ERROR"}, blocked)
+            return {"CANCELLED"}
+
+        # Count the run before executing, failing scripts are still used
+        usage.record_run(path=script_path)
+        if prefs.use_hashing:
+            hashing.record_run(path=script_path)
+
+        # Check the source the code is compiled from, it may have changed since
+        allowed = prefs.allowed_hashes()
+        try:
+            runner.compile_script(path=script_path, allowed=allowed)
+        except PermissionError as e:
+            events.log(kind="run_blocked", path=script_path.as_posix())
+            self.report({"ERROR"}, str(e))
+            return {"CANCELLED"}
+
+        # Run script
+        with events.timed(kind="run", path=script_path.as_posix()):
+            namespace = runner.run_script(path=script_path, allowed=allowed)
+            if event is not None:
+                runner.invoke_script(namespace=namespace, context=context, event=event)
+
+        # Stepped scripts & object processing continue between UI events
+        self.steps = runner.main_steps(namespace=namespace)
+        if self.steps is None:
+            self.steps = runner.process_steps(
+                namespace=namespace,
+                names=[
+                    obj.name for obj in getattr(context, "selected_objects", None) or []
+                ],
+                chunk_size=prefs.chunk_size,
+            )
+        if self.steps is None:
+            return {"FINISHED"}
+
+        window_manager = context.window_manager
+        self.started = time.perf_counter()
+        self.timer = window_manager.event_timer_add(0.01, window=context.window)
+        window_manager.progress_begin(0, 100)
+        window_manager.modal_handler_add(self)
+
+        return {"RUNNING_MODAL"}
+
+    def modal(self, context: Context, event: Event) -> OPERATOR_RETURN_ITEMS:
+        """
+        Advance a stepped script in time slices between UI events and show its progress.
+        Cancel the script on ESC.
+
+        Parameters:
+            - context (Context)
+            - event (Event)
+
+        Returns:
+            - set of str: CANCELLED, FINISHED, INTERFACE, PASS_THROUGH, RUNNING_MODAL
+        """
+        # Cancel
+        if event.type == "ESC":
+            self.steps.close()
+            self.finish(context=context, cancelled=True)
+            self.report({"INFO"}, f"Cancelled {Path(self.filepath).name}")
+            return {"CANCELLED"}
+
+        if event.type != "TIMER" or event.timer != self.timer:
+            return {"PASS_THROUGH"}
+
+        # Run the next slice
+        try:
+            done, progress = runner.run_steps(steps=self.steps)
+        except Exception as e:
+            self.finish(context=context, error=f"{type(e).__name__}: {e}")
+            raise
+
+        if progress is not None:
+            context.window_manager.progress_update(progress * 100)
+            context.workspace.status_text_set(
+                f"{Path(self.filepath).stem}: {progress:.0%} (Esc to cancel)"
+            )
+
+        if done:
+            self.finish(context=context)
+            return {"FINISHED"}
+
+        return {"RUNNING_MODAL"}
+
+    def finish(self, context: Context, cancelled: bool = False, error: str = ""):
+        """
+        Remove the progress display & timer of a stepped script and log its duration.
+
+        Parameters:
+            - context (Context)
+            - cancelled (bool): Whether the script was cancelled
+            - error (str): Error message, if the script failed
+        """
+        window_manager = context.window_manager
+        window_manager.event_timer_remove(self.timer)
+        window_manager.progress_end()
+        context.workspace.status_text_set(None)
+
+        event = {"path": Path(self.filepath).as_posix()}
+        if cancelled:
+            event["cancelled"] = True
+        if error:
+            event["error"] = error
+
+        events.log(
+            kind="run_steps",
+            duration=time.perf_counter() - self.started,
+            **event,
+        )
+
+
+@catalogue.bpy_register
+class SHELFMADE_OT_RunScript(RunScript):
+    """Execute this Python script file"""
+
+    bl_idname = "wm.run_script"
+    bl_options = {"UNDO"}
+
+
+@catalogue.bpy_register
+class SHELFMADE_OT_RunScriptGrouped(RunScript):
+    """Execute this Python script file; consecutive grouped runs share one undo step"""
+
+    bl_idname = "wm.run_script_grouped"
+    bl_options = {"UNDO_GROUPED"}
+    bl_undo_group = "Run Shelf Script"
+
+
+@catalogue.bpy_register
+class SHELFMADE_OT_RunScriptNoUndo(RunScript):
+    """Execute this Python script file without storing an undo step"""
+
+    bl_idname = "wm.run_script_no_undo"
+
+
+@catalogue.bpy_register
+class SHELFMADE_OT_RunText(Operator):
+    """Execute this local text datablock"""
+
+    bl_idname = "wm.run_text"
+    bl_label = "Run Text Datablock"
+    bl_options = {"UNDO"}
+
+    name: StringProperty(name="Text Name")
+
+    def execute(self, context: Context) -> OPERATOR_RETURN_ITEMS:
+        """
+        Run a text datablock from within the current blend file.
+
+        Parameters:
+            - context (Context)
+
+        Returns:
+            - set of str: CANCELLED, FINISHED, INTERFACE, PASS_THROUGH, RUNNING_MODAL
+        """
+        # Run the local script using the basic operator
+        with events.timed(kind="run_text", name=self.name):
+            with context.temp_override(edit_text=bpy.data.texts[self.name]):
+                bpy.ops.text.run_script()
+
+        return {"FINISHED"}
+
+
+@catalogue.bpy_register
+class SHELFMADE_OT_SaveTextToShelf(Operator):
+    """Save this text datablock to a shelf directory"""
+
+    bl_idname = "text.save_text_to_shelf"
+    bl_label = "Save To Shelf"
+    bl_options = {"INTERNAL"}
+
+    shelf: EnumProperty(items=enum_shelves, name="Shelf")
+
+    @classmethod
+    def poll(cls, context: Context) -> bool:
+        """
+        Make this operator availble in the text editor if there's an active text
+        datablock.
+
+        Parameters:
+            - context (Context)
+
+        Returns:
+            - bool: Whether this operator is available or not
+        """
+        return context.area.type == "TEXT_EDITOR" and context.space_data.text
+
+    def execute(self, context: Context) -> OPERATOR_RETURN_ITEMS:
+        """
+        Save the currently opened text datablock to selected shelf.
+        Re-initiate the shelf. Save user preferences
+
+        Parameters:
+            - context (Context)
+
+        Returns:
+            - set of str: CANCELLED, FINISHED, INTERFACE, PASS_THROUGH, RUNNING_MODAL
+        """
+        if TYPE_CHECKING:
+            shelf: shelf.Shelf
+            text: Text
+
+        # Cancel if no shelves are available
+        if self.shelf == "NONE":
+            return {"CANCELLED"}
+
+        # Ensure python extension
+        text = context.space_data.text
+        if not text.name.endswith(".py"):
+            text.name += ".py"
+
+        # Save text
+        shelf = preferences.Preferences.this().shelves[int(self.shelf)]
+        filepath = str(Path(shelf.directory, text.name))
+        bpy.ops.text.save_as("EXEC_DEFAULT", filepath=filepath)
+
+        # Update the local mirror right away, so the new script shows up
+        root = mirror.mirror_root()
+        if root:
+            mirror.sync_directory(root=root, directory=shelf.directory)
+
+        # Reload shelf
+        shelf.initialize_scripts()
+
+        # Save user preferences
+        utils.save_userpref()
+
+        return {"FINISHED"}
+
+
+@catalogue.bpy_register
+class SHELFMADE_OT_SetScriptIcon(Operator):
+    """Select an icon for this script"""
+
+    bl_idname = "shelfmade.set_script_icon"
+    bl_label = "Set Script Icon"
+    bl_options = {"INTERNAL"}
+    bl_property = "icon"
 
     index: IntProperty(name="Shelf Index")
     script: StringProperty(name="Script Name")
@@ -1021,8 +1623,8 @@ class SHELFMADE_OT_SetScriptIcon(Operator):
 
         # Store current icon
         shelf = preferences.Preferences.this().shelves[self.index]
-        script = shelf.scripts[self.script]
-        self.icon = script.icon
+        script = shelf.scripts.get(self.script)
+        self.icon = script.icon if script else "NONE"
 
         # Call search popup
         context.window_manager.invoke_search_popup(self)
@@ -1044,13 +1646,138 @@ class SHELFMADE_OT_SetScriptIcon(Operator):
             script: shelf.Script
             shelf: shelf.Shelf
 
-        # Set icon
+        # Set icon, storing the customization
         shelf = preferences.Preferences.this().shelves[self.index]
-        script = shelf.scripts[self.script]
+        script = shelf.script_override(script=self.script)
         script.icon = self.icon
 
         # Save user preferences
-        bpy.ops.wm.save_userpref()
+        utils.save_userpref()
+
+        # Redraw UI
+        context.area.tag_redraw()
+
+        return {"FINISHED"}
+
+
+@catalogue.bpy_register
+class SHELFMADE_OT_SetScriptOptions(Operator):
+    """Set how this script is run"""
+
+    bl_idname = "shelfmade.set_script_options"
+    bl_label = "Script Run Options"
+    bl_options = {"INTERNAL"}
+
+    index: IntProperty(name="Shelf Index")
+    script: StringProperty(name="Script Name")
+    run_context: EnumProperty(items=shelf.RUN_CONTEXTS, name="Run Context")
+    undo: EnumProperty(items=shelf.UNDO_POLICIES, name="Undo")
+
+    def invoke(self, context: Context, event: Event) -> OPERATOR_RETURN_ITEMS:
+        """
+        Store the current run options and invoke the operator properties dialog.
+
+        Parameters:
+            - context (Context)
+            - event (Event)
+
+        Returns:
+            - set of str: CANCELLED, FINISHED, INTERFACE, PASS_THROUGH, RUNNING_MODAL
+        """
+        if TYPE_CHECKING:
+            script: shelf.Script
+            shelf: shelf.Shelf
+
+        shelf = preferences.Preferences.this().shelves[self.index]
+        script = shelf.scripts.get(self.script)
+        if script:
+            self.run_context = script.run_context
+            self.undo = script.undo
+
+        return context.window_manager.invoke_props_dialog(self)
+
+    def execute(self, context: Context) -> OPERATOR_RETURN_ITEMS:
+        """
+        Set a script's undo policy & run context. Save user preferences and redraw the
+        current area. The target script is chosen by shelf index and script name.
+
+        Parameters:
+            - context (Context)
+
+        Returns:
+            - set of str: CANCELLED, FINISHED, INTERFACE, PASS_THROUGH, RUNNING_MODAL
+        """
+        if TYPE_CHECKING:
+            script: shelf.Script
+            shelf: shelf.Shelf
+
+        # Set options, storing the customization
+        shelf = preferences.Preferences.this().shelves[self.index]
+        script = shelf.script_override(script=self.script)
+        script.run_context = self.run_context
+        script.undo = self.undo
+
+        # Save user preferences
+        utils.save_userpref()
+
+        # Redraw UI
+        context.area.tag_redraw()
+
+        return {"FINISHED"}
+
+
+@catalogue.bpy_register
+class SHELFMADE_OT_SetScriptPosition(Operator):
+    """Move this script to any position in its shelf"""
+
+    bl_idname = "shelfmade.set_script_position"
+    bl_label = "Move Script To"
+    bl_options = {"INTERNAL"}
+
+    index: IntProperty(name="Shelf Index")
+    script: StringProperty(name="Script Name")
+    position: IntProperty(name="Position", min=1)
+
+    def invoke(self, context: Context, event: Event) -> OPERATOR_RETURN_ITEMS:
+        """
+        Store the current script position and invoke the operator properties dialog.
+
+        Parameters:
+            - context (Context)
+            - event (Event)
+
+        Returns:
+            - set of str: CANCELLED, FINISHED, INTERFACE, PASS_THROUGH, RUNNING_MODAL
+        """
+        file_names = preferences.Preferences.this().shelves[self.index].script_names()
+        if self.script not in file_names:
+            return {"CANCELLED"}
+
+        # Store current position
+        self.position = file_names.index(self.script) + 1
+
+        # Draw dialog
+        return context.window_manager.invoke_props_dialog(self)
+
+    def execute(self, context: Context) -> OPERATOR_RETURN_ITEMS:
+        """
+        Move a script to a position, counted from 1, in a single step. Save user
+        preferences once and redraw the current area.
+        The target script is chosen by shelf index and script name.
+
+        Parameters:
+            - context (Context)
+
+        Returns:
+            - set of str: CANCELLED, FINISHED, INTERFACE, PASS_THROUGH, RUNNING_MODAL
+        """
+        # Move
+        shelf = preferences.Preferences.this().shelves[self.index]
+        if not shelf.move_script(script=self.script, index=self.position - 1):
+            return {"CANCELLED"}
+
+        # Save user preferences
+        utils.save_userpref()
 
         # Redraw UI
         context.area.tag_redraw()
@@ -1104,7 +1831,249 @@ class SHELFMADE_OT_SetShelfIcon(Operator):
         preferences.Preferences.this().shelves[self.index].icon = self.icon
 
         # Save user preferences
-        bpy.ops.wm.save_userpref()
+        utils.save_userpref()
+
+        # Redraw UI
+        context.area.tag_redraw()
+
+        return {"FINISHED"}
+
+
+@catalogue.bpy_register
+class SHELFMADE_OT_SetShelfPosition(Operator):
+    """Move this shelf to any position in the shelves list"""
+
+    bl_idname = "shelfmade.set_shelf_position"
+    bl_label = "Move Shelf To"
+    bl_options = {"INTERNAL"}
+
+    index: IntProperty(name="Shelf Index")
+    position: IntProperty(name="Position", min=1)
+
+    def invoke(self, context: Context, event: Event) -> OPERATOR_RETURN_ITEMS:
+        """
+        Store the current shelf position and invoke the operator properties dialog.
+
+        Parameters:
+            - context (Context)
+            - event (Event)
+
+        Returns:
+            - set of str: CANCELLED, FINISHED, INTERFACE, PASS_THROUGH, RUNNING_MODAL
+        """
+        # Store current position
+        self.position = self.index + 1
+
+        # Draw dialog
+        return context.window_manager.invoke_props_dialog(self)
+
+    def execute(self, context: Context) -> OPERATOR_RETURN_ITEMS:
+        """
+        Move a shelf to a position, counted from 1, in a single step. Save user
+        preferences once and redraw the current area.
+        The target shelf is chosen by index.
+
+        Parameters:
+            - context (Context)
+
+        Returns:
+            - set of str: CANCELLED, FINISHED, INTERFACE, PASS_THROUGH, RUNNING_MODAL
+        """
+        shelves = preferences.Preferences.this().shelves
+        new_index = max(0, min(self.position - 1, len(shelves) - 1))
+        if new_index == self.index:
+            return {"CANCELLED"}
+
+        # Move
+        shelves.move(self.index, new_index)
+
+        # Save user preferences
+        utils.save_userpref()
+
+        # Redraw UI
+        context.area.tag_redraw()
+
+        return {"FINISHED"}
+
+
+@catalogue.bpy_register
+class SHELFMADE_OT_SortScripts(Operator):
+    """Sort all scripts of this shelf"""
+
+    bl_idname = "shelfmade.sort_scripts"
+    bl_label = "Sort Scripts"
+    bl_options = {"INTERNAL"}
+
+    index: IntProperty(name="Shelf Index")
+    order: EnumProperty(
+        items=(
+            ("NAME", "Name", "Sort by display name", "SORTALPHA", 0),
+            ("FILE", "File Name", "Sort by file name, the default order", "FILE", 1),
+            ("USAGE", "Most Used", "Sort by run count, most used first", "SORTTIME", 2),
+            ("RECENT", "Recently Used", "Sort by last run, latest first", "TIME", 3),
+            ("CUSTOM", "Custom", "Use the given list of file names", "PRESET", 4),
+        ),
+        name="Order",
+    )
+    custom_order: StringProperty(
+        name="Custom Order",
+        description="Comma separated script file names; unlisted scripts follow",
+    )
+
+    def invoke(self, context: Context, event: Event) -> OPERATOR_RETURN_ITEMS:
+        """
+        Invoke the operator properties dialog to choose the order.
+
+        Parameters:
+            - context (Context)
+            - event (Event)
+
+        Returns:
+            - set of str: CANCELLED, FINISHED, INTERFACE, PASS_THROUGH, RUNNING_MODAL
+        """
+        return context.window_manager.invoke_props_dialog(self)
+
+    def execute(self, context: Context) -> OPERATOR_RETURN_ITEMS:
+        """
+        Apply a complete script order in one pass, based on the order enumerator. Save
+        user preferences once and redraw the current area.
+        The target shelf is chosen by index.
+
+        Parameters:
+            - context (Context)
+
+        Returns:
+            - set of str: CANCELLED, FINISHED, INTERFACE, PASS_THROUGH, RUNNING_MODAL
+        """
+        shelf = preferences.Preferences.this().shelves[self.index]
+
+        # Get the new order
+        if self.order == "NAME":
+            file_names = [
+                entry[0]
+                for entry in sorted(
+                    shelf.script_entries(),
+                    key=lambda entry: entry[1].lower(),
+                )
+            ]
+        elif self.order == "FILE":
+            file_names = sorted(shelf.script_names())
+        elif self.order in {"USAGE", "RECENT"}:
+            score = usage.run_count if self.order == "USAGE" else usage.last_run
+            file_names = sorted(
+                shelf.script_names(),
+                key=lambda name: score(path=shelf.script_path(script=name)),
+                reverse=True,
+            )
+        else:
+            file_names = [name.strip() for name in self.custom_order.split(",")]
+
+        # Sort
+        shelf.order_scripts(file_names=file_names)
+
+        # Save user preferences
+        utils.save_userpref()
+
+        # Redraw UI
+        context.area.tag_redraw()
+
+        return {"FINISHED"}
+
+
+@catalogue.bpy_register
+class SHELFMADE_OT_SortShelves(Operator):
+    """Sort all shelves"""
+
+    bl_idname = "shelfmade.sort_shelves"
+    bl_label = "Sort Shelves"
+    bl_options = {"INTERNAL"}
+
+    order: EnumProperty(
+        items=(
+            ("NAME", "Name", "Sort by name", "SORTALPHA", 0),
+            ("USAGE", "Most Used", "Sort by total script runs", "SORTTIME", 1),
+            ("RECENT", "Recently Used", "Sort by the latest script run", "TIME", 2),
+            ("CUSTOM", "Custom", "Use the given list of shelf names", "PRESET", 3),
+        ),
+        name="Order",
+    )
+    custom_order: StringProperty(
+        name="Custom Order",
+        description="Comma separated shelf names; unlisted shelves follow",
+    )
+
+    def invoke(self, context: Context, event: Event) -> OPERATOR_RETURN_ITEMS:
+        """
+        Invoke the operator properties dialog to enter a custom order, else sort right
+        away.
+
+        Parameters:
+            - context (Context)
+            - event (Event)
+
+        Returns:
+            - set of str: CANCELLED, FINISHED, INTERFACE, PASS_THROUGH, RUNNING_MODAL
+        """
+        if self.order == "CUSTOM":
+            return context.window_manager.invoke_props_dialog(self)
+
+        return self.execute(context)
+
+    def execute(self, context: Context) -> OPERATOR_RETURN_ITEMS:
+        """
+        Apply a complete shelf order in one pass, based on the order enumerator. Save
+        user preferences once and redraw the current area.
+
+        Parameters:
+            - context (Context)
+
+        Returns:
+            - set of str: CANCELLED, FINISHED, INTERFACE, PASS_THROUGH, RUNNING_MODAL
+        """
+        if TYPE_CHECKING:
+            shelf: shelf.Shelf
+
+        shelves = preferences.Preferences.this().shelves
+        names = [shelf.name for shelf in shelves]
+
+        # Get the new order
+        if self.order == "NAME":
+            order = sorted(range(len(shelves)), key=lambda i: names[i].lower())
+        elif self.order in {"USAGE", "RECENT"}:
+            if self.order == "USAGE":
+                scores = [
+                    sum(usage.run_count(path=path) for path in shelf.script_paths())
+                    for shelf in shelves
+                ]
+            else:
+                scores = [
+                    max(
+                        (usage.last_run(path=path) for path in shelf.script_paths()),
+                        default=0.0,
+                    )
+                    for shelf in shelves
+                ]
+
+            order = sorted(
+                range(len(shelves)),
+                key=scores.__getitem__,
+                reverse=True,
+            )
+        else:
+            order = [
+                names.index(name.strip())
+                for name in self.custom_order.split(",")
+                if name.strip() in names
+            ]
+
+        # Sort
+        utils.reorder_collection(
+            collection=shelves,
+            order=list(dict.fromkeys(order)),
+        )
+
+        # Save user preferences
+        utils.save_userpref()
 
         # Redraw UI
         context.area.tag_redraw()
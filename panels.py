@@ -7,7 +7,7 @@ if TYPE_CHECKING:
 import bpy
 from bpy.types import Panel
 
-from . import catalogue, draw, preferences
+from . import areas, catalogue, draw, fanout, preferences
 
 
 ########################################################################################
@@ -45,9 +45,92 @@ class LocalShelf(Panel):
         draw.local_scripts(panel=self, context=context)
 
 
+@catalogue.bpy_register
+class EventLog(Panel):
+    """Displays the most recent scan, run & preference save events"""
+
+    bl_idname = "SHELFMADE_PT_viewport_event_log"
+    bl_category = "Shelf Made"
+    bl_label = "Event Log"
+    bl_space_type = "VIEW_3D"
+    bl_region_type = "UI"
+    bl_order = 120
+    bl_options = {"DEFAULT_CLOSED"}
+
+    @classmethod
+    def poll(cls, context: Context) -> bool:
+        """
+        Draw this panel only if enabled in the add-on preferences.
+
+        Parameters:
+            - context (Context)
+
+        Returns:
+            - bool: Whether this panel is drawn or not
+        """
+        return preferences.Preferences.this().show_event_log
+
+    def draw_header(self, context: Context):
+        """
+        Draw the export button into the header row of this panel.
+
+        Parameters:
+            - context (Context)
+        """
+        row_header = self.layout.row(align=True)
+        row_header.alignment = "RIGHT"
+        row_header.operator(operator="shelfmade.export_events", text="", icon="EXPORT")
+
+    def draw(self, context: Context):
+        draw.event_log(panel=self, context=context)
+
+
+@catalogue.bpy_register
+class FileReport(Panel):
+    """Displays the results of the last run of a script in many blend files"""
+
+    bl_idname = "SHELFMADE_PT_viewport_file_report"
+    bl_category = "Shelf Made"
+    bl_label = "File Report"
+    bl_space_type = "VIEW_3D"
+    bl_region_type = "UI"
+    bl_order = 110
+
+    @classmethod
+    def poll(cls, context: Context) -> bool:
+        """
+        Draw this panel only once a script was run in many files.
+
+        Parameters:
+            - context (Context)
+
+        Returns:
+            - bool: Whether this panel is drawn or not
+        """
+        return bool(fanout.REPORT["total"])
+
+    def draw_header(self, context: Context):
+        """
+        Draw the export button into the header row of this panel.
+
+        Parameters:
+            - context (Context)
+        """
+        row_header = self.layout.row(align=True)
+        row_header.alignment = "RIGHT"
+        row_header.operator(
+            operator="shelfmade.export_file_report",
+            text="",
+            icon="EXPORT",
+        )
+
+    def draw(self, context: Context):
+        draw.file_report(panel=self, context=context)
+
+
 # Not registered, serves as base
 class Shelves(Panel):
-    """Displays all visible shelves; inherited by its registered area equivalents"""
+    """Displays all visible shelves; inherited by area equivalents registered on demand"""
 
     bl_category = "Shelf Made"
     bl_label = "Shelves"
@@ -70,7 +153,7 @@ class Shelves(Panel):
         """
         shelves = preferences.Preferences.this().shelves
         return any([shelf.is_visible(context) for shelf in shelves]) or (
-            not shelves and context.area.ui_type in draw.AREA_TYPES.keys()
+            not shelves and context.area.ui_type in areas.AREA_BITS
         )
 
     def draw_header(self, context: Context):
@@ -111,93 +194,32 @@ class Shelves(Panel):
 
 
 ########################################################################################
-# (Inheriting) shelf panels
+# Generated shelf panels
 ########################################################################################
 
 
-@catalogue.bpy_register
-class ClipEditorShelves(Shelves):
-    """Shelf panel for the Clip Editor"""
-
-    bl_idname = "SHELFMADE_PT_clip_editor_shelves"
-    bl_space_type = "CLIP_EDITOR"
-
-
-@catalogue.bpy_register
-class DopesheetEditorShelves(Shelves):
-    """Shelf panel for the Dopesheet Editor"""
+def create_shelves_panel(space_type: str) -> type:
+    """
+    Create a class inheriting 'Shelves' for a single space type.
 
-    bl_idname = "SHELFMADE_PT_dopesheet_editor_shelves"
-    bl_space_type = "DOPESHEET_EDITOR"
-
-
-@catalogue.bpy_register
-class FileBrowserShelves(Shelves):
-    """Shelf panel for the File Browser"""
+    Parameters:
+        - space_type (str): Space type the panel is displayed in
 
-    bl_idname = "SHELFMADE_PT_file_browser_shelves"
-    bl_space_type = "FILE_BROWSER"
+    Returns:
+        - type: Panel class
+    """
+    name = space_type.replace("_", " ").title()
+    return type(
+        f"{name.replace(' ', '')}Shelves",
+        (Shelves,),
+        {
+            "__doc__": f"Shelf panel for the {name}",
+            "bl_idname": f"SHELFMADE_PT_{space_type.lower()}_shelves",
+            "bl_space_type": space_type,
+        },
+    )
 
 
-@catalogue.bpy_register
-class GraphEditorShelves(Shelves):
-    """Shelf panel for the Graph Editor"""
-
-    bl_idname = "SHELFMADE_PT_graph_editor_shelves"
-    bl_space_type = "GRAPH_EDITOR"
-
-
-@catalogue.bpy_register
-class ImageEditorShelves(Shelves):
-    """Shelf panel for the Image Editor"""
-
-    bl_idname = "SHELFMADE_PT_image_editor_shelves"
-    bl_space_type = "IMAGE_EDITOR"
-
-
-@catalogue.bpy_register
-class NlaEditorShelves(Shelves):
-    """Shelf panel for the NLA Editor"""
-
-    bl_idname = "SHELFMADE_PT_nla_editor_shelves"
-    bl_space_type = "NLA_EDITOR"
-
-
-@catalogue.bpy_register
-class NodeEditorShelves(Shelves):
-    """Shelf panel for the Node Editor"""
-
-    bl_idname = "SHELFMADE_PT_node_editor_shelves"
-    bl_space_type = "NODE_EDITOR"
-
-
-@catalogue.bpy_register
-class SequenceEditorShelves(Shelves):
-    """Shelf panel for the Sequence Editor"""
-
-    bl_idname = "SHELFMADE_PT_sequence_editor_shelves"
-    bl_space_type = "SEQUENCE_EDITOR"
-
-
-@catalogue.bpy_register
-class SpreadsheetShelves(Shelves):
-    """Shelf panel for the Spreadsheet Editor"""
-
-    bl_idname = "SHELFMADE_PT_spreadsheet_shelves"
-    bl_space_type = "SPREADSHEET"
-
-
-@catalogue.bpy_register
-class TextEditorShelves(Shelves):
-    """Shelf panel for the Text Editor"""
-
-    bl_idname = "SHELFMADE_PT_text_editor_shelves"
-    bl_space_type = "TEXT_EDITOR"
-
-
-@catalogue.bpy_register
-class ViewportShelves(Shelves):
-    """Shelf panel for the 3D Viewport"""
-
-    bl_idname = "SHELFMADE_PT_view_3d_shelves"
-    bl_space_type = "VIEW_3D"
+# One lazily registered panel per space type, in order of first appearance
+for space_type in dict.fromkeys(areas.AREA_SPACE_TYPES.values()):
+    catalogue.bpy_register_lazy(group=space_type)(create_shelves_panel(space_type))
@@ -0,0 +1,314 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Any, Dict, List, Tuple
+
+import asyncio
+import json
+import os
+import tempfile
+from pathlib import Path
+
+import bpy
+
+from . import events, preferences, sandbox, tasks
+
+
+# Pool workers are background Blender processes started ahead of time, so isolated runs
+# skip Blender's start-up. Each serves one job at a time over its stdin & stdout pipes
+# (see 'sandbox.serve') and is replaced after a number of jobs or once its memory grew
+# too much, as scripts may leak data or modules between jobs.
+
+
+########################################################################################
+# Statics
+########################################################################################
+
+
+# Bytes per megabyte, for the memory growth limit
+MEGABYTE = 1024 * 1024
+
+# Pool settings & idle workers, created on start
+POOL: Dict[str, Any] = {
+    "blender": "",
+    "max_jobs": 0,
+    "max_memory": 0,
+    "idle": None,
+}
+
+# All workers, whether idle or busy
+WORKERS: List[Worker] = []
+
+
+########################################################################################
+# Workers
+########################################################################################
+
+
+class Worker:
+    """
+    Pool worker process & its job statistics.
+    """
+
+    def __init__(self, process: asyncio.subprocess.Process):
+        self.process = process
+        self.jobs = 0
+        self.memory = 0
+        self.baseline = 0
+        self.busy = False
+
+    def is_alive(self) -> bool:
+        """
+        Returns:
+            - bool: Whether the process is still running
+        """
+        return self.process.returncode is None
+
+    def is_worn_out(self) -> bool:
+        """
+        Returns:
+            - bool: Whether the worker served its maximum amount of jobs or its memory
+              grew beyond the limit since its first job
+        """
+        if POOL["max_jobs"] and self.jobs >= POOL["max_jobs"]:
+            return True
+
+        growth = self.memory - self.baseline
+        return bool(POOL["max_memory"]) and growth > POOL["max_memory"] * MEGABYTE
+
+    def kill(self):
+        """
+        End the process right away.
+        """
+        if self.is_alive():
+            self.process.kill()
+
+
+async def spawn() -> Worker:
+    """
+    Start a worker process. Blender starts up in the background; jobs sent before it is
+    ready wait in its stdin pipe.
+
+    Returns:
+        - Worker
+    """
+    process = await asyncio.create_subprocess_exec(
+        *sandbox.command(
+            script_path=None,
+            output_path=None,
+            blender=POOL["blender"],
+        ),
+        stdin=asyncio.subprocess.PIPE,
+        stdout=asyncio.subprocess.PIPE,
+    )
+    worker = Worker(process=process)
+    WORKERS.append(worker)
+    events.log(kind="pool_spawn", pid=process.pid)
+
+    return worker
+
+
+async def replace(worker: Worker):
+    """
+    End a worker & add a new one to the idle workers.
+
+    Parameters:
+        - worker (Worker)
+    """
+    worker.kill()
+    if worker in WORKERS:
+        WORKERS.remove(worker)
+
+    if POOL["idle"] is not None:
+        POOL["idle"].put_nowait(await spawn())
+
+
+async def discard(worker: Worker, idle: asyncio.Queue, output_path: str):
+    """
+    Replace a worker whose job was interrupted and remove the job's result file.
+
+    Parameters:
+        - worker (Worker)
+        - idle (Queue): Idle workers of the pool the job was started in
+        - output_path (str): Result file
+    """
+    Path(output_path).unlink(missing_ok=True)
+    if idle is POOL["idle"]:
+        await replace(worker=worker)
+    else:
+        worker.kill()
+
+
+########################################################################################
+# Pool
+########################################################################################
+
+
+def is_running() -> bool:
+    """
+    Returns:
+        - bool: Whether the pool is started
+    """
+    return POOL["idle"] is not None
+
+
+def start():
+    """
+    (Re-)start the pool with the size & limits set in the preferences, if the size is
+    not 0. Never started in background Blender, e.g. command line runs, which have no
+    use for workers.
+    """
+    stop()
+    prefs = preferences.Preferences.this()
+    if not prefs.pool_size or bpy.app.background:
+        return
+
+    POOL.update(blender=bpy.app.binary_path, idle=asyncio.Queue())
+    configure(max_jobs=prefs.pool_max_jobs, max_memory=prefs.pool_max_memory)
+    loop = tasks.event_loop()
+    for _ in range(prefs.pool_size):
+        POOL["idle"].put_nowait(loop.run_until_complete(spawn()))
+
+
+def configure(max_jobs: int, max_memory: int):
+    """
+    Set the worker limits. Running workers are checked against them after their next
+    job, so the pool keeps running.
+
+    Parameters:
+        - max_jobs (int): Jobs a worker serves before it is replaced, 0 for no limit
+        - max_memory (int): Megabytes a worker may grow by before it is replaced, 0 for
+          no limit
+    """
+    POOL.update(max_jobs=max_jobs, max_memory=max_memory)
+
+
+def stop():
+    """
+    Kill all workers. Running jobs & jobs waiting for a worker fail with an error.
+    """
+    # Wake waiting jobs, each one passes the stop on to the next
+    if POOL["idle"] is not None:
+        POOL["idle"].put_nowait(None)
+
+    POOL["idle"] = None
+    for worker in WORKERS:
+        worker.kill()
+
+    WORKERS.clear()
+
+
+def status() -> List[Tuple[int, int, int, bool]]:
+    """
+    Get the state of all workers.
+
+    Returns:
+        - list of tuple: Process ID, jobs served, memory in bytes & whether busy
+    """
+    return [
+        (worker.process.pid, worker.jobs, worker.memory, worker.busy)
+        for worker in WORKERS
+    ]
+
+
+async def run(
+    script_path: str | Path,
+    blend_file: str | Path | None = None,
+    digest: str | None = None,
+) -> sandbox.IsolatedResults:
+    """
+    Run a script on the next idle worker and read its results. If cancelled, the worker
+    is killed & replaced. The results are also kept as the script's last results.
+
+    Parameters:
+        - script_path (str | Path)
+        - blend_file (str | Path | None): File to open first, else an empty file
+        - digest (str | None): Verified content hash; the worker refuses to run the
+          script if its content differs by then
+
+    Returns:
+        - IsolatedResults
+
+    Raises:
+        - RuntimeError: If the pool is not started or stops while waiting, the script
+          fails or the worker dies
+    """
+    if not is_running():
+        raise RuntimeError("The worker pool is not started")
+
+    idle = POOL["idle"]
+    while True:
+        worker = await idle.get()
+        if worker is None:
+            idle.put_nowait(None)
+            raise RuntimeError("The worker pool was stopped")
+        if worker.is_alive():
+            break
+
+        await replace(worker=worker)
+
+    output_file, output_path = tempfile.mkstemp(prefix="shelfmade_", suffix=".bin")
+    os.close(output_file)
+
+    job = {
+        "script": Path(script_path).as_posix(),
+        "output": output_path,
+        "blend_file": Path(blend_file).as_posix() if blend_file else None,
+        "digest": digest,
+    }
+    worker.busy = True
+    try:
+        worker.process.stdin.write((json.dumps(job) + "\n").encode("utf-8"))
+        await worker.process.stdin.drain()
+
+        # Skip Blender's own output
+        while True:
+            line = (await worker.process.stdout.readline()).decode("utf-8", "replace")
+            if not line:
+                raise ConnectionResetError
+            if line.startswith(sandbox.RESPONSE_PREFIX):
+                break
+
+    except asyncio.CancelledError:
+        await discard(worker=worker, idle=idle, output_path=output_path)
+        raise
+
+    except (BrokenPipeError, ConnectionResetError):
+        await discard(worker=worker, idle=idle, output_path=output_path)
+        raise RuntimeError(f"Pool worker running {Path(script_path).name} exited")
+
+    # Output line beyond the stream limit, the response can no longer be found
+    except (ValueError, asyncio.LimitOverrunError):
+        await discard(worker=worker, idle=idle, output_path=output_path)
+        raise RuntimeError(
+            f"Pool worker running {Path(script_path).name} printed an overlong line"
+        )
+
+    # Update the worker's statistics & recycle it once worn out
+    response = json.loads(line[len(sandbox.RESPONSE_PREFIX) :])
+    worker.busy = False
+    worker.jobs += 1
+    worker.memory = response.get("memory", 0)
+    if worker.jobs == 1:
+        worker.baseline = worker.memory
+
+    if idle is POOL["idle"]:
+        if worker.is_worn_out():
+            events.log(
+                kind="pool_recycle",
+                pid=worker.process.pid,
+                jobs=worker.jobs,
+                memory=worker.memory,
+            )
+            await replace(worker=worker)
+        else:
+            idle.put_nowait(worker)
+
+    if not response.get("ok"):
+        Path(output_path).unlink(missing_ok=True)
+        raise RuntimeError(
+            f"Pooled run of {Path(script_path).name} failed:\n{response.get('error')}"
+        )
+
+    return sandbox.store_results(script_path=script_path, output_path=output_path)
@@ -2,13 +2,105 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from typing import Set
     from bpy.types import Context, UILayout
 
+from pathlib import Path
+
 import bpy
-from bpy.props import BoolProperty, CollectionProperty
+from bpy.props import (
+    BoolProperty,
+    CollectionProperty,
+    EnumProperty,
+    FloatProperty,
+    IntProperty,
+    StringProperty,
+)
 from bpy.types import AddonPreferences
 
-from . import catalogue, shelf
+from . import (
+    allowlist,
+    areas,
+    catalogue,
+    events,
+    hashing,
+    mirror,
+    pool,
+    scan,
+    shelf,
+    utils,
+)
+
+
+########################################################################################
+# Update functions
+########################################################################################
+
+
+def update_mirror(prefs: Preferences, context: Context):
+    """
+    Restart mirroring and re-scan all shelves on any mirror setting change. Saves
+    userprefs.
+
+    Parameters:
+        - prefs (Preferences)
+        - context (Context)
+    """
+    mirror.stop()
+    mirror.start()
+    prefs.initialize_shelves()
+    utils.save_userpref()
+
+
+def update_pool(prefs: Preferences, context: Context):
+    """
+    Restart the worker pool with the new size. Saves userprefs.
+
+    Parameters:
+        - prefs (Preferences)
+        - context (Context)
+    """
+    pool.start()
+    utils.save_userpref()
+
+
+def update_pool_limits(prefs: Preferences, context: Context):
+    """
+    Apply new worker limits to the running pool without restarting it; workers beyond
+    them are replaced after their current job. Saves userprefs.
+
+    Parameters:
+        - prefs (Preferences)
+        - context (Context)
+    """
+    pool.configure(max_jobs=prefs.pool_max_jobs, max_memory=prefs.pool_max_memory)
+    utils.save_userpref()
+
+
+def update_hashing(prefs: Preferences, context: Context):
+    """
+    Start hashing all scripts when enabled. Saves userprefs.
+
+    Parameters:
+        - prefs (Preferences)
+        - context (Context)
+    """
+    if prefs.use_hashing:
+        prefs.hash_scripts()
+
+    utils.save_userpref()
+
+
+def update_index(prefs: Preferences, context: Context):
+    """
+    Re-scan all shelves on any index source change. Saves userprefs.
+
+    Parameters:
+        - prefs (Preferences)
+        - context (Context)
+    """
+    prefs.initialize_shelves()
+    utils.save_userpref()
 
 
 ########################################################################################
@@ -22,24 +114,182 @@ class Preferences(AddonPreferences):
 
     bl_idname = __package__
 
+    allowlist_path: StringProperty(
+        name="Allowlist",
+        description=(
+            "Signed allowlist of script content hashes; scripts not on it are refused. "
+            "Leave empty to run all scripts"
+        ),
+        subtype="FILE_PATH",
+        update=shelf.update_save_userpref,
+    )
+    allowlist_key_path: StringProperty(
+        name="Allowlist Key",
+        description="File holding the key the allowlist is signed with",
+        subtype="FILE_PATH",
+        update=shelf.update_save_userpref,
+    )
+    chunk_size: IntProperty(
+        name="Chunk Size",
+        description=(
+            "Selected objects handed to a script's 'process_selected' function at "
+            "once; smaller chunks keep Blender more responsive"
+        ),
+        default=500,
+        min=1,
+        soft_max=10000,
+        update=shelf.update_save_userpref,
+    )
+    frequent_limit: IntProperty(
+        name="Frequent Scripts",
+        description="Amount of scripts on the virtual shelf",
+        default=6,
+        min=1,
+        soft_max=20,
+        update=shelf.update_save_userpref,
+    )
+    frequent_order: EnumProperty(
+        items=(
+            ("FREQUENT", "Most Used", "Show the most frequently run scripts"),
+            ("RECENT", "Recently Used", "Show the most recently run scripts"),
+        ),
+        name="Frequent Order",
+        update=shelf.update_save_userpref,
+    )
+    index_source: StringProperty(
+        name="Script Index",
+        description=(
+            "Pre-computed script index, either a JSON file or an http(s) URL; "
+            "indexed shelves are not scanned. Leave empty to scan all shelves"
+        ),
+        update=update_index,
+    )
     is_locked: BoolProperty(name="(Un)Lock Shelves", update=shelf.update_save_userpref)
+    mirror_directory: StringProperty(
+        name="Mirror Directory",
+        description="Local cache for shelf scripts, leave empty for the default location",
+        subtype="DIR_PATH",
+        update=update_mirror,
+    )
+    pool_max_jobs: IntProperty(
+        name="Jobs per Worker",
+        description="Replace pool workers after this many runs, 0 for no limit",
+        default=50,
+        min=0,
+        soft_max=500,
+        update=update_pool_limits,
+    )
+    pool_max_memory: IntProperty(
+        name="Memory Growth",
+        description=(
+            "Replace pool workers once their memory grew by this many megabytes since "
+            "their first run, 0 for no limit"
+        ),
+        default=2048,
+        min=0,
+        soft_max=16384,
+        update=update_pool_limits,
+    )
+    pool_size: IntProperty(
+        name="Pool Workers",
+        description=(
+            "Background Blender processes kept running for isolated runs, so they "
+            "start without delay; 0 starts a new process for each run"
+        ),
+        default=0,
+        min=0,
+        soft_max=8,
+        update=update_pool,
+    )
+    preload_imports: BoolProperty(
+        name="Preload Imports",
+        description="Also import the modules used by preloaded scripts",
+        update=shelf.update_save_userpref,
+    )
+    preload_scripts: IntProperty(
+        name="Preload Scripts",
+        description="Amount of most used scripts to compile in the background on start",
+        default=5,
+        min=0,
+        soft_max=20,
+        update=shelf.update_save_userpref,
+    )
+    scan_timeout: FloatProperty(
+        name="Scan Timeout",
+        description=(
+            "Seconds to wait for a shelf directory to respond; unresponsive "
+            "directories are skipped and retried in the background"
+        ),
+        default=2.0,
+        min=0.1,
+        soft_max=10.0,
+        subtype="TIME_ABSOLUTE",
+        update=shelf.update_save_userpref,
+    )
     shelves: CollectionProperty(type=shelf.Shelf, name="Directories")
+    show_event_log: BoolProperty(
+        name="Event Log Panel",
+        description="Show recent scans, script runs & preference saves in a panel",
+        update=shelf.update_save_userpref,
+    )
+    show_frequent: BoolProperty(name="Show Frequent Scripts", default=True)
+    show_settings: BoolProperty(name="Show Settings")
+    use_frequent_shelf: BoolProperty(
+        name="Frequent Shelf",
+        description=(
+            "Show a virtual shelf with the most used or most recently run scripts "
+            "above all shelves"
+        ),
+        update=shelf.update_save_userpref,
+    )
+    use_hashing: BoolProperty(
+        name="Content Hashes",
+        description=(
+            "Hash scripts in the background to detect changes; scripts modified since "
+            "their last run are marked"
+        ),
+        update=update_hashing,
+    )
+    use_mirror: BoolProperty(
+        name="Local Mirror",
+        description=(
+            "Copy shelf directories to a local cache and run scripts from there; "
+            "the cache is synced with the shelf directories in the background"
+        ),
+        update=update_mirror,
+    )
 
-    def clean(self):
+    def clean(self) -> int:
         """
-        Remove all unavailable shelves and scripts.
+        Remove all shelves and scripts confirmed missing. Shelves whose directory is
+        unreachable, e.g. timed out or skipped by its circuit breaker, are kept along
+        with their scripts. Each collection is compacted in a single pass, keeping the
+        order. Logs the amount of removed items.
+
+        Returns:
+            - int: Amount of removed shelves & scripts
         """
         if TYPE_CHECKING:
-            script: shelf.Script
             shelf: shelf.Shelf
 
-        for i_sh, shelf in reversed(list(enumerate(self.shelves))):
-            if not shelf.is_available:
-                self.shelves.remove(i_sh)
+        with events.timed(kind="clean") as event:
+            removed = utils.compact_collection(
+                collection=self.shelves,
+                keep=lambda shelf: shelf.is_available
+                or (shelf.directory and scan.is_unreachable(shelf.script_directory())),
+            )
+            for shelf in self.shelves:
+                if not shelf.is_available:
+                    continue
+
+                removed += utils.compact_collection(
+                    collection=shelf.scripts,
+                    keep=lambda script: script.is_available,
+                )
 
-            for i_sc, script in reversed(list(enumerate(shelf.scripts))):
-                if not script.is_available:
-                    shelf.scripts.remove(i_sc)
+            event["removed"] = removed
+
+        return removed
 
     def draw(self, context: Context):
         """
@@ -53,12 +303,19 @@ class Preferences(AddonPreferences):
             layout: UILayout
             shelf: shelf.Shelf
 
-        # Add shelf button
+        # Settings
         layout = self.layout
+        self.draw_settings(layout=layout.box())
+
+        # Add shelf & sort buttons
         col_shelves = layout.column(align=True)
-        col_shelves.row(align=True).operator(
-            operator="shelfmade.add_shelf",
-            icon="ADD",
+        row_add = col_shelves.row(align=True)
+        row_add.operator(operator="shelfmade.add_shelf", icon="ADD")
+        row_add.operator_menu_enum(
+            operator="shelfmade.sort_shelves",
+            property="order",
+            text="",
+            icon="SORTALPHA",
         )
 
         if not self.shelves:
@@ -88,8 +345,10 @@ class Preferences(AddonPreferences):
                 icon="VIS_SEL_11",
             ).index = i
 
-            # Path
-            row_shelf.prop(data=shelf, property="directory", text="")
+            # Path, highlighted if unreachable
+            row_path = row_shelf.row()
+            row_path.alert = scan.is_unavailable(directory=shelf.script_directory())
+            row_path.prop(data=shelf, property="directory", text="")
 
             # Move
             row_move = row_shelf.row(align=True)
@@ -122,16 +381,189 @@ class Preferences(AddonPreferences):
                 icon="X",
             ).index = i
 
+    def draw_settings(self, layout: UILayout):
+        """
+        Draw the collapsable add-on settings.
+
+        Parameters:
+            - layout (UILayout): Layout to draw into
+        """
+        layout.prop(
+            data=self,
+            property="show_settings",
+            icon="DOWNARROW_HLT" if self.show_settings else "RIGHTARROW",
+            emboss=False,
+        )
+        if not self.show_settings:
+            return
+
+        # Frequent scripts
+        col_frequent = layout.column(heading="Frequent")
+        col_frequent.prop(data=self, property="use_frequent_shelf", text="Show Shelf")
+        row_frequent = col_frequent.row()
+        row_frequent.active = self.use_frequent_shelf
+        row_frequent.prop(data=self, property="frequent_order", text="")
+        row_frequent.prop(data=self, property="frequent_limit", text="")
+
+        # Object processing
+        col_process = layout.column(heading="Process")
+        col_process.prop(data=self, property="chunk_size")
+
+        # Preloading
+        col_preload = layout.column(heading="Preload")
+        col_preload.prop(data=self, property="preload_scripts")
+        col_preload.prop(data=self, property="preload_imports")
+
+        # Mirror
+        col_mirror = layout.column(heading="Mirror")
+        col_mirror.prop(data=self, property="use_mirror")
+        row_mirror = col_mirror.row()
+        row_mirror.enabled = self.use_mirror
+        row_mirror.prop(data=self, property="mirror_directory")
+
+        # Worker pool
+        col_pool = layout.column(heading="Worker Pool")
+        col_pool.prop(data=self, property="pool_size")
+        col_limits = col_pool.column()
+        col_limits.active = bool(self.pool_size)
+        col_limits.prop(data=self, property="pool_max_jobs")
+        col_limits.prop(data=self, property="pool_max_memory")
+        for pid, jobs, memory, busy in pool.status():
+            col_pool.label(
+                text=f"{pid}: {jobs} runs, {memory // pool.MEGABYTE} MB",
+                icon="SORTTIME" if busy else "CHECKMARK",
+            )
+
+        # Scanning
+        col_scan = layout.column(heading="Scan")
+        col_scan.prop(data=self, property="scan_timeout")
+        col_scan.prop(data=self, property="index_source")
+        col_scan.prop(data=self, property="use_hashing")
+
+        # Allowlist
+        col_allowlist = layout.column(heading="Security")
+        col_allowlist.prop(data=self, property="allowlist_path")
+        col_allowlist.prop(data=self, property="allowlist_key_path")
+
+        # Configuration file
+        row_config = layout.row(align=True)
+        row_config.operator(operator="shelfmade.import_config", icon="IMPORT")
+        row_config.operator(operator="shelfmade.export_config", icon="EXPORT")
+
+        # Debugging
+        col_debug = layout.column(heading="Debug")
+        col_debug.prop(data=self, property="show_event_log")
+
+    def migrate_shelves(self):
+        """
+        Convert shelf settings stored by earlier versions of this add-on.
+        """
+        if TYPE_CHECKING:
+            shelf: shelf.Shelf
+
+        for shelf in self.shelves:
+            shelf.migrate_visibility()
+            shelf.compact_scripts()
+
+    def hash_scripts(self):
+        """
+        Hash the scripts of all shelves on a worker thread. Unchanged files are skipped.
+        """
+        hashing.hash_files_later(
+            paths=[path for shelf in self.shelves for path in shelf.script_paths()]
+        )
+
     def initialize_shelves(self):
         """
         Scan the script directories and initiate a script object for each script found.
+        Shelves found in the script index are served from it, all other directories are
+        listed concurrently; the results are applied to the shelves afterwards. Logs the
+        scan start and end, with duration and file counts.
+        """
+        if TYPE_CHECKING:
+            shelf: shelf.Shelf
+
+        events.log(kind="scan_start", shelves=len(self.shelves))
+        with events.timed(kind="scan_end", shelves=len(self.shelves)) as event:
+            # Look up or scan all shelf directories
+            results = scan.scan_shelves(shelves=list(self.shelves))
+
+            # Apply results
+            for shelf, file_names in zip(self.shelves, results):
+                shelf.apply_scan(file_names=file_names)
+
+            event["files"] = sum(len(file_names or []) for file_names in results)
+            event["unavailable"] = results.count(None)
+
+        if self.use_hashing:
+            self.hash_scripts()
+
+    def register_panels(self):
+        """
+        Register the shelf panels of all space types at least one shelf is enabled for
+        and deregister all others. Without any shelves, all shelf panels are registered
+        to offer the 'Add Shelf' button everywhere.
         """
         if TYPE_CHECKING:
             shelf: shelf.Shelf
 
-        # Scan all shelf directories
+        visibility = 0
         for shelf in self.shelves:
-            shelf.initialize_scripts()
+            visibility |= shelf.visibility
+
+        space_types = areas.space_types(
+            visibility=visibility if self.shelves else areas.ALL_AREAS
+        )
+        catalogue.Catalogue.bpy_sync_groups(groups=space_types)
+
+    def verify_script(self, path: str | Path) -> str:
+        """
+        Verify a script against the allowlist, if one is set. Blocked runs are logged.
+
+        Parameters:
+            - path (str | Path): Script file path
+
+        Returns:
+            - str: Reason the script may not run, empty if it may
+        """
+        if not self.allowlist_path:
+            return ""
+
+        path = Path(path)
+        try:
+            allowed = allowlist.is_allowed(
+                path=path,
+                filepath=self.allowlist_path,
+                key_path=self.allowlist_key_path,
+            )
+        except (OSError, ValueError) as e:
+            return f"Could not verify {path.name}: {e}"
+
+        if not allowed:
+            events.log(kind="run_blocked", path=path.as_posix())
+            return f"{path.name} is not on the allowlist"
+
+        return ""
+
+    def allowed_hashes(self) -> Set[str] | None:
+        """
+        Get the content hashes of the allowlist, if one is set, for checking the exact
+        source a script is compiled from.
+
+        Returns:
+            - set of str | None: Allowed content hashes, None if all scripts may run
+
+        Raises:
+            - OSError: If the allowlist or its key cannot be read
+            - ValueError: If the allowlist is not validly signed
+        """
+        if not self.allowlist_path:
+            return None
+
+        return allowlist.load(
+            filepath=self.allowlist_path,
+            key_path=self.allowlist_key_path,
+        )
 
     @staticmethod
     def this() -> Preferences:
@@ -0,0 +1,124 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Callable, Deque
+
+import importlib
+import time
+from collections import deque
+
+import bpy
+
+from . import preferences, runner, usage
+
+
+########################################################################################
+# Statics
+########################################################################################
+
+
+# Seconds to wait after start-up before warming up
+PRELOAD_DELAY = 2.0
+
+# Seconds between two work slices
+PRELOAD_INTERVAL = 0.1
+
+# Maximum seconds of work per slice
+PRELOAD_SLICE = 0.01
+
+# Pending warm-up tasks
+TASKS: Deque[Callable] = deque()
+
+
+########################################################################################
+# Tasks
+########################################################################################
+
+
+def compile_task(path: str, import_modules: bool) -> Callable:
+    """
+    Create a task compiling a script into the code cache. Its imports are queued as
+    separate tasks, so each slice stays short.
+
+    Parameters:
+        - path (str): Script file path
+        - import_modules (bool): Whether to queue the script's imports as well
+
+    Returns:
+        - callable: Task without arguments
+    """
+
+    def task():
+        try:
+            modules = runner.script_imports(path=path)
+        except (OSError, SyntaxError, ValueError):
+            return
+
+        if import_modules:
+            TASKS.extend(import_task(module=module) for module in modules)
+
+    return task
+
+
+def import_task(module: str) -> Callable:
+    """
+    Create a task importing a module, ignoring any failure.
+
+    Parameters:
+        - module (str): Module name
+
+    Returns:
+        - callable: Task without arguments
+    """
+
+    def task():
+        try:
+            importlib.import_module(module)
+        except Exception:
+            pass
+
+    return task
+
+
+########################################################################################
+# Timer
+########################################################################################
+
+
+def preload_step() -> float | None:
+    """
+    Run queued warm-up tasks until the time slice is used up.
+
+    Returns:
+        - float | None: Seconds until the next slice, None when done
+    """
+    deadline = time.perf_counter() + PRELOAD_SLICE
+    while TASKS and time.perf_counter() < deadline:
+        TASKS.popleft()()
+
+    return PRELOAD_INTERVAL if TASKS else None
+
+
+def start():
+    """
+    Queue the most used scripts of the usage history and start warming them up in the
+    background.
+    """
+    prefs = preferences.Preferences.this()
+    TASKS.clear()
+
+    for path in usage.most_used(limit=prefs.preload_scripts):
+        TASKS.append(compile_task(path=path, import_modules=prefs.preload_imports))
+
+    if TASKS and not bpy.app.timers.is_registered(preload_step):
+        bpy.app.timers.register(preload_step, first_interval=PRELOAD_DELAY)
+
+
+def stop():
+    """
+    Drop all pending warm-up tasks and remove the timer.
+    """
+    TASKS.clear()
+    if bpy.app.timers.is_registered(preload_step):
+        bpy.app.timers.unregister(preload_step)
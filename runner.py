@@ -0,0 +1,307 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from types import CodeType
+    from typing import Callable, Dict, Generator, List, Set, Tuple
+    from bpy.types import Context, Event
+
+import ast
+import inspect
+import time
+from pathlib import Path
+
+import bpy
+
+from . import hashing, tasks, toolkit
+
+
+########################################################################################
+# Statics
+########################################################################################
+
+
+# Compiled scripts, keyed by posix path; each value holds
+# (signature, content hash, code, imports)
+CODE_CACHE: Dict[str, Tuple[Tuple[int, int], str, CodeType, List[str]]] = {}
+
+# Maximum seconds a stepped script runs between two UI event checks
+STEP_SLICE = 0.05
+
+# Entry point of scripts processing the selected objects in chunks
+PROCESS_FUNCTION = "process_selected"
+
+# Hook of scripts run through the Invoke run context, called with context & event
+INVOKE_FUNCTION = "invoke"
+
+
+########################################################################################
+# Compiled code cache
+########################################################################################
+
+
+def file_signature(path: str | Path) -> Tuple[int, int]:
+    """
+    Generate a cheap signature to detect file changes without reading the file.
+
+    Parameters:
+        - path (str | Path)
+
+    Returns:
+        - tuple of int: File size and modification time in nanoseconds
+    """
+    stat = Path(path).stat()
+    return stat.st_size, stat.st_mtime_ns
+
+
+def find_imports(tree: ast.Module) -> List[str]:
+    """
+    Collect the top level module names imported by a script.
+
+    Parameters:
+        - tree (Module): Parsed script
+
+    Returns:
+        - list of str: Root module names, in order of appearance
+    """
+    modules = []
+    for node in tree.body:
+        if isinstance(node, ast.Import):
+            names = [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom) and not node.level and node.module:
+            names = [node.module]
+        else:
+            continue
+
+        for name in names:
+            root = name.split(".")[0]
+            if root not in modules:
+                modules.append(root)
+
+    return modules
+
+
+def check_allowed(path: str, digest: str, allowed: Set[str] | None):
+    """
+    Check the content hash of the code about to be run against the allowed hashes.
+
+    Parameters:
+        - path (str): Posix path
+        - digest (str): Content hash of the compiled source
+        - allowed (set of str | None): Allowed content hashes, None to allow all
+
+    Raises:
+        - PermissionError: If the content is not allowed
+    """
+    if allowed is not None and digest not in allowed:
+        raise PermissionError(f"{Path(path).name} is not on the allowlist")
+
+
+def compile_script(path: str | Path, allowed: Set[str] | None = None) -> CodeType:
+    """
+    Compile a script file, re-using the cached code object if the file is unchanged.
+    Files whose size or modification time changed are read and hashed; if the content
+    is still the same, they are not compiled again. If allowed hashes are given, the
+    hash of the very source the code was compiled from is checked, so a file changed
+    after its verification is never run.
+
+    Parameters:
+        - path (str | Path)
+        - allowed (set of str | None): Allowed content hashes, None to allow all
+
+    Returns:
+        - CodeType: Compiled script
+
+    Raises:
+        - PermissionError: If the content is not allowed
+    """
+    key = Path(path).as_posix()
+    signature = file_signature(path=path)
+
+    # Cache hit
+    cached = CODE_CACHE.get(key)
+    if cached and cached[0] == signature:
+        check_allowed(path=key, digest=cached[1], allowed=allowed)
+        return cached[2]
+
+    # Content unchanged, e.g. only touched or copied
+    source = Path(path).read_bytes()
+    digest = hashing.store_hash(path=key, signature=signature, data=source)
+    check_allowed(path=key, digest=digest, allowed=allowed)
+    if cached and cached[1] == digest:
+        CODE_CACHE[key] = (signature, *cached[1:])
+        return cached[2]
+
+    # Parse & compile
+    tree = ast.parse(source, filename=key)
+    code = compile(tree, filename=key, mode="exec")
+    CODE_CACHE[key] = (signature, digest, code, find_imports(tree=tree))
+
+    return code
+
+
+def script_imports(path: str | Path) -> List[str]:
+    """
+    Get the top level imports of a script, compiling it if necessary.
+
+    Parameters:
+        - path (str | Path)
+
+    Returns:
+        - list of str: Root module names
+    """
+    compile_script(path=path)
+    return CODE_CACHE[Path(path).as_posix()][3]
+
+
+def run_script(path: str | Path, allowed: Set[str] | None = None) -> dict:
+    """
+    Execute a script file as '__main__' from the compiled code cache, with the script
+    helpers available as 'shelfmade'. If the script defines an 'async def main()', it
+    is started on the add-on's event loop afterwards and keeps running in the
+    background.
+
+    Parameters:
+        - path (str | Path)
+        - allowed (set of str | None): Allowed content hashes, None to allow all
+
+    Returns:
+        - dict: Script namespace
+
+    Raises:
+        - PermissionError: If the content is not allowed
+    """
+    code = compile_script(path=path, allowed=allowed)
+    namespace = {
+        "__name__": "__main__",
+        "__file__": Path(path).as_posix(),
+        "shelfmade": toolkit,
+    }
+    exec(code, namespace)
+
+    # Async mode
+    main = namespace.get("main")
+    if inspect.iscoroutinefunction(main):
+        tasks.start(path=path, coroutine=main())
+
+    return namespace
+
+
+def invoke_script(namespace: dict, context: Context, event: Event):
+    """
+    Call a script's 'invoke' hook with the event its run operator was invoked with, if
+    it defines one, e.g. to use the mouse position or modifier keys.
+
+    Parameters:
+        - namespace (dict): Script namespace, as returned by 'run_script'
+        - context (Context)
+        - event (Event)
+    """
+    invoke = namespace.get(INVOKE_FUNCTION)
+    if callable(invoke):
+        invoke(context, event)
+
+
+########################################################################################
+# Stepped scripts
+########################################################################################
+
+
+def main_steps(namespace: dict) -> Generator | None:
+    """
+    Start a script's 'main' generator, if it defines one. Stepped scripts do their work
+    in chunks, yielding after each one; yielded numbers between 0 and 1 report their
+    progress.
+
+    Parameters:
+        - namespace (dict): Script namespace, as returned by 'run_script'
+
+    Returns:
+        - Generator | None: Script steps, None if the script is not stepped
+    """
+    main = namespace.get("main")
+    if inspect.isgeneratorfunction(main):
+        return main()
+
+
+def process_steps(
+    namespace: dict,
+    names: List[str],
+    chunk_size: int,
+) -> Generator | None:
+    """
+    Start a script's 'process_selected' function on objects, if it defines one. The
+    objects are handed over in chunks, each one being a step; a script's 'CHUNK_SIZE'
+    replaces the default chunk size. Objects are kept by name between steps and looked
+    up again for each chunk, skipping those removed in the meantime.
+
+    Parameters:
+        - namespace (dict): Script namespace, as returned by 'run_script'
+        - names (list of str): Names of the objects to process, usually the selected
+        - chunk_size (int): Default amount of objects per chunk
+
+    Returns:
+        - Generator | None: Script steps, None if the script defines no
+          'process_selected'
+    """
+    process = namespace.get(PROCESS_FUNCTION)
+    if not callable(process):
+        return None
+
+    def process_chunk(chunk: List[str]):
+        objects = bpy.data.objects
+        process([objects[name] for name in chunk if name in objects])
+
+    return chunk_steps(
+        function=process_chunk,
+        items=names,
+        chunk_size=namespace.get("CHUNK_SIZE", chunk_size),
+    )
+
+
+def chunk_steps(function: Callable, items: List, chunk_size: int) -> Generator:
+    """
+    Call a function on consecutive chunks of items, yielding the progress after each.
+
+    Parameters:
+        - function (callable): Takes a list of items
+        - items (list)
+        - chunk_size (int): Maximum amount of items per call
+
+    Returns:
+        - Generator: Yields the processed share of items between 0 and 1
+    """
+    chunk_size = max(int(chunk_size), 1)
+    for start in range(0, len(items), chunk_size):
+        function(items[start : start + chunk_size])
+        yield min(start + chunk_size, len(items)) / len(items)
+
+
+def run_steps(
+    steps: Generator,
+    duration: float = STEP_SLICE,
+) -> Tuple[bool, float | None]:
+    """
+    Advance a stepped script until the time slice is used up or the script is done.
+
+    Parameters:
+        - steps (Generator): Script steps, as returned by 'main_steps'
+        - duration (float): Seconds of the time slice
+
+    Returns:
+        - tuple: Whether the script is done & its last reported progress between 0
+          and 1, None if it did not report any
+    """
+    deadline = time.perf_counter() + duration
+    progress = None
+    try:
+        while True:
+            value = next(steps)
+            if isinstance(value, (int, float)):
+                progress = min(max(float(value), 0.0), 1.0)
+
+            if time.perf_counter() >= deadline:
+                return False, progress
+
+    except StopIteration:
+        return True, progress
@@ -0,0 +1,496 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Any, Dict, List, Set
+
+import argparse
+import asyncio
+import contextlib
+import hashlib
+import json
+import mmap
+import os
+import struct
+import sys
+import tempfile
+import traceback
+from pathlib import Path
+from types import SimpleNamespace
+
+
+# This module must not import bpy or any sibling module at module level, as it is also
+# run on its own in the isolated process, either by Python or by Blender in background
+# mode:
+#   python sandbox.py --script tool.py --output results.bin
+#   blender -b --factory-startup --python sandbox.py -- --script tool.py --output ...
+# Scripts hand results back with 'shelfmade.result(name, value)'. Arrays & bytes are
+# written to a memory-mapped result file and read back as views, without copies.
+# With '--serve', the process stays alive as a pool worker; it reads one JSON job per
+# line from stdin and answers each with a prefixed JSON line on stdout.
+
+
+########################################################################################
+# Statics
+########################################################################################
+
+
+# Byte alignment of each buffer within the result file
+RESULT_ALIGNMENT = 64
+
+# Header length prefix of the result file: little endian unsigned 64 bit integer
+LENGTH_FORMAT = "<Q"
+
+# Lines of the isolated process' error output to report on failure
+ERROR_LINES = 20
+
+# Prefix of pool worker responses, telling them apart from Blender's own output
+RESPONSE_PREFIX = "shelfmade:"
+
+# Results of the isolated script, collected within the isolated process
+RESULTS: Dict[str, Any] = {}
+
+# Results of the last isolated run of each script, keyed by posix script path
+LAST_RESULTS: Dict[str, IsolatedResults] = {}
+
+# Result files that could not be removed yet, e.g. still mapped on Windows
+STALE_FILES: Set[Path] = set()
+
+
+########################################################################################
+# Result file
+########################################################################################
+
+
+def result(name: str, value: Any):
+    """
+    Hand a result back to the add-on. Called by isolated scripts as
+    'shelfmade.result'.
+
+    Parameters:
+        - name (str): Result name
+        - value (any): Array (anything exposing the buffer protocol with a 'dtype' &
+          'shape', e.g. numpy arrays), bytes or any JSON compatible value
+    """
+    RESULTS[name] = value
+
+
+def write_results(results: Dict[str, Any], filepath: str | Path):
+    """
+    Write results to a file: a length prefixed JSON header describing all entries,
+    followed by the raw, aligned buffers of arrays & bytes.
+
+    Parameters:
+        - results (dict): Result names & values
+        - filepath (str | Path)
+    """
+    entries = {}
+    buffers = []
+    offset = 0
+    for name, value in results.items():
+        if hasattr(value, "dtype") and hasattr(value, "shape"):
+            if not memoryview(value).c_contiguous:
+                value = value.copy()
+            buffer = memoryview(value).cast("B")
+            entry = {"kind": "array", "dtype": value.dtype.str, "shape": value.shape}
+        elif isinstance(value, (bytes, bytearray, memoryview)):
+            buffer = memoryview(value).cast("B")
+            entry = {"kind": "bytes"}
+        else:
+            entries[name] = {"kind": "json", "value": value}
+            continue
+
+        offset += -offset % RESULT_ALIGNMENT
+        entry.update(offset=offset, size=buffer.nbytes)
+        entries[name] = entry
+        buffers.append((offset, buffer))
+        offset += buffer.nbytes
+
+    header = json.dumps(entries).encode("utf-8")
+    start = struct.calcsize(LENGTH_FORMAT) + len(header)
+    start += -start % RESULT_ALIGNMENT
+
+    with open(filepath, "wb") as result_file:
+        result_file.write(struct.pack(LENGTH_FORMAT, len(header)) + header)
+        for buffer_offset, buffer in buffers:
+            result_file.seek(start + buffer_offset)
+            result_file.write(buffer)
+
+
+class IsolatedResults(dict):
+    """
+    Results of an isolated run. Arrays & bytes are views into the memory-mapped result
+    file, which is removed once closed.
+    """
+
+    def __init__(self, filepath: str | Path):
+        super().__init__()
+        self.filepath = Path(filepath)
+        self.map = None
+
+        with open(self.filepath, "rb") as result_file:
+            if os.fstat(result_file.fileno()).st_size:
+                self.map = mmap.mmap(result_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if self.map is not None:
+            self.update(read_results(data=self.map))
+
+    def close(self):
+        """
+        Release the result file. Arrays still in use keep it mapped until they are
+        garbage collected; a file that cannot be removed meanwhile is removed on a
+        later 'release'.
+        """
+        self.clear()
+        if self.map is not None:
+            try:
+                self.map.close()
+            except BufferError:
+                pass
+
+        try:
+            self.filepath.unlink(missing_ok=True)
+        except OSError:
+            STALE_FILES.add(self.filepath)
+
+
+def read_results(data: mmap.mmap) -> Dict[str, Any]:
+    """
+    Read results from a mapped result file. Arrays become numpy arrays if numpy is
+    available, else they are returned as memory views like bytes; both share the
+    mapped memory.
+
+    Parameters:
+        - data (mmap): Mapped result file
+
+    Returns:
+        - dict: Result names & values
+    """
+    length = struct.unpack_from(LENGTH_FORMAT, data)[0]
+    header_start = struct.calcsize(LENGTH_FORMAT)
+    entries = json.loads(data[header_start : header_start + length])
+    start = header_start + length
+    start += -start % RESULT_ALIGNMENT
+
+    try:
+        import numpy
+    except ImportError:
+        numpy = None
+
+    results = {}
+    view = memoryview(data)
+    for name, entry in entries.items():
+        if entry["kind"] == "json":
+            results[name] = entry["value"]
+            continue
+
+        buffer = view[start + entry["offset"] : start + entry["offset"] + entry["size"]]
+        if entry["kind"] == "array" and numpy is not None:
+            results[name] = numpy.frombuffer(buffer, dtype=entry["dtype"]).reshape(
+                entry["shape"]
+            )
+        else:
+            results[name] = buffer
+
+    return results
+
+
+########################################################################################
+# Isolated runs
+########################################################################################
+
+
+def command(
+    script_path: str | Path | None,
+    output_path: str | Path | None,
+    python: str | None = None,
+    blender: str | None = None,
+    blend_file: str | Path | None = None,
+    digest: str | None = None,
+) -> List[str]:
+    """
+    Generate the command running a script in an isolated process, or starting a pool
+    worker if no script is given.
+
+    Parameters:
+        - script_path (str | Path | None)
+        - output_path (str | Path | None): Result file
+        - python (str | None): Python executable, for pure Python scripts
+        - blender (str | None): Blender executable, run in background mode; used if
+          no Python executable is given
+        - blend_file (str | Path | None): File for Blender to open first
+        - digest (str | None): Verified content hash the script must still have
+
+    Returns:
+        - list of str: Command arguments
+    """
+    if script_path is None:
+        arguments = ["--serve"]
+    else:
+        arguments = ["--script", str(script_path), "--output", str(output_path)]
+        if digest:
+            arguments += ["--digest", digest]
+    if python:
+        return [python, "-I", __file__, *arguments]
+
+    blender_arguments = [blender, "-b"]
+    if blend_file:
+        blender_arguments.append(str(blend_file))
+
+    return [
+        *blender_arguments,
+        "--factory-startup",
+        "--python",
+        __file__,
+        "--",
+        *arguments,
+    ]
+
+
+async def run_isolated(
+    script_path: str | Path,
+    python: str | None = None,
+    blender: str | None = None,
+    blend_file: str | Path | None = None,
+    digest: str | None = None,
+) -> IsolatedResults:
+    """
+    Run a script in a separate process and read its results. A crashing script only
+    takes down its own process. If cancelled, the process is killed. The results are
+    also kept as the script's last results.
+
+    Parameters:
+        - script_path (str | Path)
+        - python (str | None): Python executable, for pure Python scripts
+        - blender (str | None): Blender executable, used if no Python is given
+        - blend_file (str | Path | None): File for Blender to open first
+        - digest (str | None): Verified content hash; the process refuses to run the
+          script if its content differs by then
+
+    Returns:
+        - IsolatedResults
+
+    Raises:
+        - RuntimeError: If the isolated process fails
+    """
+    output_file, output_path = tempfile.mkstemp(prefix="shelfmade_", suffix=".bin")
+    os.close(output_file)
+
+    process = await asyncio.create_subprocess_exec(
+        *command(
+            script_path=script_path,
+            output_path=output_path,
+            python=python,
+            blender=blender,
+            blend_file=blend_file,
+            digest=digest,
+        ),
+        stdout=asyncio.subprocess.DEVNULL,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    try:
+        _, error_output = await process.communicate()
+    except asyncio.CancelledError:
+        process.kill()
+        await process.wait()
+        Path(output_path).unlink(missing_ok=True)
+        raise
+
+    if process.returncode:
+        Path(output_path).unlink(missing_ok=True)
+        lines = error_output.decode("utf-8", "replace").splitlines()[-ERROR_LINES:]
+        raise RuntimeError(
+            f"Isolated run of {Path(script_path).name} failed with exit code "
+            f"{process.returncode}:\n" + "\n".join(lines)
+        )
+
+    return store_results(script_path=script_path, output_path=output_path)
+
+
+def store_results(script_path: str | Path, output_path: str | Path) -> IsolatedResults:
+    """
+    Read a result file, replacing the previous results of the script.
+
+    Parameters:
+        - script_path (str | Path)
+        - output_path (str | Path): Result file
+
+    Returns:
+        - IsolatedResults
+    """
+    results = IsolatedResults(filepath=output_path)
+    key = Path(script_path).as_posix()
+    if key in LAST_RESULTS:
+        LAST_RESULTS.pop(key).close()
+    LAST_RESULTS[key] = results
+
+    return results
+
+
+def release():
+    """
+    Close the last results of all scripts, removing their result files, and retry
+    removing result files that could not be removed before.
+    """
+    for results in LAST_RESULTS.values():
+        results.close()
+
+    LAST_RESULTS.clear()
+
+    for filepath in list(STALE_FILES):
+        try:
+            filepath.unlink(missing_ok=True)
+            STALE_FILES.discard(filepath)
+        except OSError:
+            pass
+
+
+########################################################################################
+# Isolated process
+########################################################################################
+
+
+def run_job(
+    script_path: str | Path,
+    output_path: str | Path,
+    digest: str | None = None,
+):
+    """
+    Run a script within the isolated process and write its results. The source is read
+    once; with a digest, exactly those bytes must match the content verified by the
+    add-on, so a file changed since is never run.
+
+    Parameters:
+        - script_path (str | Path)
+        - output_path (str | Path): Result file
+        - digest (str | None): Verified content hash, None to skip the check
+
+    Raises:
+        - PermissionError: If the content differs from the verified one
+    """
+    RESULTS.clear()
+    script_path = Path(script_path)
+    source = script_path.read_bytes()
+    if digest and hashlib.blake2b(source).hexdigest() != digest:
+        raise PermissionError(f"{script_path.name} changed since it was verified")
+
+    code = compile(source, script_path.as_posix(), "exec")
+    exec(
+        code,
+        {
+            "__name__": "__main__",
+            "__file__": script_path.as_posix(),
+            "shelfmade": SimpleNamespace(result=result),
+        },
+    )
+    write_results(results=RESULTS, filepath=output_path)
+
+
+def open_file(blend_file: str | None):
+    """
+    Open a blend file in a Blender pool worker, or an empty file to drop the data of the
+    previous job. Does nothing in pure Python workers.
+
+    Parameters:
+        - blend_file (str | None)
+    """
+    try:
+        import bpy
+    except ImportError:
+        return
+
+    if blend_file:
+        bpy.ops.wm.open_mainfile(filepath=blend_file)
+    else:
+        bpy.ops.wm.read_homefile(use_empty=True)
+
+
+def memory_usage() -> int:
+    """
+    Get the memory used by this process; the current resident size where available,
+    else the peak.
+
+    Returns:
+        - int: Bytes, 0 if unknown
+    """
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * mmap.PAGESIZE
+    except (OSError, IndexError, ValueError):
+        pass
+
+    try:
+        import resource
+    except ImportError:
+        return 0
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def serve() -> int:
+    """
+    Run jobs read from stdin until it is closed. Script output is redirected to stderr,
+    so stdout only carries responses.
+
+    Returns:
+        - int: Exit code
+    """
+    for line in sys.stdin:
+        job = json.loads(line)
+        response = {"ok": True}
+        try:
+            with contextlib.redirect_stdout(sys.stderr):
+                open_file(blend_file=job.get("blend_file"))
+                run_job(
+                    script_path=job["script"],
+                    output_path=job["output"],
+                    digest=job.get("digest"),
+                )
+        except Exception:
+            lines = traceback.format_exc().splitlines()[-ERROR_LINES:]
+            response = {"ok": False, "error": "\n".join(lines)}
+
+        response["memory"] = memory_usage()
+        sys.stdout.write(RESPONSE_PREFIX + json.dumps(response) + "\n")
+        sys.stdout.flush()
+
+    return 0
+
+
+def main(arguments: List[str]) -> int:
+    """
+    Run a script within the isolated process, or serve jobs as pool worker.
+
+    Parameters:
+        - arguments (list of str): Command line arguments
+
+    Returns:
+        - int: Exit code
+    """
+    parser = argparse.ArgumentParser(description="Run a Shelf Made script isolated")
+    parser.add_argument("--script", help="Script file path")
+    parser.add_argument("--output", help="Result file path")
+    parser.add_argument("--digest", help="Verified content hash of the script")
+    parser.add_argument("--serve", action="store_true", help="Run jobs from stdin")
+    parsed = parser.parse_args(arguments)
+
+    if parsed.serve:
+        return serve()
+
+    if not parsed.script or not parsed.output:
+        parser.error("--script & --output are required")
+
+    run_job(
+        script_path=parsed.script,
+        output_path=parsed.output,
+        digest=parsed.digest,
+    )
+
+    return 0
+
+
+if __name__ == "__main__":
+    # Blender passes script arguments after '--'
+    argv = sys.argv[sys.argv.index("--") + 1 :] if "--" in sys.argv else sys.argv[1:]
+    sys.exit(main(arguments=argv))
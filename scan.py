@@ -0,0 +1,393 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Dict, List
+    from .shelf import Shelf
+
+import os
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from pathlib import Path
+
+import bpy
+
+from . import events, index, preferences
+
+
+########################################################################################
+# Statics
+########################################################################################
+
+
+# Maximum amount of directories listed at the same time
+MAX_WORKERS = 16
+
+# Consecutive failures after which a directory is skipped
+FAILURE_THRESHOLD = 2
+
+# Seconds to wait before retrying a skipped directory, doubled on each failure
+BACKOFF_MIN = 5.0
+BACKOFF_MAX = 300.0
+
+# Seconds between two checks for background retries
+RETRY_INTERVAL = 1.0
+
+# Worker pool used for directory scans only, so hung scans never hold up other work;
+# created on first use
+EXECUTOR: ThreadPoolExecutor | None = None
+
+# Circuit breaker state per directory; 'failures' count, 'retry' time & 'pending' scan
+BREAKERS: Dict[str, dict] = {}
+
+# Script index fetch that timed out and is still running, if any
+INDEX_FETCH: Dict[str, Future | None] = {"pending": None}
+
+
+########################################################################################
+# Worker pool
+########################################################################################
+
+
+def executor() -> ThreadPoolExecutor:
+    """
+    Get the scan worker pool, creating it if necessary.
+
+    Returns:
+        - ThreadPoolExecutor
+    """
+    global EXECUTOR
+    if not EXECUTOR:
+        EXECUTOR = ThreadPoolExecutor(
+            max_workers=MAX_WORKERS,
+            thread_name_prefix="shelfmade_scan",
+        )
+
+    return EXECUTOR
+
+
+def shutdown():
+    """
+    Stop background retries and shut the scan worker pool down without waiting for
+    running scans.
+    """
+    global EXECUTOR
+    if bpy.app.timers.is_registered(retry_timer):
+        bpy.app.timers.unregister(retry_timer)
+
+    if EXECUTOR:
+        EXECUTOR.shutdown(wait=False)
+        EXECUTOR = None
+
+    BREAKERS.clear()
+    INDEX_FETCH["pending"] = None
+
+
+########################################################################################
+# Circuit breaker
+########################################################################################
+
+
+def is_unavailable(directory: str | Path) -> bool:
+    """
+    Check whether a directory is currently skipped, either because it failed too often
+    or because a previous scan of it has not returned yet.
+
+    Parameters:
+        - directory (str | Path)
+
+    Returns:
+        - bool: Whether the directory must not be scanned right now
+    """
+    breaker = BREAKERS.get(Path(directory).as_posix())
+    if not breaker:
+        return False
+
+    pending = breaker["pending"]
+    return bool(pending and not pending.done()) or (
+        breaker["failures"] >= FAILURE_THRESHOLD
+    )
+
+
+def is_unreachable(directory: str | Path) -> bool:
+    """
+    Check whether the last scan of a directory failed without confirming it missing,
+    e.g. because it timed out, was denied or is skipped by its circuit breaker.
+
+    Parameters:
+        - directory (str | Path)
+
+    Returns:
+        - bool: Whether the directory may still exist
+    """
+    return Path(directory).as_posix() in BREAKERS
+
+
+def record_failure(directory: str, pending: Future | None = None):
+    """
+    Count a failed scan and schedule the next background retry with exponential
+    backoff.
+
+    Parameters:
+        - directory (str): Posix path
+        - pending (Future | None): Scan that timed out and is still running
+    """
+    breaker = BREAKERS.setdefault(directory, {"failures": 0, "pending": None})
+    breaker["failures"] += 1
+    breaker["pending"] = pending
+
+    backoff = BACKOFF_MIN * 2 ** (breaker["failures"] - 1)
+    breaker["retry"] = time.monotonic() + min(backoff, BACKOFF_MAX)
+
+    if not bpy.app.timers.is_registered(retry_timer):
+        bpy.app.timers.register(retry_timer, persistent=True)
+
+    events.log(
+        kind="scan_failure",
+        directory=directory,
+        failures=breaker["failures"],
+        timeout=pending is not None,
+    )
+    print(f"Shelf directory {directory} unavailable ({breaker['failures']} failures)")
+
+
+def record_success(directory: str):
+    """
+    Reset the circuit breaker of a directory.
+
+    Parameters:
+        - directory (str): Posix path
+    """
+    BREAKERS.pop(directory, None)
+
+
+def retry_timer() -> float | None:
+    """
+    Retry failed directories in the background once their backoff has passed. Shelves
+    of recovered directories are updated right away.
+
+    Returns:
+        - float | None: Seconds until the next call, None once all have recovered
+    """
+    if TYPE_CHECKING:
+        shelf: Shelf
+
+    recovered = {}
+    for directory, breaker in list(BREAKERS.items()):
+        pending = breaker["pending"]
+
+        # Start a retry
+        if not pending:
+            if time.monotonic() >= breaker["retry"]:
+                breaker["pending"] = executor().submit(list_scripts, directory)
+            continue
+
+        # Wait for the retry
+        if not pending.done():
+            continue
+
+        # Evaluate the retry
+        try:
+            recovered[directory] = pending.result()
+            record_success(directory=directory)
+        except (FileNotFoundError, NotADirectoryError):
+            record_success(directory=directory)
+        except OSError:
+            record_failure(directory=directory)
+
+    # Update recovered shelves
+    if recovered:
+        for shelf in preferences.Preferences.this().shelves:
+            if not shelf.directory:
+                continue
+
+            directory = shelf.script_directory().as_posix()
+            if directory in recovered:
+                shelf.apply_scan(file_names=recovered[directory])
+
+        for window in bpy.context.window_manager.windows:
+            for area in window.screen.areas:
+                area.tag_redraw()
+
+    return RETRY_INTERVAL if BREAKERS else None
+
+
+########################################################################################
+# Directory scanning
+########################################################################################
+
+
+def list_scripts(directory: str | Path) -> List[str]:
+    """
+    List the Python scripts within a directory and log the duration. Never touches
+    bpy, so it is safe to call from a worker thread.
+
+    Parameters:
+        - directory (str | Path)
+
+    Returns:
+        - list of str: Sorted script file names
+    """
+    with events.timed(kind="scan_directory", directory=str(directory)) as event:
+        with os.scandir(directory) as entries:
+            file_names = [entry.name for entry in entries if entry.name.endswith(".py")]
+
+        event["files"] = len(file_names)
+
+    return sorted(file_names)
+
+
+def scan_directories(
+    directories: List[str | Path | None],
+    timeout: float | None = None,
+) -> List[List[str] | None]:
+    """
+    List the Python scripts of several directories concurrently on worker threads, so
+    the total time is bound by the slowest directory rather than the sum of all.
+    Directories that do not respond within the timeout, or are skipped by their circuit
+    breaker, are reported as unavailable.
+
+    Parameters:
+        - directories (list of str | Path | None)
+        - timeout (float | None): Seconds to wait, defaults to the preferences setting
+
+    Returns:
+        - list of (list of str | None): Sorted script file names per directory, None if
+          the directory is unavailable; in input order
+    """
+    if timeout is None:
+        timeout = preferences.Preferences.this().scan_timeout
+
+    # Submit all directories that are not skipped
+    results = [None] * len(directories)
+    futures = {}
+    for i, directory in enumerate(directories):
+        if directory and not is_unavailable(directory=directory):
+            futures[executor().submit(list_scripts, directory)] = i
+
+    if not futures:
+        return results
+
+    # Collect
+    done, not_done = wait(futures, timeout=timeout)
+    for future in done:
+        i = futures[future]
+        directory = Path(directories[i]).as_posix()
+        try:
+            results[i] = future.result()
+            record_success(directory=directory)
+        except (FileNotFoundError, NotADirectoryError):
+            record_success(directory=directory)
+        except OSError:
+            record_failure(directory=directory)
+
+    for future in not_done:
+        directory = Path(directories[futures[future]]).as_posix()
+        record_failure(directory=directory, pending=future)
+
+    return results
+
+
+def scan_directory(directory: str | Path | None) -> List[str] | None:
+    """
+    List the Python scripts within a single directory on a worker thread.
+
+    Parameters:
+        - directory (str | Path | None)
+
+    Returns:
+        - list of str | None: Sorted script file names, None if unavailable
+    """
+    return scan_directories(directories=[directory])[0]
+
+
+def fetch_index(index_provider: index.IndexProvider) -> Dict[str, List[dict]]:
+    """
+    Fetch a script index and log the duration. Never touches bpy, so it is safe to call
+    from a worker thread.
+
+    Parameters:
+        - index_provider (IndexProvider)
+
+    Returns:
+        - dict: Posix directory keys, lists of script dictionaries values
+    """
+    with events.timed(kind="index_fetch", source=index_provider.source):
+        return index_provider.fetch()
+
+
+def indexed_scripts(
+    directories: List[str],
+    timeout: float | None = None,
+) -> Dict[str, List[str]]:
+    """
+    Look shelf directories up in the configured script index, if any. The index is
+    fetched on a scan worker; if it does not respond within the timeout, or a previous
+    fetch has not returned yet, no directory is indexed.
+
+    Parameters:
+        - directories (list of str): Posix shelf directories
+        - timeout (float | None): Seconds to wait, defaults to the preferences setting
+
+    Returns:
+        - dict: Directory keys, sorted script file name values; only indexed
+          directories are included
+    """
+    prefs = preferences.Preferences.this()
+    index_provider = index.provider(source=prefs.index_source)
+    if not index_provider:
+        return {}
+
+    pending = INDEX_FETCH["pending"]
+    if pending and not pending.done():
+        return {}
+
+    if timeout is None:
+        timeout = prefs.scan_timeout
+
+    future = executor().submit(fetch_index, index_provider)
+    done, _ = wait([future], timeout=timeout)
+    if not done:
+        INDEX_FETCH["pending"] = future
+        print(f"Script index {index_provider.source} timed out")
+        return {}
+
+    try:
+        directory_index = future.result()
+    except (OSError, ValueError) as e:
+        print(f"Could not fetch script index {index_provider.source}: {e}")
+        return {}
+
+    return {
+        directory: sorted(script["name"] for script in directory_index[directory])
+        for directory in directories
+        if directory in directory_index
+    }
+
+
+def scan_shelves(shelves: List[Shelf]) -> List[List[str] | None]:
+    """
+    Get the script file names of several shelves. Shelves found in the script index are
+    served from it, all others are scanned concurrently.
+
+    Parameters:
+        - shelves (list of Shelf)
+
+    Returns:
+        - list of (list of str | None): Sorted script file names per shelf, None if the
+          shelf is unavailable; in input order
+    """
+    indexed = indexed_scripts(
+        directories=[shelf.directory for shelf in shelves if shelf.directory]
+    )
+    directories = [
+        shelf.script_directory()
+        if shelf.directory and shelf.directory not in indexed
+        else None
+        for shelf in shelves
+    ]
+    results = scan_directories(directories=directories)
+
+    return [
+        indexed.get(shelf.directory, result) for shelf, result in zip(shelves, results)
+    ]
@@ -2,6 +2,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from typing import Dict, List, Tuple
     from bpy.types import Context
 
 from pathlib import Path
@@ -10,13 +11,58 @@ import bpy
 from bpy.props import (
     BoolProperty,
     CollectionProperty,
+    EnumProperty,
     IntProperty,
     FloatProperty,
     StringProperty,
 )
 from bpy.types import PropertyGroup
 
-from . import catalogue
+from . import areas, catalogue, events, hashing, mirror, scan, utils
+
+
+########################################################################################
+# Statics
+########################################################################################
+
+
+# Script file names found by the last scan, keyed by posix shelf directory; scripts are
+# only stored in the preferences once customized
+SCRIPT_FILES: Dict[str, List[str]] = {}
+
+# Undo policies of scripts
+UNDO_POLICIES = (
+    ("PUSH", "Undo Step", "Store an undo step after each run"),
+    (
+        "GROUPED",
+        "Grouped",
+        "Store a single undo step for consecutive runs of grouped scripts",
+    ),
+    (
+        "NONE",
+        "No Undo",
+        "Skip the undo step, which is costly in large scenes; for read-only tools like "
+        "exporters or reports",
+    ),
+)
+
+# Operator contexts scripts are run in from their shelf buttons
+RUN_CONTEXTS = (
+    ("EXEC_DEFAULT", "Execute", "Run right away"),
+    (
+        "INVOKE_DEFAULT",
+        "Invoke",
+        "Run through the run operator's invoke, as keymaps & menus do; the event is "
+        "handed to the script's invoke(context, event) function",
+    ),
+)
+
+# Run operator of each script undo policy
+RUN_OPERATORS = {
+    "PUSH": "wm.run_script",
+    "GROUPED": "wm.run_script_grouped",
+    "NONE": "wm.run_script_no_undo",
+}
 
 
 ########################################################################################
@@ -26,7 +72,8 @@ from . import catalogue
 
 def update_directory(shelf: Shelf, context: Context):
     """
-    Re-scans scripts on any directory change. Saves userprefs.
+    Re-scans scripts on any directory change. Saves userprefs. Both are deferred while
+    a batch is open.
 
     Parameters:
         - shelf (Shelf)
@@ -41,11 +88,13 @@ def update_directory(shelf: Shelf, context: Context):
             shelf.directory = posix_path
             return
 
-        # Re-initialize scripts
-        shelf.initialize_scripts()
+        # Re-initialize scripts & mirror the new directory
+        if not utils.defer(update="scan"):
+            shelf.initialize_scripts()
+            mirror.start()
 
     # Save user preferences
-    bpy.ops.wm.save_userpref()
+    utils.save_userpref()
 
 
 def update_save_userpref(shelf: Shelf, context: Context):
@@ -56,7 +105,22 @@ def update_save_userpref(shelf: Shelf, context: Context):
         - shelf (Shelf)
         - context (Context)
     """
-    bpy.ops.wm.save_userpref()
+    utils.save_userpref()
+
+
+def update_visibility(shelf: Shelf, context: Context):
+    """
+    Register or deregister shelf panels after an area visibility change. Deferred
+    while a batch is open.
+
+    Parameters:
+        - shelf (Shelf)
+        - context (Context)
+    """
+    if utils.defer(update="panels"):
+        return
+
+    context.preferences.addons[__package__].preferences.register_panels()
 
 
 ########################################################################################
@@ -66,12 +130,58 @@ def update_save_userpref(shelf: Shelf, context: Context):
 
 @catalogue.bpy_register
 class Script(PropertyGroup):
-    """Representation of a single script within a shelf"""
+    """Customized display name, icon, position or run options of a single script"""
 
     display_name: StringProperty(name="Name")
     icon: StringProperty(name="Icon", default="NONE")
     is_available: BoolProperty(name="Is Available", default=True)
     name: StringProperty(name="File Name")
+    run_context: EnumProperty(items=RUN_CONTEXTS, name="Run Context")
+    undo: EnumProperty(items=UNDO_POLICIES, name="Undo")
+
+    def is_default(self) -> bool:
+        """
+        Returns:
+            - bool: Whether display name, icon & run options are not customized
+        """
+        return (
+            self.display_name in {"", Path(self.name).stem}
+            and self.icon == "NONE"
+            and self.run_context == "EXEC_DEFAULT"
+            and self.undo == "PUSH"
+        )
+
+
+def script_entry(
+    file_name: str,
+    script: Script | None = None,
+) -> Tuple[str, str, str, str, str]:
+    """
+    Generate the display & run settings of a script, customized or not.
+
+    Parameters:
+        - file_name (str): Script file name
+        - script (Script | None): Stored customizations, if any
+
+    Returns:
+        - tuple of str: File name, display name, icon, run operator & its context
+    """
+    if script:
+        return (
+            file_name,
+            script.display_name or Path(file_name).stem,
+            script.icon,
+            RUN_OPERATORS[script.undo],
+            script.run_context,
+        )
+
+    return (
+        file_name,
+        Path(file_name).stem,
+        "NONE",
+        RUN_OPERATORS["PUSH"],
+        "EXEC_DEFAULT",
+    )
 
 
 ########################################################################################
@@ -91,79 +201,106 @@ class Shelf(PropertyGroup):
         update=update_directory,
     )
 
-    enabled_view_3d: BoolProperty(name="3D Viewport", default=True)
-    enabled_image_editor: BoolProperty(name="Image Editor")
-    enabled_uv: BoolProperty(name="UV Editor")
-    enabled_compositornodetree: BoolProperty(name="Compositor")
-    enabled_texturenodetree: BoolProperty(name="Texture Node Editor")
-    enabled_geometrynodetree: BoolProperty(name="Geometry Node Editor")
-    enabled_shadernodetree: BoolProperty(name="Shader Editor")
-    enabled_sequence_editor: BoolProperty(name="Video Sequencer")
-    enabled_clip_editor: BoolProperty(name="Movie Clip Editor")
-    enabled_dopesheet: BoolProperty(name="Dope Sheet")
-    enabled_timeline: BoolProperty(name="Timeline")
-    enabled_fcurves: BoolProperty(name="Graph Editor")
-    enabled_drivers: BoolProperty(name="Drivers")
-    enabled_nla_editor: BoolProperty(name="Nonlinear Animation")
-    enabled_text_editor: BoolProperty(name="Text Editor")
-    enabled_spreadsheet: BoolProperty(name="Spreadsheet")
-
     height: FloatProperty(name="Button Height", default=1.0, min=0.5, soft_max=8.0)
     icon: StringProperty(name="Icon", default="NONE")
     is_available: BoolProperty(name="Is Available")
     name: StringProperty(name="Name")
     scripts: CollectionProperty(type=Script, name="Scripts")
     show_scripts: BoolProperty(name="Show Scripts", default=True)
+    visibility: IntProperty(
+        name="Visibility",
+        description="Bit mask of the areas this shelf is displayed in",
+        default=areas.AREA_BITS["VIEW_3D"],
+        update=update_visibility,
+    )
+
+    # Area toggles ('enabled_*' properties) are generated below the class
 
     def exists(self) -> bool:
         """
-        Checks whether this folder exists and sets 'is_available' flag.
+        Checks whether this folder exists and sets 'is_available' flag. A synced local
+        mirror counts as existing, without touching the source directory. Others are
+        listed on a scan worker under the scan timeout, so the main thread never waits
+        on the file system; directories that time out or are skipped by their circuit
+        breaker count as missing.
 
         Returns:
             - bool: Whether this folder exists at given location
         """
-        if self.directory and Path(self.directory).is_dir():
-            self.is_available = True
-            return True
-
-        self.is_available = False
-        return False
+        self.is_available = bool(self.directory) and (
+            bool(mirror.local_directory(directory=self.directory))
+            or scan.scan_directory(directory=self.script_directory()) is not None
+        )
+        return self.is_available
 
-    def initialize_scripts(self):
+    def apply_scan(self, file_names: List[str] | None):
         """
-        Scan the script directory and initiate a script object for each script found.
+        Store a directory scan result and flag customized scripts that were not found
+        unavailable. Scripts without customizations are not stored in the preferences.
+
+        Parameters:
+            - file_names (list of str | None): Script file names, None if the
+              directory is unavailable
         """
         if TYPE_CHECKING:
-            existing_script: Script
             script: Script
 
-        # Disable all scripts
-        [setattr(script, "is_available", False) for script in self.scripts]
-
         # Check directory
-        if not self.exists():
+        if file_names is None:
+            SCRIPT_FILES.pop(self.directory, None)
             self.is_available = False
-            return
+        else:
+            SCRIPT_FILES[self.directory] = file_names
+            self.is_available = True
+
+        utils.mark_changed()
+
+        # Flag customized scripts
+        available = set(file_names or [])
+        for script in self.scripts:
+            is_available = script.name in available
+            if script.is_available != is_available:
+                script.is_available = is_available
 
-        self.is_available = True
+    def compact_scripts(self) -> int:
+        """
+        Remove stored scripts that are neither customized nor out of their default
+        position, as written by earlier versions for every script found. Only the
+        trailing, alphabetically sorted run of plain scripts can be removed without
+        changing the order.
 
-        # Iterate directory and find python scripts
-        for script_file in sorted(Path(self.directory).iterdir()):
-            if not script_file.suffix == ".py":
-                continue
+        Returns:
+            - int: Amount of removed scripts
+        """
+        if TYPE_CHECKING:
+            script: Script
 
-            # Find existing script
-            script = None
-            for existing_script in self.scripts:
-                if existing_script.name == script_file.name:
-                    script = existing_script
-                    script.is_available = True
+        scripts = list(self.scripts)
+        start = len(scripts)
+        while start and scripts[start - 1].is_default():
+            if start < len(scripts) and scripts[start - 1].name > scripts[start].name:
+                break
+            start -= 1
 
-            # Create a new script
-            if not script:
-                script = self.scripts.add()
-                script.name = script_file.name
-                script.display_name = script_file.stem
+        for i in reversed(range(start, len(scripts))):
+            self.scripts.remove(i)
+
+        return len(scripts) - start
+
+    def initialize_scripts(self):
+        """
+        Scan the script directory and initiate a script object for each script found.
+        Logs the scan start and end, with duration and file count.
+        """
+        events.log(kind="scan_start", shelves=1)
+        with events.timed(kind="scan_end", shelves=1) as event:
+            file_names = scan.scan_shelves(shelves=[self])[0]
+            self.apply_scan(file_names=file_names)
+            event["files"] = len(file_names or [])
+
+        # Hash in the background
+        if bpy.context.preferences.addons[__package__].preferences.use_hashing:
+            hashing.hash_files_later(paths=self.script_paths())
 
     def is_visible(self, context: Context) -> bool:
         """
@@ -175,16 +312,96 @@ class Shelf(PropertyGroup):
         if area_type == "PREFERENCES":
             return True
 
-        # Check for enabled flag
-        attribute_name = f"enabled_{area_type.lower()}"
-        if (
-            self.is_available
-            and hasattr(self, attribute_name)
-            and getattr(self, attribute_name)
-        ):
-            return True
+        # Check for enabled bit
+        return self.is_available and bool(
+            self.visibility & areas.AREA_BITS.get(area_type, 0)
+        )
+
+    def migrate_visibility(self):
+        """
+        Convert the area toggles stored by earlier versions, one boolean per area, into
+        the visibility bit mask and remove them.
+        """
+        if self.get("visibility") is not None:
+            return
+
+        visibility = 0
+        for area_type, bit in areas.AREA_BITS.items():
+            attribute_name = areas.attribute_name(area_type=area_type)
+            enabled = self.get(attribute_name, area_type == "VIEW_3D")
+            if enabled:
+                visibility |= bit
 
-        return False
+            if attribute_name in self:
+                del self[attribute_name]
+
+        self["visibility"] = visibility
+
+    def move_script(self, script: str, index: int) -> bool:
+        """
+        Move a script to a new position.
+
+        Parameters:
+            - script (str): Script file name
+            - index (int): New position
+
+        Returns:
+            - bool: Whether the script was found
+        """
+        file_names = self.script_names()
+        if script not in file_names:
+            return False
+
+        current_index = file_names.index(script)
+        index = max(0, min(index, len(file_names) - 1))
+        file_names.insert(index, file_names.pop(current_index))
+        self.order_scripts(file_names=file_names)
+
+        return True
+
+    def order_scripts(self, file_names: List[str]) -> int:
+        """
+        Apply a new script order in one pass. The given scripts are placed first, all
+        other scripts keep their relative order behind them. Only the shortest leading
+        part of the order is stored; the alphabetically sorted tail of plain scripts is
+        left to the default order and dropped from the stored scripts.
+
+        Parameters:
+            - file_names (list of str): Script file names, in their new order
+
+        Returns:
+            - int: Amount of stored scripts
+        """
+        if TYPE_CHECKING:
+            script: Script
+
+        # Complete the order
+        current_names = self.script_names()
+        available = set(current_names)
+        ordered = list(dict.fromkeys(name for name in file_names if name in available))
+        listed = set(ordered)
+        ordered += [name for name in current_names if name not in listed]
+
+        # Find the sorted tail of plain scripts
+        scripts = {script.name: script for script in self.scripts}
+        start = len(ordered)
+        while start:
+            script = scripts.get(ordered[start - 1])
+            if script and not script.is_default():
+                break
+            if start < len(ordered) and ordered[start - 1] > ordered[start]:
+                break
+            start -= 1
+
+        # Store the leading part only
+        tail = set(ordered[start:])
+        utils.compact_collection(
+            collection=self.scripts,
+            keep=lambda script: script.name not in tail,
+        )
+        self.store_order(file_names=ordered[:start])
+
+        return start
 
     def path_is_in_shelf(self, path: str | Path) -> bool:
         """
@@ -198,36 +415,161 @@ class Shelf(PropertyGroup):
         """
         return self.directory in Path(path).resolve().as_posix()
 
-    def script_exists(self, script: int | str) -> bool:
+    def script_entries(self) -> List[Tuple[str, str, str, str, str]]:
         """
-        Checks whether a script exists and sets its 'is_available' flag.
+        Generate the display & run settings of all available scripts, in shelf order.
+
+        Returns:
+            - list of tuple of str: File name, display name, icon, run operator & its
+              context of each script
+        """
+        scripts = {script.name: script for script in self.scripts}
+        return [
+            script_entry(file_name=file_name, script=scripts.get(file_name))
+            for file_name in self.script_names()
+        ]
+
+    def script_exists(self, script: str) -> bool:
+        """
+        Checks whether a script exists and sets the 'is_available' flag of its stored
+        customizations, if any.
 
         Parameters:
-            - script (int | str): Script index or file name
+            - script (str): Script file name
 
         Returns:
             - bool: Whether this script exists at expected path or not
         """
-        if TYPE_CHECKING:
-            script: Script
+        exists = self.script_path(script=script).exists()
 
-        script = self.scripts[script]
+        stored_script = self.scripts.get(script)
+        if stored_script:
+            stored_script.is_available = exists
 
-        if self.script_path(script=script).exists():
-            script.is_available = True
-            return True
+        return exists
 
-        script.is_available = False
-        return False
+    def script_names(self) -> List[str]:
+        """
+        Get the file names of all available scripts in shelf order: stored scripts
+        first, in stored order, all others alphabetically behind them.
 
-    def script_path(self, script: int | str) -> Path:
+        Returns:
+            - list of str: Script file names
+        """
+        file_names = SCRIPT_FILES.get(self.directory, [])
+        available = set(file_names)
+        ordered = [script.name for script in self.scripts if script.name in available]
+        stored = set(ordered)
+
+        return ordered + [name for name in file_names if name not in stored]
+
+    def script_override(self, script: str) -> Script:
+        """
+        Get the stored customizations of a script, storing them first if necessary.
+
+        Parameters:
+            - script (str): Script file name
+
+        Returns:
+            - Script
+        """
+        stored_script = self.scripts.get(script)
+        if stored_script:
+            return stored_script
+
+        new_script = self.scripts.add()
+        new_script.name = script
+        new_script.display_name = Path(script).stem
+        new_script.is_available = script in SCRIPT_FILES.get(self.directory, [])
+
+        return new_script
+
+    def script_directory(self) -> Path:
+        """
+        Get the directory scripts are scanned & run from. This is the local mirror, if
+        mirroring is enabled and synced, else the shelf directory itself.
+
+        Returns:
+            - Path
+        """
+        return mirror.local_directory(directory=self.directory) or Path(self.directory)
+
+    def script_paths(self) -> List[str]:
+        """
+        Generate the paths of all available scripts.
+
+        Returns:
+            - list of str: Posix script paths
+        """
+        if not self.is_available:
+            return []
+
+        directory = self.script_directory()
+        return [(directory / name).as_posix() for name in self.script_names()]
+
+    def script_path(self, script: str, source: bool = False) -> Path:
         """
         Generate a path object for given script.
 
         Parameters:
-            - script (int | str): Script index or file name
+            - script (str): Script file name
+            - source (bool): Point to the shelf directory, even if mirrored
 
         Returns:
             - Path
         """
-        return Path(self.directory, self.scripts[script].name)
+        directory = Path(self.directory) if source else self.script_directory()
+        return directory / script
+
+    def store_order(self, file_names: List[str]):
+        """
+        Store scripts in the given order, in front of all other stored scripts.
+
+        Parameters:
+            - file_names (list of str): Script file names
+        """
+        for file_name in file_names:
+            self.script_override(script=file_name)
+
+        utils.reorder_collection(
+            collection=self.scripts,
+            order=[self.scripts.find(file_name) for file_name in file_names],
+        )
+
+
+########################################################################################
+# Generated area toggles
+########################################################################################
+
+
+def area_toggle(area_type: str, name: str) -> BoolProperty:
+    """
+    Create a boolean property reading & writing a single bit of 'Shelf.visibility'.
+
+    Parameters:
+        - area_type (str): 'area.ui_type'
+        - name (str): Display name
+
+    Returns:
+        - BoolProperty
+    """
+    bit = areas.AREA_BITS[area_type]
+
+    def get_enabled(shelf: Shelf) -> bool:
+        return bool(shelf.visibility & bit)
+
+    def set_enabled(shelf: Shelf, value: bool):
+        shelf.visibility = shelf.visibility | bit if value else shelf.visibility & ~bit
+
+    return BoolProperty(name=name, get=get_enabled, set=set_enabled)
+
+
+Shelf.__annotations__.update(
+    {
+        areas.attribute_name(area_type=area[0]): area_toggle(
+            area_type=area[0],
+            name=area[1],
+        )
+        for area in areas.AREAS
+    }
+)
@@ -0,0 +1,204 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Any, Coroutine, Dict, List, Tuple
+
+import asyncio
+import time
+import traceback
+from pathlib import Path
+
+import bpy
+
+from . import events
+
+
+########################################################################################
+# Statics
+########################################################################################
+
+
+# Seconds between two iterations of the event loop
+PUMP_INTERVAL = 0.02
+
+# Seconds between two redraws showing the running time of tasks
+REDRAW_INTERVAL = 1.0
+
+# Event loop running all async scripts, created on first use, & the last redraw time
+LOOP: Dict[str, Any] = {"loop": None, "redraw": 0.0}
+
+# Running async scripts, keyed by posix script path; each value holds
+# (task, start time)
+TASKS: Dict[str, Tuple[asyncio.Task, float]] = {}
+
+
+########################################################################################
+# Event loop
+########################################################################################
+
+
+def event_loop() -> asyncio.AbstractEventLoop:
+    """
+    Get the event loop for async scripts. It is never run continuously, but pumped one
+    iteration at a time by a timer on the main thread.
+
+    Returns:
+        - AbstractEventLoop
+    """
+    if LOOP["loop"] is None or LOOP["loop"].is_closed():
+        LOOP["loop"] = asyncio.new_event_loop()
+
+    return LOOP["loop"]
+
+
+def pump() -> float | None:
+    """
+    Run a single iteration of the event loop: all callbacks that are ready & all I/O
+    that is due, without waiting. Stops once no task is left.
+
+    Returns:
+        - float | None: Seconds until the next iteration, None when done
+    """
+    loop = event_loop()
+    loop.call_soon(loop.stop)
+    loop.run_forever()
+
+    # Show the running time
+    now = time.monotonic()
+    if now - LOOP["redraw"] > REDRAW_INTERVAL:
+        LOOP["redraw"] = now
+        redraw()
+
+    return PUMP_INTERVAL if TASKS else None
+
+
+def redraw():
+    """
+    Redraw all areas, so task status changes show up in the shelf panels.
+    """
+    for window in bpy.context.window_manager.windows:
+        for area in window.screen.areas:
+            area.tag_redraw()
+
+
+########################################################################################
+# Tasks
+########################################################################################
+
+
+def start(path: str | Path, coroutine: Coroutine):
+    """
+    Run a script's coroutine on the event loop. Its result & errors are logged once it
+    is done.
+
+    Parameters:
+        - path (str | Path): Script file path
+        - coroutine (Coroutine): Returned by the script's 'main' function
+    """
+    key = Path(path).as_posix()
+    started = time.monotonic()
+    task = event_loop().create_task(coroutine)
+    TASKS[key] = (task, started)
+
+    def done(task: asyncio.Task):
+        TASKS.pop(key, None)
+        event = {"path": key, "duration": time.monotonic() - started}
+        if task.cancelled():
+            event["cancelled"] = True
+        elif task.exception():
+            error = task.exception()
+            event["error"] = f"{type(error).__name__}: {error}"
+            traceback.print_exception(type(error), error, error.__traceback__)
+
+        events.log(kind="run_async", **event)
+        redraw()
+
+    task.add_done_callback(done)
+    events.log(kind="run_async_start", path=key)
+
+    if not bpy.app.timers.is_registered(pump):
+        bpy.app.timers.register(pump, first_interval=0.0, persistent=True)
+
+
+def is_running(path: str | Path) -> bool:
+    """
+    Parameters:
+        - path (str | Path): Script file path
+
+    Returns:
+        - bool: Whether the script's coroutine is still running
+    """
+    return Path(path).as_posix() in TASKS
+
+
+def wait(path: str | Path):
+    """
+    Run the event loop until a script's coroutine is done, for background Blender where
+    timers never fire.
+
+    Parameters:
+        - path (str | Path): Script file path
+
+    Raises:
+        - Exception: Raised by the script's coroutine
+    """
+    running = TASKS.get(Path(path).as_posix())
+    if running:
+        event_loop().run_until_complete(running[0])
+
+
+def cancel(path: str | Path) -> bool:
+    """
+    Request cancellation of a running script. The script's coroutine receives a
+    'CancelledError' at its next 'await'.
+
+    Parameters:
+        - path (str | Path): Script file path
+
+    Returns:
+        - bool: Whether the script was running
+    """
+    running = TASKS.get(Path(path).as_posix())
+    if not running:
+        return False
+
+    running[0].cancel()
+    return True
+
+
+def running() -> List[Tuple[str, float]]:
+    """
+    Get all running scripts.
+
+    Returns:
+        - list of tuple: Posix script path & seconds running, oldest first
+    """
+    now = time.monotonic()
+    return [(key, now - started) for key, (_, started) in TASKS.items()]
+
+
+def stop():
+    """
+    Cancel all running scripts, let them handle the cancellation, then close the
+    event loop and remove the timer.
+    """
+    if bpy.app.timers.is_registered(pump):
+        bpy.app.timers.unregister(pump)
+
+    loop = LOOP["loop"]
+    if loop is None or loop.is_closed():
+        return
+
+    for task, _ in list(TASKS.values()):
+        task.cancel()
+
+    if TASKS:
+        loop.run_until_complete(
+            asyncio.gather(
+                *(task for task, _ in TASKS.values()),
+                return_exceptions=True,
+            )
+        )
+
+    loop.close()
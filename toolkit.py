@@ -0,0 +1,304 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Any, Callable, Dict, Generator, Iterable, List, Set
+
+import multiprocessing
+import os
+import queue
+import threading
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from pathlib import Path
+
+import bpy
+
+from . import sandbox
+
+
+# Helpers for shelf scripts; available as 'shelfmade' within every script run from a
+# shelf, without importing anything:
+#   meshes = shelfmade.run_parallel(parse_file, file_paths)
+#   yield from shelfmade.wait_steps(shelfmade.run_processes(solve, chunks))
+
+
+########################################################################################
+# Statics
+########################################################################################
+
+
+# Maximum amount of worker threads for shelf scripts
+MAX_WORKERS = min(32, (os.cpu_count() or 1) + 4)
+
+# Seconds between two checks for calls queued for the main thread, while work is
+# running & while idle
+DRAIN_INTERVAL = 0.02
+IDLE_DRAIN_INTERVAL = 0.2
+
+# Executors shared by all shelf scripts, created on first use: threads & processes
+EXECUTOR: Dict[str, Executor | None] = {"executor": None, "processes": None}
+
+# Submitted work that has not finished yet
+ACTIVE: Set[Future] = set()
+
+# Calls waiting to be run on the main thread: function, arguments & future
+MAIN_THREAD_CALLS: queue.SimpleQueue = queue.SimpleQueue()
+
+
+########################################################################################
+# Main thread
+########################################################################################
+
+
+def is_main_thread() -> bool:
+    """
+    Returns:
+        - bool: Whether the calling thread is Blender's main thread
+    """
+    return threading.current_thread() is threading.main_thread()
+
+
+def call_on_main_thread(function: Callable, *args, **kwargs) -> Future:
+    """
+    Run a function on Blender's main thread, where it may safely use bpy. Called from
+    the main thread, the function runs right away; called from any other thread, it is
+    queued and runs with the next tick of the drain timer, which runs as long as the
+    add-on is registered, or while 'run_parallel' waits on the main thread. Worker
+    threads never touch bpy timers themselves.
+
+    Parameters:
+        - function (callable)
+        - args, kwargs: Passed on to the function
+
+    Returns:
+        - Future: Resolves to the function's result
+    """
+    future = Future()
+    if is_main_thread():
+        run_call(function=function, args=args, kwargs=kwargs, future=future)
+    else:
+        MAIN_THREAD_CALLS.put((function, args, kwargs, future))
+
+    return future
+
+
+def run_call(function: Callable, args: tuple, kwargs: dict, future: Future):
+    """
+    Run a function and set its result or exception on a future.
+
+    Parameters:
+        - function (callable)
+        - args (tuple): Positional arguments
+        - kwargs (dict): Keyword arguments
+        - future (Future)
+    """
+    if not future.set_running_or_notify_cancel():
+        return
+
+    try:
+        future.set_result(function(*args, **kwargs))
+    except BaseException as e:
+        future.set_exception(e)
+
+
+def drain() -> int:
+    """
+    Run all calls queued for the main thread.
+
+    Returns:
+        - int: Amount of calls run
+    """
+    calls = 0
+    while True:
+        try:
+            function, args, kwargs, future = MAIN_THREAD_CALLS.get_nowait()
+        except queue.Empty:
+            return calls
+
+        run_call(function=function, args=args, kwargs=kwargs, future=future)
+        calls += 1
+
+
+def drain_timer() -> float:
+    """
+    Run queued main thread calls, checking more often while submitted work is running.
+
+    Returns:
+        - float: Seconds until the next check
+    """
+    calls = drain()
+    return DRAIN_INTERVAL if calls or ACTIVE else IDLE_DRAIN_INTERVAL
+
+
+def start():
+    """
+    Start serving main thread calls queued by other threads. Registered from the main
+    thread, as bpy timers must not be registered from others.
+    """
+    if not bpy.app.timers.is_registered(drain_timer):
+        bpy.app.timers.register(
+            drain_timer,
+            first_interval=IDLE_DRAIN_INTERVAL,
+            persistent=True,
+        )
+
+
+########################################################################################
+# Worker threads
+########################################################################################
+
+
+def executor() -> ThreadPoolExecutor:
+    """
+    Get the executor shared by all shelf scripts, creating it on first use.
+
+    Returns:
+        - ThreadPoolExecutor
+    """
+    if EXECUTOR["executor"] is None:
+        EXECUTOR["executor"] = ThreadPoolExecutor(
+            max_workers=MAX_WORKERS,
+            thread_name_prefix="shelfmade_script",
+        )
+
+    return EXECUTOR["executor"]
+
+
+def submit(function: Callable, *args, **kwargs) -> Future:
+    """
+    Run a function on a worker thread. The function must not touch bpy; use
+    'call_on_main_thread' from within it instead. Async scripts may await the result
+    with 'asyncio.wrap_future'.
+
+    Parameters:
+        - function (callable)
+        - args, kwargs: Passed on to the function
+
+    Returns:
+        - Future: Resolves to the function's result
+    """
+    future = executor().submit(function, *args, **kwargs)
+    ACTIVE.add(future)
+    future.add_done_callback(ACTIVE.discard)
+
+    return future
+
+
+def run_parallel(function: Callable, items: Iterable[Any]) -> List[Any]:
+    """
+    Call a function for each item on worker threads and wait for all results. While
+    waiting on the main thread, calls queued by the function through
+    'call_on_main_thread' are run, so they cannot dead-lock; other threads only wait.
+    The first exception raised by the function is passed on.
+
+    Parameters:
+        - function (callable): Takes a single item; must not touch bpy directly
+        - items (iterable): Function arguments
+
+    Returns:
+        - list: Results, in the order of the items
+    """
+    futures = [submit(function, item) for item in items]
+    if not is_main_thread():
+        wait(futures)
+        return [future.result() for future in futures]
+
+    pending = set(futures)
+    while pending:
+        drain()
+        _, pending = wait(pending, timeout=DRAIN_INTERVAL, return_when=FIRST_COMPLETED)
+
+    drain()
+    return [future.result() for future in futures]
+
+
+def process_executor() -> ProcessPoolExecutor:
+    """
+    Get the process pool shared by all shelf scripts, creating it on first use. Its
+    processes are spawned rather than forked from Blender.
+
+    Returns:
+        - ProcessPoolExecutor
+    """
+    if EXECUTOR["processes"] is None:
+        EXECUTOR["processes"] = ProcessPoolExecutor(
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+
+    return EXECUTOR["processes"]
+
+
+def run_processes(function: Callable, items: Iterable[Any]) -> List[Future]:
+    """
+    Start calling a function for each item in separate processes, for pure data work
+    that is bound by the CPU. Returns right away; stepped scripts wait for the results
+    with 'wait_steps', so Blender stays responsive. Items & results are pickled, so they
+    must not be Blender data. The function must be importable by name, e.g. from a
+    module next to the script, and must not use bpy.
+
+    Parameters:
+        - function (callable): Takes a single item
+        - items (iterable): Function arguments
+
+    Returns:
+        - list of Future: Resolve to the results, in the order of the items
+    """
+    return [process_executor().submit(function, item) for item in items]
+
+
+def wait_steps(futures: List[Future]) -> Generator:
+    """
+    Wait for futures within a stepped script, briefly per step, yielding the share of
+    futures done after each.
+
+    Parameters:
+        - futures (list of Future)
+
+    Returns:
+        - Generator: Yields the share of done futures between 0 and 1
+    """
+    pending = set(futures)
+    while pending:
+        _, pending = wait(pending, timeout=DRAIN_INTERVAL, return_when=FIRST_COMPLETED)
+        yield 1 - len(pending) / len(futures)
+
+
+def isolated_results(path: str) -> Dict[str, Any] | None:
+    """
+    Get the results of a script's last isolated run. Arrays & bytes are views into the
+    mapped result file; copy them to keep them beyond the script's next isolated run.
+
+    Parameters:
+        - path (str): Script file path
+
+    Returns:
+        - dict | None: Result names & values, None if the script never ran isolated
+    """
+    return sandbox.LAST_RESULTS.get(Path(path).as_posix())
+
+
+def shutdown():
+    """
+    Cancel all queued work & main thread calls and shut the executors down without
+    waiting for running work.
+    """
+    if bpy.app.timers.is_registered(drain_timer):
+        bpy.app.timers.unregister(drain_timer)
+
+    for key, pool in EXECUTOR.items():
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+            EXECUTOR[key] = None
+
+    while True:
+        try:
+            MAIN_THREAD_CALLS.get_nowait()[3].cancel()
+        except queue.Empty:
+            break
@@ -0,0 +1,257 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Dict, List, Tuple
+
+import json
+import time
+from pathlib import Path
+
+import bpy
+
+from . import utils
+
+
+# The usage log is append-only; each line holds a run count, the last run's timestamp
+# & the posix script path, separated by tabs:
+#   1	1729339200.0	/studio/shelves/modeling/cleanup.py
+# Runs are appended in batches; the log is compacted to one line per script on load.
+
+
+########################################################################################
+# Statics
+########################################################################################
+
+
+# Run counts, keyed by posix script path
+RUN_COUNTS: Dict[str, int] = {}
+
+# Timestamps of the last runs, keyed by posix script path
+LAST_RUNS: Dict[str, float] = {}
+
+# Runs not yet written to the usage log: timestamp & posix script path
+PENDING: List[Tuple[float, str]] = []
+
+# Seconds between two writes of pending runs
+FLUSH_INTERVAL = 30.0
+
+# Log lines per script at which the log is compacted on load
+COMPACT_RATIO = 4
+
+
+########################################################################################
+# Usage log
+########################################################################################
+
+
+def history_path() -> Path:
+    """
+    Get the location of the usage log within the user config directory.
+
+    Returns:
+        - Path
+    """
+    config = bpy.utils.user_resource("CONFIG", path="shelfmade", create=True)
+    return Path(config, "usage.log")
+
+
+def legacy_path() -> Path:
+    """
+    Get the location of the JSON run count history written by earlier versions.
+
+    Returns:
+        - Path
+    """
+    return history_path().with_name("usage.json")
+
+
+def load():
+    """
+    Read the usage log from disk, replacing the current history. Run counts of earlier
+    versions are imported once. Logs with many lines per script are compacted.
+    """
+    RUN_COUNTS.clear()
+    LAST_RUNS.clear()
+    PENDING.clear()
+
+    # Import the earlier history
+    path = history_path()
+    legacy = legacy_path()
+    if legacy.is_file() and not path.is_file():
+        try:
+            RUN_COUNTS.update(json.loads(legacy.read_text(encoding="utf-8")))
+        except (OSError, ValueError):
+            print(f"Could not read usage history {legacy}")
+            return
+
+        LAST_RUNS.update({key: 0.0 for key in RUN_COUNTS})
+        if compact():
+            legacy.unlink()
+        return
+
+    if not path.is_file():
+        return
+
+    # Sum up all lines
+    lines = 0
+    try:
+        with path.open(encoding="utf-8") as log:
+            for line in log:
+                try:
+                    count, timestamp, key = line.rstrip("\n").split("\t", 2)
+                    RUN_COUNTS[key] = RUN_COUNTS.get(key, 0) + int(count)
+                    LAST_RUNS[key] = max(LAST_RUNS.get(key, 0.0), float(timestamp))
+                    lines += 1
+                except ValueError:
+                    continue
+
+    except OSError:
+        print(f"Could not read usage log {path}")
+        return
+
+    if lines > COMPACT_RATIO * len(RUN_COUNTS):
+        compact()
+
+
+def compact() -> bool:
+    """
+    Replace the usage log with a single line per script.
+
+    Returns:
+        - bool: Whether the log was written
+    """
+    path = history_path()
+    temp_path = path.with_suffix(".tmp")
+    try:
+        temp_path.write_text(
+            "".join(
+                f"{count}\t{LAST_RUNS.get(key, 0.0)}\t{key}\n"
+                for key, count in RUN_COUNTS.items()
+            ),
+            encoding="utf-8",
+        )
+        temp_path.replace(path)
+    except OSError:
+        print("Could not compact usage log")
+        return False
+
+    return True
+
+
+def flush():
+    """
+    Append all pending runs to the usage log.
+    """
+    if not PENDING:
+        return
+
+    try:
+        with history_path().open("a", encoding="utf-8") as log:
+            log.writelines(f"1\t{timestamp}\t{key}\n" for timestamp, key in PENDING)
+    except OSError:
+        print("Could not write usage log")
+        return
+
+    PENDING.clear()
+
+
+def flush_timer() -> float:
+    """
+    Periodically append pending runs to the usage log.
+
+    Returns:
+        - float: Seconds until the next flush
+    """
+    flush()
+    return FLUSH_INTERVAL
+
+
+def start():
+    """
+    Start writing pending runs periodically.
+    """
+    if not bpy.app.timers.is_registered(flush_timer):
+        bpy.app.timers.register(
+            flush_timer,
+            first_interval=FLUSH_INTERVAL,
+            persistent=True,
+        )
+
+
+def stop():
+    """
+    Write all pending runs and remove the timer.
+    """
+    if bpy.app.timers.is_registered(flush_timer):
+        bpy.app.timers.unregister(flush_timer)
+
+    flush()
+
+
+########################################################################################
+# Usage data
+########################################################################################
+
+
+def record_run(path: str | Path):
+    """
+    Increase the run count of a script and set its last run time. The run is written
+    with the next flush; the Frequent shelf is ranked again.
+
+    Parameters:
+        - path (str | Path): Script file path
+    """
+    key = Path(path).as_posix()
+    timestamp = round(time.time(), 3)
+    RUN_COUNTS[key] = RUN_COUNTS.get(key, 0) + 1
+    LAST_RUNS[key] = timestamp
+    PENDING.append((timestamp, key))
+    utils.mark_changed()
+
+
+def run_count(path: str | Path) -> int:
+    """
+    Get the amount of times a script was run.
+
+    Parameters:
+        - path (str | Path): Script file path
+
+    Returns:
+        - int
+    """
+    return RUN_COUNTS.get(Path(path).as_posix(), 0)
+
+
+def last_run(path: str | Path) -> float:
+    """
+    Get the time a script was last run.
+
+    Parameters:
+        - path (str | Path): Script file path
+
+    Returns:
+        - float: Seconds since the epoch, 0 if never run
+    """
+    return LAST_RUNS.get(Path(path).as_posix(), 0.0)
+
+
+def most_used(limit: int) -> List[str]:
+    """
+    Get the most frequently run scripts that still exist.
+
+    Parameters:
+        - limit (int): Maximum amount of scripts
+
+    Returns:
+        - list of str: Script paths, most used first
+    """
+    paths = []
+    for path in sorted(RUN_COUNTS, key=RUN_COUNTS.get, reverse=True):
+        if len(paths) >= limit:
+            break
+
+        if Path(path).is_file():
+            paths.append(path)
+
+    return paths
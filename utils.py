@@ -2,18 +2,85 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from typing import List, Literal
-    from bpy.types import Area, Context, Text
+    from typing import Any, Callable, Dict, List, Literal
+    from bpy.types import Area, Context, PropertyGroup, Text, bpy_prop_collection
 
 import bpy
 from pathlib import Path
 
+from . import events
+
+
+########################################################################################
+# Statics
+########################################################################################
+
+
+# Batch nesting depth & updates deferred until the outermost batch ends
+BATCH = {"depth": 0, "save": False, "scan": False, "panels": False}
+
+# Count of changes to shelf settings, scans & script runs; draw caches are rebuilt once
+# it differs from the count they were built at
+CHANGES: Dict[str, int] = {"count": 0}
+
 
 ########################################################################################
 # Utilities
 ########################################################################################
 
 
+def compact_collection(
+    collection: bpy_prop_collection,
+    keep: Callable[[PropertyGroup], bool],
+) -> int:
+    """
+    Remove all items of a collection not to keep in a single pass: the kept items are
+    copied, the collection is cleared and rebuilt in the same order. Stored values are
+    copied as raw ID properties, including nested collections & custom properties, so no
+    update functions are triggered. Untouched if all items are kept.
+
+    Parameters:
+        - collection (bpy_prop_collection)
+        - keep (callable): Takes an item, returns whether to keep it
+
+    Returns:
+        - int: Amount of removed items
+    """
+    kept_items = [id_properties(data=item) for item in collection if keep(item)]
+    removed = len(collection) - len(kept_items)
+    if not removed:
+        return 0
+
+    collection.clear()
+    for properties in kept_items:
+        item = collection.add()
+        for key, value in properties.items():
+            item[key] = value
+
+    return removed
+
+
+def defer(update: str) -> bool:
+    """
+    Mark an update as pending if a batch is open, so it runs only once when the batch
+    ends.
+
+    Parameters:
+        - update (str): Deferred update
+            - save: Save user preferences
+            - scan: Re-scan all shelves
+            - panels: Register shelf panels
+
+    Returns:
+        - bool: Whether the update was deferred and must be skipped now
+    """
+    if not BATCH["depth"]:
+        return False
+
+    BATCH[update] = True
+    return True
+
+
 def find_area_by_type(context: Context, type: str) -> Area | None:
     """
     Finds an area that fits given area type.
@@ -59,6 +126,30 @@ def find_or_create_area(
     return split_area(area=context.area, type=type, direction=direction, factor=factor)
 
 
+def id_properties(data: PropertyGroup) -> Dict[str, Any]:
+    """
+    Copy all stored values of a property group into plain Python objects.
+
+    Parameters:
+        - data (PropertyGroup)
+
+    Returns:
+        - dict: Property names & values; nested groups as dictionaries, collections as
+          lists of dictionaries
+    """
+
+    def to_python(value: Any) -> Any:
+        if hasattr(value, "to_dict"):
+            return value.to_dict()
+        if hasattr(value, "to_list"):
+            return value.to_list()
+        if isinstance(value, list):
+            return [to_python(value=item) for item in value]
+        return value
+
+    return {key: to_python(value=data[key]) for key in data.keys()}
+
+
 def open_script_file(filepath: str | Path) -> Text:
     """
     Open a file in Blender's text editor.
@@ -81,6 +172,30 @@ def open_script_file(filepath: str | Path) -> Text:
             return text
 
 
+def reorder_collection(collection: bpy_prop_collection, order: List[int]) -> int:
+    """
+    Move the items of a collection into a new order, skipping items that are already in
+    place. Items not listed keep their relative order behind the listed ones.
+
+    Parameters:
+        - collection (bpy_prop_collection)
+        - order (list of int): Current indices of the items, in their new order
+
+    Returns:
+        - int: Amount of moved items
+    """
+    positions = list(range(len(collection)))
+    moves = 0
+    for target_index, index in enumerate(order):
+        current_index = positions.index(index)
+        if current_index != target_index:
+            collection.move(current_index, target_index)
+            positions.insert(target_index, positions.pop(current_index))
+            moves += 1
+
+    return moves
+
+
 def same_paths(paths: List[str | Path]) -> bool:
     """
     Checks whether a list of paths points to the same file/folder.
@@ -114,6 +229,26 @@ def same_paths(paths: List[str | Path]) -> bool:
     return True
 
 
+def mark_changed():
+    """
+    Count a change to shelf settings, scans or script runs, so draw caches are rebuilt.
+    """
+    CHANGES["count"] += 1
+
+
+def save_userpref():
+    """
+    Save the user preferences and log the duration. Deferred while a batch is open.
+    Settings changed, so draw caches are rebuilt.
+    """
+    mark_changed()
+    if defer(update="save"):
+        return
+
+    with events.timed(kind="prefs_save"):
+        bpy.ops.wm.save_userpref()
+
+
 def split_area(
     area: Area,
     type: str,